@@ -453,7 +453,9 @@ async def send_verification_code(
 
     # Send email
     await email_service.send_verification_code(
-        email=request.email, code=code, verification_type="registration"
+        email=request.email,
+        code=EmailVerification.format_code(code),
+        verification_type="registration",
     )
 
     logger.info(f"Verification code sent to {request.email}")
@@ -483,7 +485,7 @@ async def verify_email(
         db.query(EmailVerification)
         .filter(
             EmailVerification.email == request.email,
-            EmailVerification.code == request.code,
+            EmailVerification.code == int(request.code),
             EmailVerification.verification_type == "registration",
             EmailVerification.is_used == False,
         )
@@ -563,7 +565,9 @@ async def request_email_change(
 
     # Send email to NEW address
     await email_service.send_verification_code(
-        email=request.new_email, code=code, verification_type="email_change"
+        email=request.new_email,
+        code=EmailVerification.format_code(code),
+        verification_type="email_change",
     )
 
     logger.info(
@@ -598,7 +602,7 @@ async def confirm_email_change(
         .filter(
             EmailVerification.user_id == current_user.id,
             EmailVerification.email == request.new_email,
-            EmailVerification.code == request.code,
+            EmailVerification.code == int(request.code),
             EmailVerification.verification_type == "email_change",
             EmailVerification.is_used == False,
         )
@@ -12,8 +12,9 @@ from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field, field_validator
-from sqlalchemy import and_, desc, func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, delete, desc, func, literal_column
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, raiseload
 
 from ..database import get_db
 from ..models import Comment, CommentVote, User, Vulnerability
@@ -192,6 +193,8 @@ async def create_comment(
         content=comment_data.content,
         cve_id=cve_id,
         user_id=current_user.id,
+        author_username=current_user.username,
+        author_role=current_user.role.value,
         parent_id=comment_data.parent_id,
         created_at=datetime.now(timezone.utc),
         updated_at=datetime.now(timezone.utc),
@@ -205,9 +208,6 @@ async def create_comment(
         f"User {current_user.username} created comment {new_comment.id} on CVE {cve_id}"
     )
 
-    # Load user relationship
-    db.refresh(new_comment, ["user"])
-
     # Handle notifications
     # Notify parent comment author if this is a reply
     if comment_data.parent_id:
@@ -230,9 +230,9 @@ async def create_comment(
         upvotes=new_comment.upvotes,
         downvotes=new_comment.downvotes,
         user=UserInfo(
-            id=new_comment.user.id,
-            username=new_comment.user.username,
-            role=new_comment.user.role.value,
+            id=new_comment.user_id,
+            username=new_comment.author_username,
+            role=new_comment.author_role,
         ),
         reply_count=0,
         user_vote=None,
@@ -277,7 +277,7 @@ async def get_comments(
 
     # Apply sorting
     if sort_by == "upvotes":
-        sort_column = Comment.upvotes - Comment.downvotes
+        sort_column = Comment.score
     else:
         sort_column = Comment.created_at
 
@@ -292,7 +292,7 @@ async def get_comments(
     # Apply pagination
     offset = (page - 1) * page_size
     comments = (
-        query.options(joinedload(Comment.user)).offset(offset).limit(page_size).all()
+        query.options(raiseload(Comment.user)).offset(offset).limit(page_size).all()
     )
 
     # Get reply counts for each comment
@@ -338,9 +338,9 @@ async def get_comments(
                 upvotes=comment.upvotes,
                 downvotes=comment.downvotes,
                 user=UserInfo(
-                    id=comment.user.id,
-                    username=comment.user.username,
-                    role=comment.user.role.value,
+                    id=comment.user_id,
+                    username=comment.author_username,
+                    role=comment.author_role,
                 ),
                 reply_count=reply_counts.get(comment.id, 0),
                 user_vote=user_votes.get(comment.id),
@@ -388,7 +388,6 @@ async def update_comment(
     comment.is_edited = True
 
     db.commit()
-    db.refresh(comment, ["user"])
 
     logger.info(f"User {current_user.username} updated comment {comment_id}")
 
@@ -422,9 +421,9 @@ async def update_comment(
         upvotes=comment.upvotes,
         downvotes=comment.downvotes,
         user=UserInfo(
-            id=comment.user.id,
-            username=comment.user.username,
-            role=comment.user.role.value,
+            id=comment.user_id,
+            username=comment.author_username,
+            role=comment.author_role,
         ),
         reply_count=reply_count,
         user_vote=user_vote.vote_type if user_vote else None,
@@ -487,82 +486,48 @@ async def vote_comment(
             status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found"
         )
 
-    # Check if user already voted
-    existing_vote = (
-        db.query(CommentVote)
-        .filter(
-            CommentVote.comment_id == comment_id, CommentVote.user_id == current_user.id
+    # Voting the same type again removes the vote
+    removed = db.execute(
+        delete(CommentVote).where(
+            CommentVote.comment_id == comment_id,
+            CommentVote.user_id == current_user.id,
+            CommentVote.vote_type == vote_data.vote_type,
         )
-        .first()
-    )
-
-    if existing_vote:
-        # If same vote type, remove the vote
-        if existing_vote.vote_type == vote_data.vote_type:
-            # Remove vote
-            if existing_vote.vote_type == 1:
-                comment.upvotes = max(0, comment.upvotes - 1)
-            else:
-                comment.downvotes = max(0, comment.downvotes - 1)
-
-            db.delete(existing_vote)
-            db.commit()
-            db.refresh(comment, ["user"])
-
-            logger.info(
-                f"User {current_user.username} removed vote from comment {comment_id}"
-            )
+    ).rowcount
 
-            user_vote = None
-        else:
-            # Change vote
-            old_vote = existing_vote.vote_type
-            existing_vote.vote_type = vote_data.vote_type
-            existing_vote.updated_at = datetime.now(timezone.utc)
-
-            # Update counts
-            if old_vote == 1:
-                comment.upvotes = max(0, comment.upvotes - 1)
-                comment.downvotes += 1
-            else:
-                comment.downvotes = max(0, comment.downvotes - 1)
-                comment.upvotes += 1
-
-            db.commit()
-            db.refresh(comment, ["user"])
-
-            logger.info(
-                f"User {current_user.username} changed vote on comment {comment_id}"
-            )
+    created = False
+    if removed:
+        logger.info(
+            f"User {current_user.username} removed vote from comment {comment_id}"
+        )
 
-            user_vote = vote_data.vote_type
+        user_vote = None
     else:
-        # Create new vote
-        new_vote = CommentVote(
+        # Create or change the vote in one statement; xmax is 0 only for
+        # freshly inserted rows
+        stmt = insert(CommentVote).values(
             comment_id=comment_id,
             user_id=current_user.id,
             vote_type=vote_data.vote_type,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
         )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_comment_votes",
+            set_={"vote_type": stmt.excluded.vote_type, "updated_at": func.now()},
+        ).returning(literal_column("xmax = 0"))
+        created = db.execute(stmt).scalar()
 
-        # Update counts
-        if vote_data.vote_type == 1:
-            comment.upvotes += 1
-        else:
-            comment.downvotes += 1
+        logger.info(f"User {current_user.username} voted on comment {comment_id}")
 
-        db.add(new_vote)
-        db.commit()
-        db.refresh(comment, ["user"])
+        user_vote = vote_data.vote_type
 
-        logger.info(f"User {current_user.username} voted on comment {comment_id}")
+    # Counts are maintained by the comment_votes trigger
+    db.commit()
+    db.refresh(comment)
 
+    if created:
         # Create notification for vote milestones
         create_vote_notification(db, comment, current_user, vote_data.vote_type)
 
-        user_vote = vote_data.vote_type
-
     # Get reply count
     reply_count = (
         db.query(func.count(Comment.id))
@@ -584,9 +549,9 @@ async def vote_comment(
         upvotes=comment.upvotes,
         downvotes=comment.downvotes,
         user=UserInfo(
-            id=comment.user.id,
-            username=comment.user.username,
-            role=comment.user.role.value,
+            id=comment.user_id,
+            username=comment.author_username,
+            role=comment.author_role,
         ),
         reply_count=reply_count,
         user_vote=user_vote,
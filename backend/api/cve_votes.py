@@ -3,12 +3,12 @@ CVE Voting API endpoints.
 """
 
 import logging
-from datetime import datetime, timezone
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field, field_validator
-from sqlalchemy import desc, func
+from sqlalchemy import delete, desc, func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from ..database import get_db
@@ -76,73 +76,40 @@ async def vote_cve(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"CVE {cve_id} not found"
         )
 
-    # Check if user already voted
-    existing_vote = (
-        db.query(CVEVote)
-        .filter(CVEVote.cve_id == cve_id, CVEVote.user_id == current_user.id)
-        .first()
-    )
+    # Voting the same type again removes the vote
+    removed = db.execute(
+        delete(CVEVote).where(
+            CVEVote.cve_id == cve_id,
+            CVEVote.user_id == current_user.id,
+            CVEVote.vote_type == vote_data.vote_type,
+        )
+    ).rowcount
+
+    if removed:
+        logger.info(f"User {current_user.username} removed vote from CVE {cve_id}")
 
-    if existing_vote:
-        # If same vote type, remove the vote
-        if existing_vote.vote_type == vote_data.vote_type:
-            # Remove vote
-            if existing_vote.vote_type == 1:
-                vulnerability.upvotes = max(0, vulnerability.upvotes - 1)
-            else:
-                vulnerability.downvotes = max(0, vulnerability.downvotes - 1)
-
-            db.delete(existing_vote)
-            db.commit()
-            db.refresh(vulnerability)
-
-            logger.info(f"User {current_user.username} removed vote from CVE {cve_id}")
-
-            user_vote = None
-        else:
-            # Change vote
-            old_vote = existing_vote.vote_type
-            existing_vote.vote_type = vote_data.vote_type
-            existing_vote.updated_at = datetime.now(timezone.utc)
-
-            # Update counts
-            if old_vote == 1:
-                vulnerability.upvotes = max(0, vulnerability.upvotes - 1)
-                vulnerability.downvotes += 1
-            else:
-                vulnerability.downvotes = max(0, vulnerability.downvotes - 1)
-                vulnerability.upvotes += 1
-
-            db.commit()
-            db.refresh(vulnerability)
-
-            logger.info(f"User {current_user.username} changed vote on CVE {cve_id}")
-
-            user_vote = vote_data.vote_type
+        user_vote = None
     else:
-        # Create new vote
-        new_vote = CVEVote(
+        # Create or change the vote in one statement
+        stmt = insert(CVEVote).values(
             cve_id=cve_id,
             user_id=current_user.id,
             vote_type=vote_data.vote_type,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
         )
-
-        # Update counts
-        if vote_data.vote_type == 1:
-            vulnerability.upvotes += 1
-        else:
-            vulnerability.downvotes += 1
-
-        db.add(new_vote)
-        db.commit()
-        db.refresh(vulnerability)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_cve_votes",
+            set_={"vote_type": stmt.excluded.vote_type, "updated_at": func.now()},
+        )
+        db.execute(stmt)
 
         logger.info(f"User {current_user.username} voted on CVE {cve_id}")
 
         user_vote = vote_data.vote_type
 
+    # Counts are maintained by the cve_votes trigger
+    db.commit()
+    db.refresh(vulnerability)
+
     return CVEVoteResponse(
         cve_id=vulnerability.cve_id,
         upvotes=vulnerability.upvotes,
@@ -219,12 +186,6 @@ async def remove_cve_vote(
             status_code=status.HTTP_404_NOT_FOUND, detail="No vote found to remove"
         )
 
-    # Update counts
-    if existing_vote.vote_type == 1:
-        vulnerability.upvotes = max(0, vulnerability.upvotes - 1)
-    else:
-        vulnerability.downvotes = max(0, vulnerability.downvotes - 1)
-
     db.delete(existing_vote)
     db.commit()
 
@@ -3,18 +3,23 @@ API endpoints for user notifications.
 Handles mentions, replies, and other notification types.
 """
 
+import asyncio
+import json
 import logging
 from datetime import datetime, timezone
 from typing import List, Optional
 
 import redis
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy import and_, desc, func, or_
 from sqlalchemy.orm import Session, joinedload
 
-from ..database import REDIS_URL, get_db
+from ..database import REDIS_URL, SessionLocal, get_db
 from ..models import Comment, Notification, User
+from ..services.notification_listener import notification_listener
 from ..utils.auth import get_current_active_user
 
 logger = logging.getLogger(__name__)
@@ -29,6 +34,7 @@ except Exception as e:
     redis_client = None
 
 UNREAD_COUNT_CACHE_TTL = 60  # 1 minute cache for unread count
+STREAM_KEEPALIVE_SECONDS = 25  # Below typical proxy read timeouts
 
 
 # ============================================================================
@@ -318,3 +324,63 @@ async def get_unread_count(
             logger.warning(f"Cache write error: {e}")
 
     return {"unread_count": count}
+
+
+def _count_unread(user_id: int) -> int:
+    """Count unread notifications with a short-lived session."""
+    db = SessionLocal()
+    try:
+        return (
+            db.query(func.count(Notification.id))
+            .filter(Notification.user_id == user_id, Notification.is_read == False)
+            .scalar()
+            or 0
+        )
+    finally:
+        db.close()
+
+
+@router.get("/notifications/stream")
+async def stream_unread_count(
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Stream the unread notification count as server-sent events.
+    Sends the count on connect and again whenever a notification is created
+    for the user. Returns 503 when push is unavailable; clients should fall
+    back to polling /notifications/unread-count.
+    """
+    if not notification_listener.active:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Notification stream unavailable",
+        )
+
+    user_id = current_user.id
+    # Don't hold a pooled connection for the lifetime of the stream
+    db.close()
+
+    queue = notification_listener.subscribe(user_id)
+
+    async def events():
+        try:
+            # The count query blocks; keep it off the event loop
+            count = await run_in_threadpool(_count_unread, user_id)
+            yield f"data: {json.dumps({'unread_count': count})}\n\n"
+            while notification_listener.active:
+                try:
+                    await asyncio.wait_for(queue.get(), STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                count = await run_in_threadpool(_count_unread, user_id)
+                yield f"data: {json.dumps({'unread_count': count})}\n\n"
+        finally:
+            notification_listener.unsubscribe(user_id, queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
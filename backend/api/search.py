@@ -2,19 +2,52 @@
 Search endpoints with advanced filtering.
 """
 
+import re
 from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import String, asc, cast, desc, func, or_
+from sqlalchemy import String, asc, cast, desc, false, func, or_
 from sqlalchemy.orm import Session
 
 from ..database import get_db
 from ..models import Vulnerability
-from ..schemas import PaginatedResponse
+from ..schemas import PaginatedResponse, VulnerabilityList
+from ..services.nvd_complete_service import format_cpe_name
+from ..services.search_cache_service import get_or_compute
 
 router = APIRouter()
 
+CVE_ID_PREFIX_PATTERN = re.compile(r"[A-Z0-9-]+")
+
+
+def cve_id_prefix_filter(q: str):
+    """
+    Match CVE IDs starting with q, with or without the "CVE-" prefix.
+
+    A prefix LIKE can use the text_pattern_ops index on cve_id; queries
+    that cannot be part of a CVE ID match nothing.
+    """
+    prefix = q.strip().upper()
+    if not CVE_ID_PREFIX_PATTERN.fullmatch(prefix):
+        return false()
+    if not prefix.startswith("CVE-"):
+        prefix = f"CVE-{prefix}"
+    return Vulnerability.cve_id.like(f"{prefix}%")
+
+
+def name_filter(column, name: str, partial: bool = False):
+    """
+    Match a vendor or product name in a JSONB array of names.
+
+    Names are stored as format_cpe_name() strings, so an exact match is a
+    containment check the GIN index can serve. A partial match is a
+    case-insensitive substring search over the array's text.
+    """
+    if partial:
+        return func.lower(cast(column, String)).contains(name.lower(), autoescape=True)
+    return column.contains([format_cpe_name(name)])
+
 
 @router.get("/search", response_model=PaginatedResponse)
 async def search_vulnerabilities(
@@ -25,8 +58,21 @@ async def search_vulnerabilities(
     exploited: Optional[bool] = Query(
         None, description="Filter by exploitation status"
     ),
-    vendor: Optional[str] = Query(None, description="Filter by vendor"),
-    product: Optional[str] = Query(None, description="Filter by product"),
+    vendor: Optional[str] = Query(
+        None,
+        description="Filter by exact vendor name, case-insensitive "
+        "(e.g. 'microsoft'); set partial_names for substring matches",
+    ),
+    product: Optional[str] = Query(
+        None,
+        description="Filter by exact product name, case-insensitive "
+        "(e.g. 'windows 10'); set partial_names for substring matches",
+    ),
+    partial_names: bool = Query(
+        False,
+        description="Match vendor and product by substring instead of the "
+        "full name (e.g. product=windows finds 'Windows 10'); slower",
+    ),
     cwe: Optional[str] = Query(None, description="Filter by CWE ID"),
     min_cvss: Optional[float] = Query(
         None, ge=0.0, le=10.0, description="Minimum CVSS score"
@@ -53,8 +99,9 @@ async def search_vulnerabilities(
     - `q`: Full-text search in CVE ID, title, and description
     - `severity`: Filter by severity (CRITICAL, HIGH, MEDIUM, LOW)
     - `exploited`: Filter by exploitation status (true/false)
-    - `vendor`: Filter by vendor name
-    - `product`: Filter by product name
+    - `vendor`: Filter by vendor name (exact, case-insensitive)
+    - `product`: Filter by product name (exact, case-insensitive)
+    - `partial_names`: Match `vendor` / `product` by substring instead
     - `cwe`: Filter by CWE ID (e.g., CWE-79)
     - `min_cvss`, `max_cvss`: CVSS score range
     - `published_after`, `published_before`: Publication date range
@@ -64,14 +111,14 @@ async def search_vulnerabilities(
     # Build query - only CVEs
     query = db.query(Vulnerability).filter(Vulnerability.cve_id.like("CVE-%"))
 
-    # Text search
+    # Text search: prefix match on the CVE ID, full-text on title/description
     if q:
-        search_term = f"%{q}%"
         query = query.filter(
             or_(
-                Vulnerability.cve_id.ilike(search_term),
-                Vulnerability.title.ilike(search_term),
-                Vulnerability.description.ilike(search_term),
+                cve_id_prefix_filter(q),
+                Vulnerability.search_vector.op("@@")(
+                    func.plainto_tsquery("english", q)
+                ),
             )
         )
 
@@ -83,16 +130,14 @@ async def search_vulnerabilities(
     if exploited is not None:
         query = query.filter(Vulnerability.exploited_in_the_wild == exploited)
 
-    # Vendor filter
+    # Vendor and product filters: exact names use @> on the GIN index;
+    # substring matches have to scan the arrays as text
     if vendor:
-        query = query.filter(
-            func.lower(cast(Vulnerability.vendors, String)).contains(vendor.lower())
-        )
+        query = query.filter(name_filter(Vulnerability.vendors, vendor, partial_names))
 
-    # Product filter
     if product:
         query = query.filter(
-            func.lower(cast(Vulnerability.products, String)).contains(product.lower())
+            name_filter(Vulnerability.products, product, partial_names)
         )
 
     # CWE filter
@@ -100,7 +145,7 @@ async def search_vulnerabilities(
         cwe_upper = cwe.upper()
         if not cwe_upper.startswith("CWE-"):
             cwe_upper = f"CWE-{cwe_upper}"
-        query = query.filter(cast(Vulnerability.cwe_ids, String).contains(cwe_upper))
+        query = query.filter(Vulnerability.cwe_ids.contains([cwe_upper]))
 
     # CVSS score range
     if min_cvss is not None:
@@ -124,19 +169,47 @@ async def search_vulnerabilities(
         except ValueError:
             pass
 
-    # Get total count
-    total = query.count()
-
-    # Apply sorting
-    sort_column = getattr(Vulnerability, sort_by, Vulnerability.priority_score)
-    if sort_order.lower() == "asc":
-        query = query.order_by(asc(sort_column))
-    else:
-        query = query.order_by(desc(sort_column))
-
-    # Apply pagination
-    offset = (page - 1) * page_size
-    items = query.offset(offset).limit(page_size).all()
+    def run_search():
+        total = query.count()
+
+        # Apply sorting
+        sort_column = getattr(Vulnerability, sort_by, Vulnerability.priority_score)
+        if sort_order.lower() == "asc":
+            ordered = query.order_by(asc(sort_column))
+        else:
+            ordered = query.order_by(desc(sort_column))
+
+        # Apply pagination
+        offset = (page - 1) * page_size
+        items = ordered.offset(offset).limit(page_size).all()
+
+        return [
+            VulnerabilityList.from_orm_fast(item).model_dump(mode="json")
+            for item in items
+        ], total
+
+    items, total = get_or_compute(
+        db,
+        "vulnerability_search",
+        {
+            "q": q,
+            "severity": severity,
+            "exploited": exploited,
+            "vendor": vendor,
+            "product": product,
+            "partial_names": partial_names,
+            "cwe": cwe,
+            "min_cvss": min_cvss,
+            "max_cvss": max_cvss,
+            "published_after": published_after,
+            "published_before": published_before,
+            "page": page,
+            "page_size": page_size,
+            "sort_by": sort_by,
+            "sort_order": sort_order,
+        },
+        run_search,
+    )
 
     # Calculate total pages
     total_pages = (total + page_size - 1) // page_size
@@ -167,7 +240,7 @@ async def search_suggestions(
         db.query(Vulnerability.cve_id, Vulnerability.title)
         .filter(
             or_(
-                Vulnerability.cve_id.ilike(search_term),
+                cve_id_prefix_filter(q),
                 Vulnerability.title.ilike(search_term),
             )
         )
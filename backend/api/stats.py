@@ -2,7 +2,6 @@
 Statistics and dashboard endpoints.
 """
 
-import json
 from datetime import datetime, timedelta, timezone
 
 import redis
@@ -38,8 +37,7 @@ async def get_statistics(db: Session = Depends(get_db)):
     try:
         cached = redis_client.get(STATS_CACHE_KEY)
         if cached:
-            data = json.loads(cached)
-            return StatsResponse(**data)
+            return StatsResponse.model_validate_json(cached)
     except Exception as e:
         print(f"Cache read error: {e}")
 
@@ -97,7 +95,7 @@ async def get_statistics(db: Session = Depends(get_db)):
             redis_client.setex(
                 STATS_CACHE_KEY,
                 STATS_CACHE_TTL,
-                json.dumps(result.model_dump(), default=str),
+                result.model_dump_json(),
             )
         except Exception as e:
             print(f"Cache write error: {e}")
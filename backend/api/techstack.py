@@ -13,7 +13,7 @@ from typing import List, Optional
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 
 from ..database import get_db
 from ..models import TechStack, TechStackMatch
@@ -566,8 +566,10 @@ async def list_session_tech_stacks(
 
     Returns a summary of each tech stack without full vulnerability details.
     """
+    # Summaries use the stored counts; never load matches here
     tech_stacks = (
         db.query(TechStack)
+        .options(raiseload("*"))
         .filter(TechStack.session_id == session_id)
         .order_by(TechStack.created_at.desc())
         .limit(50)
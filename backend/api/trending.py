@@ -131,7 +131,7 @@ async def get_trending_cves(
         # Build subquery for vote counts in time period
         vote_subquery = db.query(
             CVEVote.cve_id,
-            func.count(CVEVote.id).label("vote_count"),
+            func.count().label("vote_count"),
             func.min(CVEVote.created_at).label("first_vote_time"),
         )
 
@@ -194,7 +194,7 @@ async def get_trending_cves(
 
         # Calculate net score and sort
         query = query.order_by(
-            desc(Vulnerability.upvotes - Vulnerability.downvotes),
+            desc(Vulnerability.score),
             desc(Vulnerability.upvotes),  # Tiebreaker: more upvotes
         )
 
@@ -249,9 +249,7 @@ async def get_trending_stats(
     most_voted_cve = None
     if total_votes > 0:
         vote_counts = (
-            vote_query.with_entities(
-                CVEVote.cve_id, func.count(CVEVote.id).label("vote_count")
-            )
+            vote_query.with_entities(CVEVote.cve_id, func.count().label("vote_count"))
             .group_by(CVEVote.cve_id)
             .order_by(desc("vote_count"))
             .first()
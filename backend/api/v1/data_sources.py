@@ -131,7 +131,8 @@ async def get_nvd_status():
             .all()
         )
 
-        severity_breakdown = {sev: count for sev, count in severity_counts}
+        # severity is nullable; JSON object keys must be strings
+        severity_breakdown = {sev or "UNKNOWN": count for sev, count in severity_counts}
 
         return {
             "source": "nvd",
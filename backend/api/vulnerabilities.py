@@ -11,9 +11,10 @@ from sqlalchemy import asc, desc
 from sqlalchemy.orm import Session
 
 from ..database import REDIS_URL, get_db
-from ..models import Vulnerability
-from ..schemas import PaginatedResponse, VulnerabilityDetail
+from ..models import Vulnerability, VulnerabilityFeed
+from ..schemas import PaginatedResponse, VulnerabilityDetail, VulnerabilityList
 from ..schemas.enums import SeverityEnum, SortOrderEnum, VulnerabilitySortFieldEnum
+from ..services.nvd_complete_service import format_cpe_name
 from ..utils.validators import validate_cve_id, validate_page_params
 
 router = APIRouter()
@@ -56,15 +57,18 @@ async def list_vulnerabilities(
     # Validate pagination parameters
     page, page_size = validate_page_params(page, page_size)
 
+    # Read from the materialized feed; the view only exists on PostgreSQL
+    model = VulnerabilityFeed if db.bind.dialect.name == "postgresql" else Vulnerability
+
     # Build query - only CVEs (no GHSA or other formats)
-    query = db.query(Vulnerability).filter(Vulnerability.cve_id.like("CVE-%"))
+    query = db.query(model).filter(model.cve_id.like("CVE-%"))
 
     # Apply filters with validated enums
     if severity:
-        query = query.filter(Vulnerability.severity == severity.value)
+        query = query.filter(model.severity == severity.value)
 
     if exploited is not None:
-        query = query.filter(Vulnerability.exploited_in_the_wild == exploited)
+        query = query.filter(model.exploited_in_the_wild == exploited)
 
     # Get total count with caching for filtered queries
     cache_key = f"vuln:count:{severity}:{exploited}:{sort_by.value}"
@@ -87,7 +91,7 @@ async def list_vulnerabilities(
                 pass
 
     # Apply sorting with validated enum (safe from SQL injection)
-    sort_column = getattr(Vulnerability, sort_by.value)
+    sort_column = getattr(model, sort_by.value)
     if sort_order == SortOrderEnum.ASC:
         query = query.order_by(asc(sort_column))
     else:
@@ -105,7 +109,7 @@ async def list_vulnerabilities(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
-        items=items,
+        items=[VulnerabilityList.from_orm_fast(item) for item in items],
     )
 
 
@@ -139,7 +143,7 @@ async def list_exploited_vulnerabilities(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
-        items=items,
+        items=[VulnerabilityList.from_orm_fast(item) for item in items],
     )
 
 
@@ -176,7 +180,7 @@ async def list_recent_vulnerabilities(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
-        items=items,
+        items=[VulnerabilityList.from_orm_fast(item) for item in items],
     )
 
 
@@ -214,11 +218,10 @@ async def list_vulnerabilities_by_vendor(
     **Path Parameters:**
     - `vendor`: Vendor name (case-insensitive)
     """
-    from sqlalchemy import String, cast, func
-
-    # Search in vendors JSON array
+    # Containment on the vendors array (GIN index); names are stored
+    # title-cased, so normalize the path parameter the same way
     query = db.query(Vulnerability).filter(
-        func.lower(cast(Vulnerability.vendors, String)).contains(vendor.lower())
+        Vulnerability.vendors.contains([format_cpe_name(vendor)])
     )
 
     total = query.count()
@@ -235,5 +238,5 @@ async def list_vulnerabilities_by_vendor(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
-        items=items,
+        items=[VulnerabilityList.from_orm_fast(item) for item in items],
     )
@@ -2,9 +2,13 @@
 Waitlist endpoints for beta launch signups with email verification.
 """
 
+import base64
+import binascii
+import hashlib
 import logging
 import secrets
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
@@ -19,9 +23,28 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-def generate_verification_token() -> str:
+def generate_verification_token() -> bytes:
     """Generate a secure random token for email verification."""
-    return secrets.token_urlsafe(32)
+    return secrets.token_bytes(32)
+
+
+def encode_verification_token(token: bytes) -> str:
+    """Encode a raw token for use in the verification link."""
+    return base64.urlsafe_b64encode(token).rstrip(b"=").decode()
+
+
+def decode_verification_token(token: str) -> Optional[bytes]:
+    """Decode a token from the verification link, or None if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    except (binascii.Error, ValueError):
+        return None
+    return raw if len(raw) == 32 else None
+
+
+def hash_verification_token(token: bytes) -> bytes:
+    """Digest stored in place of the token, so a database dump cannot verify."""
+    return hashlib.sha256(token).digest()
 
 
 @router.post("/join", status_code=status.HTTP_201_CREATED)
@@ -48,7 +71,9 @@ async def join_waitlist(data: WaitlistJoin, db: Session = Depends(get_db)):
             verification_token = generate_verification_token()
             token_expires_at = datetime.now(timezone.utc) + timedelta(hours=24)
 
-            existing_entry.verification_token = verification_token
+            existing_entry.verification_token_hash = hash_verification_token(
+                verification_token
+            )
             existing_entry.token_expires_at = token_expires_at
             db.commit()
 
@@ -60,7 +85,7 @@ async def join_waitlist(data: WaitlistJoin, db: Session = Depends(get_db)):
 
         new_entry = WaitlistEntry(
             email=data.email,
-            verification_token=verification_token,
+            verification_token_hash=hash_verification_token(verification_token),
             token_expires_at=token_expires_at,
             is_verified=False,
         )
@@ -72,7 +97,8 @@ async def join_waitlist(data: WaitlistJoin, db: Session = Depends(get_db)):
     # Send verification email
     try:
         verification_link = (
-            f"https://open-threats.com/auth/verify?token={verification_token}"
+            "https://open-threats.com/auth/verify"
+            f"?token={encode_verification_token(verification_token)}"
         )
 
         await email_service.send_email(
@@ -163,10 +189,15 @@ async def verify_email(token: str, db: Session = Depends(get_db)):
     - Success message or error
     """
     # Find entry by token
+    raw_token = decode_verification_token(token)
     entry = (
         db.query(WaitlistEntry)
-        .filter(WaitlistEntry.verification_token == token)
+        .filter(
+            WaitlistEntry.verification_token_hash == hash_verification_token(raw_token)
+        )
         .first()
+        if raw_token
+        else None
     )
 
     if not entry:
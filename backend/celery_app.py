@@ -54,6 +54,16 @@ celery_app.conf.beat_schedule = {
         "task": "tasks.refresh_stats_cache",
         "schedule": crontab(minute="*/5"),  # Every 5 minutes
     },
+    # Refresh materialized vulnerability feed every 5 minutes
+    "refresh-vulnerability-feed": {
+        "task": "tasks.refresh_vulnerability_feed",
+        "schedule": crontab(minute="*/5"),  # Every 5 minutes
+    },
+    # Keep monthly table partitions created ahead of time
+    "ensure-partitions": {
+        "task": "tasks.ensure_partitions",
+        "schedule": crontab(hour=1, minute=15),  # Daily at 01:15 UTC
+    },
     # LLM Processing Tasks - Only for NEW CVEs (fixed task name)
     "process-new-cves": {
         "task": "tasks.process_new_cves",
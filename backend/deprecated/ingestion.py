@@ -260,7 +260,6 @@ def run_ingestion(
         # Update run record
         run.status = "success"
         run.completed_at = datetime.now(timezone.utc)
-        run.duration_seconds = (run.completed_at - run.started_at).total_seconds()
         run.records_fetched = stats["fetched"]
         run.records_inserted = stats["inserted"]
         run.records_updated = stats["updated"]
@@ -282,7 +281,6 @@ def run_ingestion(
         # Mark run as failed
         run.status = "failed"
         run.completed_at = datetime.now(timezone.utc)
-        run.duration_seconds = (run.completed_at - run.started_at).total_seconds()
         run.error_message = str(e)
 
         db.commit()
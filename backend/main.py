@@ -8,7 +8,7 @@ from datetime import datetime, timezone
 
 from fastapi import Depends, FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from sqlalchemy.orm import Session
 
 from . import api
@@ -19,8 +19,9 @@ from .database import engine, get_db
 from .middleware.csrf_protect import csrf_protect_middleware
 
 # Use Redis-based rate limiting for multi-replica support
-from .middleware.redis_rate_limit import redis_rate_limit_middleware
+from .middleware.redis_rate_limit import redis_rate_limit_middleware, redis_rate_limiter
 from .models import Base
+from .services.notification_listener import notification_listener
 from .utils.error_handlers import register_error_handlers
 
 # Setup logging
@@ -34,6 +35,7 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # Register error handlers
@@ -153,6 +155,8 @@ async def startup_event():
     """Startup event handler."""
     logger.info("🚀 OpenThreat API starting...")
 
+    await redis_rate_limiter.connect()
+
     # Run database migrations
     try:
         from .migrations.run_migrations import run_migrations
@@ -164,6 +168,9 @@ async def startup_event():
         logger.warning(f"⚠️  Migration warning: {e}")
         # Don't fail startup if migrations have issues
 
+    # Push new notifications to connected clients (needs the NOTIFY trigger)
+    await notification_listener.start()
+
     logger.info(f"📊 Database: {os.getenv('DATABASE_URL', 'Not configured')}")
     logger.info(f"🌐 CORS Origins: {allowed_origins}")
     logger.info(f"📝 Log Level: {os.getenv('LOG_LEVEL', 'INFO')}")
@@ -178,6 +185,12 @@ async def shutdown_event():
     """Shutdown event handler."""
     logger.info("👋 OpenThreat API shutting down...")
 
+    await redis_rate_limiter.close()
+    await notification_listener.stop()
+
+    # Close pooled connections instead of leaving them to the server timeout
+    engine.dispose()
+
 
 if __name__ == "__main__":
     import uvicorn
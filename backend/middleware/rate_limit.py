@@ -5,7 +5,8 @@ Prevents abuse by limiting requests per IP address.
 """
 
 import logging
-from datetime import datetime, timedelta
+import time
+from array import array
 from typing import Dict, Tuple
 
 from fastapi import Request, status
@@ -13,11 +14,19 @@ from fastapi.responses import JSONResponse
 
 logger = logging.getLogger(__name__)
 
+NS_PER_MINUTE = 60 * 1_000_000_000
+NS_PER_HOUR = 60 * NS_PER_MINUTE
+
 
 class RateLimiter:
     """
     Simple in-memory rate limiter.
 
+    Per-IP state is kept as parallel fixed-width arrays (last request time,
+    minute count, hour count) indexed through an ``ip -> row`` dict, so an
+    update writes three machine integers instead of allocating a datetime
+    and a tuple per request.
+
     For production, consider using Redis for distributed rate limiting.
     """
 
@@ -32,17 +41,35 @@ class RateLimiter:
         self.requests_per_minute = requests_per_minute
         self.requests_per_hour = requests_per_hour
 
-        # Store: {ip: [(timestamp, count_minute, count_hour)]}
-        self.request_counts: Dict[str, Tuple[datetime, int, int]] = {}
+        # Store: {ip: row}, with the row indexing the arrays below
+        self._rows: Dict[str, int] = {}
+        self._last_request = array("q")  # monotonic nanoseconds
+        self._count_minute = array("l")
+        self._count_hour = array("l")
 
     def _clean_old_entries(self) -> None:
-        """Remove entries older than 1 hour."""
-        now = datetime.now()
-        cutoff = now - timedelta(hours=1)
-
-        self.request_counts = {
-            ip: data for ip, data in self.request_counts.items() if data[0] > cutoff
-        }
+        """Remove entries older than 1 hour, compacting the arrays in place."""
+        cutoff = time.monotonic_ns() - NS_PER_HOUR
+
+        last_request = self._last_request
+        count_minute = self._count_minute
+        count_hour = self._count_hour
+
+        rows: Dict[str, int] = {}
+        write = 0
+        for ip, read in self._rows.items():
+            if last_request[read] <= cutoff:
+                continue
+            last_request[write] = last_request[read]
+            count_minute[write] = count_minute[read]
+            count_hour[write] = count_hour[read]
+            rows[ip] = write
+            write += 1
+
+        del last_request[write:]
+        del count_minute[write:]
+        del count_hour[write:]
+        self._rows = rows
 
     def check_rate_limit(self, ip: str) -> Tuple[bool, str]:
         """
@@ -54,23 +81,25 @@ class RateLimiter:
         Returns:
             Tuple of (is_allowed, error_message)
         """
-        now = datetime.now()
-
-        # Clean old entries periodically
-        if len(self.request_counts) > 10000:
-            self._clean_old_entries()
-
-        if ip not in self.request_counts:
-            self.request_counts[ip] = (now, 1, 1)
+        now = time.monotonic_ns()
+
+        row = self._rows.get(ip)
+        if row is None:
+            # Clean old entries periodically
+            if len(self._rows) > 10000:
+                self._clean_old_entries()
+
+            self._rows[ip] = len(self._last_request)
+            self._last_request.append(now)
+            self._count_minute.append(1)
+            self._count_hour.append(1)
             return True, ""
 
-        last_request, count_minute, count_hour = self.request_counts[ip]
+        elapsed = now - self._last_request[row]
 
         # Reset counters if time windows have passed
-        if now - last_request > timedelta(minutes=1):
-            count_minute = 0
-        if now - last_request > timedelta(hours=1):
-            count_hour = 0
+        count_minute = 0 if elapsed > NS_PER_MINUTE else self._count_minute[row]
+        count_hour = 0 if elapsed > NS_PER_HOUR else self._count_hour[row]
 
         # Increment counters
         count_minute += 1
@@ -90,7 +119,9 @@ class RateLimiter:
             )
 
         # Update counts
-        self.request_counts[ip] = (now, count_minute, count_hour)
+        self._last_request[row] = now
+        self._count_minute[row] = count_minute
+        self._count_hour[row] = count_hour
 
         return True, ""
 
@@ -104,15 +135,25 @@ class RateLimiter:
         Returns:
             Client IP address
         """
+        # Walk the raw ASGI header list once; names are already lower-cased
+        # bytes, so this skips building a Headers mapping per lookup
+        forwarded = None
+        real_ip = None
+        for name, value in request.scope.get("headers", ()):
+            if name == b"x-forwarded-for":
+                forwarded = value
+                break
+            if name == b"x-real-ip" and real_ip is None:
+                real_ip = value
+
         # Check for forwarded IP (behind proxy)
-        forwarded = request.headers.get("X-Forwarded-For")
         if forwarded:
-            return forwarded.split(",")[0].strip()
+            head, _, _ = forwarded.partition(b",")
+            return head.strip().decode("latin-1")
 
         # Check for real IP
-        real_ip = request.headers.get("X-Real-IP")
         if real_ip:
-            return real_ip
+            return real_ip.decode("latin-1")
 
         # Fall back to direct connection
         return request.client.host if request.client else "unknown"
@@ -4,23 +4,81 @@ Redis-based distributed rate limiting middleware.
 Supports multiple backend replicas by using Redis as shared state.
 """
 
+import json
 import logging
+import math
 import os
-from datetime import datetime
+import time
+from functools import lru_cache
 from typing import Tuple
 
 import redis
-from fastapi import Request, status
-from fastapi.responses import JSONResponse
+import redis.asyncio
+from fastapi import Request, Response, status
+
+from .rate_limit import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Generic Cell Rate Algorithm (GCRA) over several windows in one round trip.
+# Each key holds a single "theoretical arrival time" (TAT) in milliseconds, so
+# memory per client is constant regardless of request volume. The request is
+# only recorded when every window allows it.
+#
+# KEYS: one TAT key per window
+# ARGV: now_ms, then (emission_interval_ms, period_ms) per window
+# Returns: {allowed, retry_after_ms, limited_window, remaining...}
+GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local allowed = 1
+local retry_after = 0
+local limited = 0
+local tats = {}
+local result = {}
+
+for i = 1, #KEYS do
+    local interval = tonumber(ARGV[i * 2])
+    local period = tonumber(ARGV[i * 2 + 1])
+    local tat = tonumber(redis.call('GET', KEYS[i])) or now
+    if tat < now then
+        tat = now
+    end
+
+    local new_tat = tat + interval
+    local allow_at = new_tat - period
+    if now < allow_at then
+        if allow_at - now > retry_after then
+            retry_after = allow_at - now
+            limited = i
+        end
+        allowed = 0
+        result[i + 3] = 0
+    else
+        result[i + 3] = math.floor((period - (new_tat - now)) / interval)
+    end
+    tats[i] = new_tat
+end
+
+if allowed == 1 then
+    for i = 1, #KEYS do
+        redis.call('SET', KEYS[i], tats[i], 'PX', math.ceil(tats[i] - now))
+    end
+end
+
+result[1] = allowed
+result[2] = math.ceil(retry_after)
+result[3] = limited
+return result
+"""
+
 
 class RedisRateLimiter:
     """
     Distributed rate limiter using Redis.
 
-    Works across multiple backend instances/replicas.
+    Works across multiple backend instances/replicas. Each window is enforced
+    with GCRA, which keeps one timestamp per client and window instead of a
+    counter per time bucket.
     """
 
     def __init__(
@@ -28,6 +86,8 @@ class RedisRateLimiter:
         redis_url: str,
         requests_per_minute: int = 60,
         requests_per_hour: int = 1000,
+        socket_timeout: float = 0.05,
+        max_connections: int = 64,
     ):
         """
         Initialize Redis rate limiter.
@@ -36,20 +96,55 @@ class RedisRateLimiter:
             redis_url: Redis connection URL
             requests_per_minute: Maximum requests per minute per IP
             requests_per_hour: Maximum requests per hour per IP
+            socket_timeout: Seconds to wait for Redis before falling back
+            max_connections: Size of the async connection pool
         """
-        self.redis_client = redis.from_url(redis_url, decode_responses=True)
+        # Async client so Redis round trips don't block the event loop; short
+        # timeouts bound the latency a slow Redis adds to every request
+        self.redis_client = redis.asyncio.from_url(
+            redis_url,
+            decode_responses=True,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_timeout * 2,
+            health_check_interval=30,
+            max_connections=max_connections,
+        )
         self.requests_per_minute = requests_per_minute
         self.requests_per_hour = requests_per_hour
 
-        # Test Redis connection
+        # Emission interval and period (ms) for the minute and hour windows
+        self._gcra_args = (
+            60_000 / requests_per_minute,
+            60_000,
+            3_600_000 / requests_per_hour,
+            3_600_000,
+        )
+        self._gcra = self.redis_client.register_script(GCRA_SCRIPT)
+
+        # Process-local limiter used while Redis is timing out
+        self._local = RateLimiter(requests_per_minute, requests_per_hour)
+
+        # Whitelist from environment variable, parsed once
+        self.whitelist = frozenset(
+            entry.strip()
+            for entry in os.getenv("RATE_LIMIT_WHITELIST", "").split(",")
+            if entry.strip()
+        )
+
+    async def connect(self) -> None:
+        """Test the Redis connection; called from the app startup handler."""
         try:
-            self.redis_client.ping()
+            await self.redis_client.ping()
             logger.info("Redis rate limiter connected successfully")
         except redis.ConnectionError as e:
             logger.error(f"Failed to connect to Redis: {e}")
             raise
 
-    def check_rate_limit(self, ip: str) -> Tuple[bool, str, dict]:
+    async def close(self) -> None:
+        """Release pooled Redis connections."""
+        await self.redis_client.aclose()
+
+    async def check_rate_limit(self, ip: str) -> Tuple[bool, str, dict]:
         """
         Check if IP has exceeded rate limit using Redis.
 
@@ -59,49 +154,36 @@ class RedisRateLimiter:
         Returns:
             Tuple of (is_allowed, error_message, rate_limit_info)
         """
-        now = datetime.now()
-        minute_key = f"rate_limit:{ip}:minute:{now.strftime('%Y%m%d%H%M')}"
-        hour_key = f"rate_limit:{ip}:hour:{now.strftime('%Y%m%d%H')}"
+        minute_key = f"rate_limit:{ip}:minute"
+        hour_key = f"rate_limit:{ip}:hour"
 
         try:
-            # Use Redis pipeline for atomic operations
-            pipe = self.redis_client.pipeline()
-
-            # Increment and get minute counter
-            pipe.incr(minute_key)
-            pipe.expire(minute_key, 60)  # Expire after 60 seconds
-
-            # Increment and get hour counter
-            pipe.incr(hour_key)
-            pipe.expire(hour_key, 3600)  # Expire after 1 hour
-
-            results = pipe.execute()
-
-            minute_count = results[0]
-            hour_count = results[2]
-
-            # Calculate remaining requests
-            minute_remaining = max(0, self.requests_per_minute - minute_count)
-            hour_remaining = max(0, self.requests_per_hour - hour_count)
+            allowed, retry_after_ms, limited, minute_remaining, hour_remaining = (
+                await self._gcra(
+                    keys=[minute_key, hour_key],
+                    args=[int(time.time() * 1000), *self._gcra_args],
+                )
+            )
 
             rate_limit_info = {
                 "limit_minute": self.requests_per_minute,
                 "limit_hour": self.requests_per_hour,
                 "remaining_minute": minute_remaining,
                 "remaining_hour": hour_remaining,
-                "used_minute": minute_count,
-                "used_hour": hour_count,
+                "used_minute": self.requests_per_minute - minute_remaining,
+                "used_hour": self.requests_per_hour - hour_remaining,
+                "retry_after": max(1, math.ceil(retry_after_ms / 1000)),
             }
 
             # Check limits
-            if minute_count > self.requests_per_minute:
+            if not allowed and limited == 1:
                 return (
                     False,
                     f"Rate limit exceeded: {self.requests_per_minute} requests per minute",
                     rate_limit_info,
                 )
 
-            if hour_count > self.requests_per_hour:
+            if not allowed:
                 return (
                     False,
                     f"Rate limit exceeded: {self.requests_per_hour} requests per hour",
@@ -110,6 +192,23 @@ class RedisRateLimiter:
 
             return True, "", rate_limit_info
 
+        except redis.TimeoutError:
+            logger.warning("Redis rate limiter timed out, using local limits")
+            # Degrade to per-process limits instead of letting everything through
+            is_allowed, error_message = self._local.check_rate_limit(ip)
+            return (
+                is_allowed,
+                error_message,
+                {
+                    "limit_minute": self.requests_per_minute,
+                    "limit_hour": self.requests_per_hour,
+                    "remaining_minute": self.requests_per_minute if is_allowed else 0,
+                    "remaining_hour": self.requests_per_hour if is_allowed else 0,
+                    "retry_after": 60,
+                    "error": "rate_limiter_degraded",
+                },
+            )
+
         except redis.RedisError as e:
             logger.error(f"Redis error in rate limiting: {e}")
             # Fail open - allow request if Redis is down
@@ -137,16 +236,26 @@ class RedisRateLimiter:
         Returns:
             Client IP address
         """
+        # Walk the raw ASGI header list once; names are already lower-cased
+        # bytes, so this skips building a Headers mapping per lookup
+        forwarded = None
+        real_ip = None
+        for name, value in request.scope.get("headers", ()):
+            if name == b"x-forwarded-for":
+                forwarded = value
+                break
+            if name == b"x-real-ip" and real_ip is None:
+                real_ip = value
+
         # Check for forwarded IP (behind proxy/load balancer)
-        forwarded = request.headers.get("X-Forwarded-For")
         if forwarded:
             # X-Forwarded-For can contain multiple IPs, take the first one
-            return forwarded.split(",")[0].strip()
+            head, _, _ = forwarded.partition(b",")
+            return head.strip().decode("latin-1")
 
         # Check for real IP (set by some proxies)
-        real_ip = request.headers.get("X-Real-IP")
         if real_ip:
-            return real_ip
+            return real_ip.decode("latin-1")
 
         # Fall back to direct connection IP
         return request.client.host if request.client else "unknown"
@@ -161,11 +270,7 @@ class RedisRateLimiter:
         Returns:
             True if whitelisted
         """
-        # Get whitelist from environment variable
-        whitelist = os.getenv("RATE_LIMIT_WHITELIST", "").split(",")
-        whitelist = [ip.strip() for ip in whitelist if ip.strip()]
-
-        return ip in whitelist
+        return ip in self.whitelist
 
 
 # Global rate limiter instance
@@ -178,6 +283,40 @@ redis_rate_limiter = RedisRateLimiter(
 )
 
 
+# Skip rate limiting for health checks and docs
+SKIP_PATHS = frozenset(["/health", "/", "/docs", "/redoc", "/openapi.json", "/metrics"])
+
+# Limit headers never change at runtime, so encode them once
+_LIMIT_MINUTE = str(redis_rate_limiter.requests_per_minute)
+_LIMIT_HOUR = str(redis_rate_limiter.requests_per_hour)
+
+
+@lru_cache(maxsize=256)
+def _rate_limit_body(
+    error_message: str, retry_after: int, remaining_minute: int, remaining_hour: int
+) -> bytes:
+    """Serialize a 429 payload; repeated denials reuse the cached bytes."""
+    return json.dumps(
+        {
+            "error": error_message,
+            "status_code": status.HTTP_429_TOO_MANY_REQUESTS,
+            "details": {
+                "retry_after": f"{retry_after} seconds",
+                "limits": {
+                    "per_minute": redis_rate_limiter.requests_per_minute,
+                    "per_hour": redis_rate_limiter.requests_per_hour,
+                },
+                "remaining": {
+                    "per_minute": remaining_minute,
+                    "per_hour": remaining_hour,
+                },
+            },
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
 async def redis_rate_limit_middleware(request: Request, call_next):
     """
     Redis-based rate limiting middleware for FastAPI.
@@ -189,9 +328,7 @@ async def redis_rate_limit_middleware(request: Request, call_next):
     Returns:
         Response or rate limit error
     """
-    # Skip rate limiting for health checks and docs
-    skip_paths = ["/health", "/", "/docs", "/redoc", "/openapi.json", "/metrics"]
-    if request.url.path in skip_paths:
+    if request.url.path in SKIP_PATHS:
         return await call_next(request)
 
     # Get client IP
@@ -204,10 +341,13 @@ async def redis_rate_limit_middleware(request: Request, call_next):
         return response
 
     # Check rate limit
-    is_allowed, error_message, rate_info = redis_rate_limiter.check_rate_limit(
+    is_allowed, error_message, rate_info = await redis_rate_limiter.check_rate_limit(
         client_ip
     )
 
+    remaining_minute = str(rate_info["remaining_minute"])
+    remaining_hour = str(rate_info["remaining_hour"])
+
     if not is_allowed:
         logger.warning(
             f"Rate limit exceeded for IP: {client_ip}",
@@ -219,29 +359,21 @@ async def redis_rate_limit_middleware(request: Request, call_next):
             },
         )
 
-        return JSONResponse(
+        return Response(
+            content=_rate_limit_body(
+                error_message,
+                rate_info["retry_after"],
+                rate_info["remaining_minute"],
+                rate_info["remaining_hour"],
+            ),
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            content={
-                "error": error_message,
-                "status_code": status.HTTP_429_TOO_MANY_REQUESTS,
-                "details": {
-                    "retry_after": "60 seconds",
-                    "limits": {
-                        "per_minute": rate_info["limit_minute"],
-                        "per_hour": rate_info["limit_hour"],
-                    },
-                    "remaining": {
-                        "per_minute": rate_info["remaining_minute"],
-                        "per_hour": rate_info["remaining_hour"],
-                    },
-                },
-            },
+            media_type="application/json",
             headers={
-                "Retry-After": "60",
-                "X-RateLimit-Limit-Minute": str(rate_info["limit_minute"]),
-                "X-RateLimit-Limit-Hour": str(rate_info["limit_hour"]),
-                "X-RateLimit-Remaining-Minute": str(rate_info["remaining_minute"]),
-                "X-RateLimit-Remaining-Hour": str(rate_info["remaining_hour"]),
+                "Retry-After": str(rate_info["retry_after"]),
+                "X-RateLimit-Limit-Minute": _LIMIT_MINUTE,
+                "X-RateLimit-Limit-Hour": _LIMIT_HOUR,
+                "X-RateLimit-Remaining-Minute": remaining_minute,
+                "X-RateLimit-Remaining-Hour": remaining_hour,
             },
         )
 
@@ -249,11 +381,9 @@ async def redis_rate_limit_middleware(request: Request, call_next):
     response = await call_next(request)
 
     # Add rate limit headers to response
-    response.headers["X-RateLimit-Limit-Minute"] = str(rate_info["limit_minute"])
-    response.headers["X-RateLimit-Limit-Hour"] = str(rate_info["limit_hour"])
-    response.headers["X-RateLimit-Remaining-Minute"] = str(
-        rate_info["remaining_minute"]
-    )
-    response.headers["X-RateLimit-Remaining-Hour"] = str(rate_info["remaining_hour"])
+    response.headers["X-RateLimit-Limit-Minute"] = _LIMIT_MINUTE
+    response.headers["X-RateLimit-Limit-Hour"] = _LIMIT_HOUR
+    response.headers["X-RateLimit-Remaining-Minute"] = remaining_minute
+    response.headers["X-RateLimit-Remaining-Hour"] = remaining_hour
 
     return response
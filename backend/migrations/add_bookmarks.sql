@@ -11,7 +11,6 @@ CREATE TABLE IF NOT EXISTS bookmarks (
 );
 
 -- Indexes for performance
-CREATE INDEX IF NOT EXISTS idx_bookmarks_user_id ON bookmarks(user_id);
 CREATE INDEX IF NOT EXISTS idx_bookmarks_cve_id ON bookmarks(cve_id);
 CREATE INDEX IF NOT EXISTS idx_bookmarks_created_at ON bookmarks(created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_bookmarks_user_created ON bookmarks(user_id, created_at DESC);
@@ -0,0 +1,30 @@
+-- Migration: Replace B-tree indexes on append-only time columns with BRIN
+-- Date: 2026-10-16
+-- BRIN keeps min/max per block range, a fraction of the B-tree size for
+-- columns whose values grow with insertion order.
+
+-- ingestion_runs is partitioned, which does not support CONCURRENTLY
+CREATE INDEX IF NOT EXISTS ix_ingestion_started_brin
+ON ingestion_runs USING brin (started_at);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_search_cache_created_brin
+ON search_cache USING brin (created_at);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_search_cache_expires_brin
+ON search_cache USING brin (expires_at);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_news_published_brin
+ON news_articles USING brin (published_at) WITH (pages_per_range = 32);
+
+-- page_views is partitioned as well
+CREATE INDEX IF NOT EXISTS idx_page_views_date_brin
+ON page_views USING brin (created_at) WITH (pages_per_range = 64);
+
+DROP INDEX IF EXISTS ix_ingestion_runs_started_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_search_cache_created_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_search_cache_expires_at;
+DROP INDEX CONCURRENTLY IF EXISTS ix_news_articles_published_at;
+DROP INDEX CONCURRENTLY IF EXISTS idx_news_articles_published;
+DROP INDEX IF EXISTS ix_page_views_created_at;
+DROP INDEX IF EXISTS idx_page_views_created_at;
+DROP INDEX IF EXISTS idx_page_views_date;
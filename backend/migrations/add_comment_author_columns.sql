@@ -0,0 +1,49 @@
+-- Migration: Denormalize comment author username and role
+-- Date: 2026-10-16
+-- Comment listings only need the author's username and role; storing them
+-- on the comment removes the users lookup from every listing. A trigger on
+-- users keeps them current when a user is renamed or changes role.
+
+ALTER TABLE comments
+ADD COLUMN IF NOT EXISTS author_username VARCHAR(100);
+
+ALTER TABLE comments
+ADD COLUMN IF NOT EXISTS author_role VARCHAR(20);
+
+UPDATE comments c
+SET author_username = u.username,
+    author_role = u.role::text
+FROM users u
+WHERE c.user_id = u.id
+  AND (c.author_username IS NULL OR c.author_role IS NULL);
+
+ALTER TABLE comments
+ALTER COLUMN author_username SET NOT NULL;
+
+ALTER TABLE comments
+ALTER COLUMN author_role SET NOT NULL;
+
+CREATE OR REPLACE FUNCTION sync_comment_author()
+RETURNS trigger AS $$
+BEGIN
+    UPDATE comments
+    SET author_username = NEW.username,
+        author_role = NEW.role::text
+    WHERE user_id = NEW.id;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Create the trigger once (avoids taking a table lock on every startup)
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT FROM pg_trigger WHERE tgname = 'trg_users_sync_comment_author') THEN
+        CREATE TRIGGER trg_users_sync_comment_author
+        AFTER UPDATE OF username, role ON users
+        FOR EACH ROW
+        WHEN (OLD.username IS DISTINCT FROM NEW.username
+              OR OLD.role IS DISTINCT FROM NEW.role)
+        EXECUTE FUNCTION sync_comment_author();
+    END IF;
+END $$;
@@ -0,0 +1,30 @@
+-- Migration: Covering (INCLUDE) indexes for comment and bookmark list queries
+-- Date: 2026-10-16
+-- Lets the hot list queries run as index-only scans. Requires PostgreSQL 11+.
+
+-- Drop the plain versions so they can be recreated with INCLUDE columns
+DO $$
+BEGIN
+    IF EXISTS (SELECT FROM pg_indexes
+               WHERE indexname = 'idx_comments_cve_created'
+               AND indexdef NOT LIKE '%INCLUDE%') THEN
+        DROP INDEX idx_comments_cve_created;
+    END IF;
+
+    IF EXISTS (SELECT FROM pg_indexes
+               WHERE indexname = 'idx_bookmarks_user_created'
+               AND indexdef NOT LIKE '%INCLUDE%') THEN
+        DROP INDEX idx_bookmarks_user_created;
+    END IF;
+END $$;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_comments_cve_created
+ON comments (cve_id, created_at)
+INCLUDE (user_id, upvotes, downvotes, is_deleted);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bookmarks_user_created
+ON bookmarks (user_id, created_at)
+INCLUDE (cve_id);
+
+ANALYZE comments;
+ANALYZE bookmarks;
@@ -0,0 +1,11 @@
+-- Migration: Store HTTP cache validators on news sources
+-- Date: 2026-10-16
+-- The ETag and Last-Modified headers of the last successful fetch are sent
+-- back as If-None-Match / If-Modified-Since, so unchanged feeds answer 304
+-- and are not downloaded or parsed again.
+
+ALTER TABLE news_sources
+ADD COLUMN IF NOT EXISTS etag VARCHAR(500);
+
+ALTER TABLE news_sources
+ADD COLUMN IF NOT EXISTS last_modified VARCHAR(100);
@@ -17,7 +17,6 @@ CREATE TABLE IF NOT EXISTS notifications (
 );
 
 -- Create indexes for performance
-CREATE INDEX IF NOT EXISTS idx_notifications_user_id ON notifications(user_id);
 CREATE INDEX IF NOT EXISTS idx_notifications_user_created ON notifications(user_id, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_notifications_user_unread ON notifications(user_id, is_read);
 CREATE INDEX IF NOT EXISTS idx_notifications_type ON notifications(type);
@@ -0,0 +1,34 @@
+-- Migration: Partial indexes for the unread notification, active IOC and
+-- pending waitlist filters
+-- Date: 2026-10-16
+-- Only rows matching the hot predicate are indexed, so these stay a small
+-- fraction of the size of full-column indexes.
+
+-- Replace the full (user_id, is_read) index with a partial one
+DO $$
+BEGIN
+    IF EXISTS (SELECT FROM pg_indexes
+               WHERE indexname = 'idx_notifications_user_unread'
+               AND indexdef NOT LIKE '%WHERE%') THEN
+        DROP INDEX idx_notifications_user_unread;
+    END IF;
+END $$;
+
+-- notifications is partitioned, which does not support CONCURRENTLY
+CREATE INDEX IF NOT EXISTS idx_notifications_user_unread
+ON notifications (user_id, created_at)
+INCLUDE (type, title)
+WHERE is_read = false;
+
+-- Full-column is_read index is superseded by the partial index
+DROP INDEX IF EXISTS ix_notifications_is_read;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_ioc_active_type
+ON iocs (ioc_type)
+WHERE status = 'active';
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_waitlist_pending_notify
+ON waitlist_entries (created_at)
+WHERE is_verified = true AND notified = false;
+
+ANALYZE notifications;
@@ -0,0 +1,44 @@
+-- Migration: Server-side defaults for created/updated timestamps
+-- Date: 2026-10-16
+-- The models now leave these columns to DEFAULT now() instead of sending a
+-- Python timestamp with every insert; bulk COPY relies on the same default.
+
+DO $$
+DECLARE
+    col RECORD;
+BEGIN
+    FOR col IN
+        SELECT c.table_name, c.column_name
+        FROM information_schema.columns c
+        JOIN (VALUES
+            ('users', 'created_at'), ('users', 'updated_at'),
+            ('vulnerabilities', 'created_at'), ('vulnerabilities', 'updated_at'),
+            ('techniques', 'created_at'), ('techniques', 'updated_at'),
+            ('iocs', 'created_at'), ('iocs', 'updated_at'),
+            ('ingestion_runs', 'created_at'),
+            ('search_cache', 'created_at'),
+            ('email_verifications', 'created_at'),
+            ('comments', 'created_at'), ('comments', 'updated_at'),
+            ('comment_votes', 'created_at'), ('comment_votes', 'updated_at'),
+            ('bookmarks', 'created_at'),
+            ('cve_votes', 'created_at'), ('cve_votes', 'updated_at'),
+            ('notifications', 'created_at'),
+            ('news_sources', 'created_at'), ('news_sources', 'updated_at'),
+            ('news_articles', 'fetched_at'), ('news_articles', 'created_at'),
+            ('waitlist_entries', 'created_at'),
+            ('tech_stacks', 'created_at'), ('tech_stacks', 'updated_at'),
+            ('tech_stack_matches', 'matched_at'),
+            ('page_views', 'created_at'),
+            ('package_cpe_mappings', 'created_at'),
+            ('package_cpe_mappings', 'updated_at')
+        ) AS wanted(table_name, column_name)
+          ON c.table_name = wanted.table_name
+         AND c.column_name = wanted.column_name
+        WHERE c.table_schema = 'public' AND c.column_default IS NULL
+    LOOP
+        EXECUTE format(
+            'ALTER TABLE %I ALTER COLUMN %I SET DEFAULT now()',
+            col.table_name, col.column_name
+        );
+    END LOOP;
+END $$;
@@ -0,0 +1,63 @@
+-- Migration: Maintain denormalized vote counts with triggers
+-- Date: 2026-10-16
+-- Applies +/-1 deltas to vulnerabilities / comments upvotes and downvotes
+-- whenever a vote row is inserted, flipped or deleted, in the same
+-- statement as the vote write.
+
+CREATE OR REPLACE FUNCTION vote_delta_vuln()
+RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE vulnerabilities
+        SET upvotes = GREATEST(0, upvotes - CASE WHEN OLD.vote_type = 1 THEN 1 ELSE 0 END),
+            downvotes = GREATEST(0, downvotes - CASE WHEN OLD.vote_type = -1 THEN 1 ELSE 0 END)
+        WHERE cve_id = OLD.cve_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE vulnerabilities
+        SET upvotes = upvotes + CASE WHEN NEW.vote_type = 1 THEN 1 ELSE 0 END,
+            downvotes = downvotes + CASE WHEN NEW.vote_type = -1 THEN 1 ELSE 0 END
+        WHERE cve_id = NEW.cve_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION vote_delta_comment()
+RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE comments
+        SET upvotes = GREATEST(0, upvotes - CASE WHEN OLD.vote_type = 1 THEN 1 ELSE 0 END),
+            downvotes = GREATEST(0, downvotes - CASE WHEN OLD.vote_type = -1 THEN 1 ELSE 0 END)
+        WHERE id = OLD.comment_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE comments
+        SET upvotes = upvotes + CASE WHEN NEW.vote_type = 1 THEN 1 ELSE 0 END,
+            downvotes = downvotes + CASE WHEN NEW.vote_type = -1 THEN 1 ELSE 0 END
+        WHERE id = NEW.comment_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Create triggers once (avoids taking a table lock on every startup)
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT FROM pg_trigger WHERE tgname = 'trg_cve_votes_delta') THEN
+        CREATE TRIGGER trg_cve_votes_delta
+        AFTER INSERT OR DELETE OR UPDATE OF vote_type ON cve_votes
+        FOR EACH ROW EXECUTE FUNCTION vote_delta_vuln();
+    END IF;
+
+    IF NOT EXISTS (SELECT FROM pg_trigger WHERE tgname = 'trg_comment_votes_delta') THEN
+        CREATE TRIGGER trg_comment_votes_delta
+        AFTER INSERT OR DELETE OR UPDATE OF vote_type ON comment_votes
+        FOR EACH ROW EXECUTE FUNCTION vote_delta_comment();
+    END IF;
+END $$;
@@ -0,0 +1,17 @@
+-- Migration: Stored net vote score on vulnerabilities and comments
+-- Date: 2026-10-16
+-- Sorting by upvotes - downvotes had to compute and sort every row. A
+-- generated column can be indexed, so top-voted listings use an index scan.
+-- Adding a stored generated column rewrites the table once.
+
+ALTER TABLE vulnerabilities
+ADD COLUMN IF NOT EXISTS score INTEGER GENERATED ALWAYS AS (upvotes - downvotes) STORED;
+
+ALTER TABLE comments
+ADD COLUMN IF NOT EXISTS score INTEGER GENERATED ALWAYS AS (upvotes - downvotes) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vuln_score
+ON vulnerabilities (score DESC, upvotes DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_comments_cve_score
+ON comments (cve_id, score DESC);
@@ -0,0 +1,27 @@
+-- Migration: Turn the one-vote-per-user unique indexes into constraints
+-- Date: 2026-10-16
+-- The vote endpoints upsert with INSERT ... ON CONFLICT on these
+-- constraints. USING INDEX promotes the existing index without a rebuild.
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT FROM pg_constraint WHERE conname = 'uq_comment_votes') THEN
+        IF EXISTS (SELECT FROM pg_indexes WHERE indexname = 'idx_comment_votes_unique') THEN
+            ALTER TABLE comment_votes
+            ADD CONSTRAINT uq_comment_votes UNIQUE USING INDEX idx_comment_votes_unique;
+        ELSE
+            ALTER TABLE comment_votes
+            ADD CONSTRAINT uq_comment_votes UNIQUE (comment_id, user_id);
+        END IF;
+    END IF;
+
+    IF NOT EXISTS (SELECT FROM pg_constraint WHERE conname = 'uq_cve_votes') THEN
+        IF EXISTS (SELECT FROM pg_indexes WHERE indexname = 'idx_cve_votes_unique') THEN
+            ALTER TABLE cve_votes
+            ADD CONSTRAINT uq_cve_votes UNIQUE USING INDEX idx_cve_votes_unique;
+        ELSE
+            ALTER TABLE cve_votes
+            ADD CONSTRAINT uq_cve_votes UNIQUE (cve_id, user_id);
+        END IF;
+    END IF;
+END $$;
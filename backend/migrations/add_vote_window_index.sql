@@ -0,0 +1,11 @@
+-- Migration: Covering index for vote activity in a time window
+-- Date: 2026-10-16
+-- The trending endpoints count votes per CVE since a cutoff. Per-CVE vote
+-- tallies are stored on vulnerabilities, so this is the only place votes are
+-- aggregated. With cve_id included the range scan is index-only.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cve_votes_created_cve
+ON cve_votes (created_at)
+INCLUDE (cve_id);
+
+ANALYZE cve_votes;
@@ -0,0 +1,13 @@
+-- Migration: Indexes for the hottest vulnerability dashboard filters
+-- Date: 2026-10-16
+
+-- Exploited (KEV) vulnerabilities ordered by priority
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vuln_kev_priority
+ON vulnerabilities (priority_score DESC)
+WHERE exploited_in_the_wild = true;
+
+-- Severity filter ordered by publication date
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vuln_severity_published
+ON vulnerabilities (severity, published_at DESC);
+
+ANALYZE vulnerabilities;
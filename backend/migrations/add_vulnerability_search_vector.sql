@@ -0,0 +1,16 @@
+-- Migration: Full-text search vector for vulnerabilities
+-- Date: 2026-10-16
+-- Word searches over title/description use a stemmed tsvector instead of a
+-- trigram index on the description, which was large and matched stop
+-- words. Trigram indexes stay on cve_id and title for substring matching.
+-- Must match SEARCH_VECTOR_EXPRESSION in backend/models.py.
+
+ALTER TABLE vulnerabilities
+ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+    to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))
+) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vuln_search_fts
+ON vulnerabilities USING gin (search_vector);
+
+DROP INDEX CONCURRENTLY IF EXISTS ix_vuln_description_trgm;
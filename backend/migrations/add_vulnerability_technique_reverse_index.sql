@@ -0,0 +1,8 @@
+-- Migration: Reverse-order index on vulnerability_technique
+-- Date: 2026-10-16
+-- The (vulnerability_id, technique_id) primary key only serves lookups by
+-- vulnerability. Listing the vulnerabilities of a technique, and deletes
+-- on techniques checking the foreign key, need technique_id first.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vuln_technique_reverse
+ON vulnerability_technique (technique_id, vulnerability_id);
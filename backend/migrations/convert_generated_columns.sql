@@ -0,0 +1,36 @@
+-- Migration: Derive stored statistics with generated columns
+-- Date: 2026-10-16
+-- Columns that are pure functions of other columns in the same row are
+-- computed by PostgreSQL on write instead of by application code, so they
+-- cannot drift. Replacing a plain column rewrites the table once; the
+-- guards make later runs no-ops.
+
+-- tech_stacks.package_count = number of entries in packages
+DO $$
+BEGIN
+    IF EXISTS (SELECT FROM information_schema.columns
+               WHERE table_name = 'tech_stacks'
+               AND column_name = 'package_count'
+               AND is_generated = 'NEVER') THEN
+        ALTER TABLE tech_stacks DROP COLUMN package_count;
+    END IF;
+END $$;
+
+ALTER TABLE tech_stacks
+ADD COLUMN IF NOT EXISTS package_count INTEGER
+GENERATED ALWAYS AS (jsonb_array_length(packages)) STORED;
+
+-- ingestion_runs.duration_seconds = completed_at - started_at, in seconds
+DO $$
+BEGIN
+    IF EXISTS (SELECT FROM information_schema.columns
+               WHERE table_name = 'ingestion_runs'
+               AND column_name = 'duration_seconds'
+               AND is_generated = 'NEVER') THEN
+        ALTER TABLE ingestion_runs DROP COLUMN duration_seconds;
+    END IF;
+END $$;
+
+ALTER TABLE ingestion_runs
+ADD COLUMN IF NOT EXISTS duration_seconds DOUBLE PRECISION
+GENERATED ALWAYS AS (EXTRACT(EPOCH FROM (completed_at - started_at))) STORED;
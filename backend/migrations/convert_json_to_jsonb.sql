@@ -0,0 +1,91 @@
+-- Migration: Convert JSON columns to JSONB and index the array-like ones
+-- Date: 2026-10-16
+-- JSONB is stored pre-parsed and supports GIN indexes for @> containment
+
+-- Only converts columns that are still plain json (safe to re-run)
+DO $$
+DECLARE
+    col RECORD;
+BEGIN
+    FOR col IN
+        SELECT table_name, column_name
+        FROM information_schema.columns
+        WHERE data_type = 'json'
+        AND (table_name, column_name) IN (
+            ('vulnerabilities', 'cwe_ids'),
+            ('vulnerabilities', 'affected_products'),
+            ('vulnerabilities', 'vendors'),
+            ('vulnerabilities', 'products'),
+            ('vulnerabilities', 'references'),
+            ('vulnerabilities', 'sources'),
+            ('vulnerabilities', 'source_tags'),
+            ('techniques', 'tactics'),
+            ('techniques', 'platforms'),
+            ('techniques', 'data_sources'),
+            ('techniques', 'references'),
+            ('iocs', 'tags'),
+            ('iocs', 'context'),
+            ('ingestion_runs', 'error_details'),
+            ('ingestion_runs', 'config'),
+            ('search_cache', 'query_params'),
+            ('search_cache', 'results'),
+            ('news_articles', 'llm_key_points'),
+            ('news_articles', 'categories'),
+            ('news_articles', 'tags'),
+            ('news_articles', 'related_cves')
+        )
+    LOOP
+        EXECUTE format(
+            'ALTER TABLE %I ALTER COLUMN %I TYPE jsonb USING %I::jsonb',
+            col.table_name, col.column_name, col.column_name
+        );
+    END LOOP;
+END $$;
+
+-- GIN indexes for containment lookups. The vulnerability array columns
+-- use jsonb_path_ops (@> only, much smaller); rebuild any created with the
+-- default opclass.
+DO $$
+DECLARE
+    idx TEXT;
+BEGIN
+    FOREACH idx IN ARRAY ARRAY[
+        'ix_vuln_vendors_gin', 'ix_vuln_products_gin',
+        'ix_vuln_affected_products_gin', 'ix_vuln_cwe_ids_gin',
+        'ix_vuln_sources_gin'
+    ] LOOP
+        IF EXISTS (SELECT FROM pg_indexes
+                   WHERE indexname = idx
+                   AND indexdef NOT LIKE '%jsonb_path_ops%') THEN
+            EXECUTE format('DROP INDEX %I', idx);
+        END IF;
+    END LOOP;
+END $$;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vuln_vendors_gin
+ON vulnerabilities USING gin (vendors jsonb_path_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vuln_products_gin
+ON vulnerabilities USING gin (products jsonb_path_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vuln_affected_products_gin
+ON vulnerabilities USING gin (affected_products jsonb_path_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vuln_cwe_ids_gin
+ON vulnerabilities USING gin (cwe_ids jsonb_path_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vuln_sources_gin
+ON vulnerabilities USING gin (sources jsonb_path_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_ioc_tags_gin
+ON iocs USING gin (tags);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_news_categories_gin
+ON news_articles USING gin (categories);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_news_related_cves_gin
+ON news_articles USING gin (related_cves);
+
+ANALYZE vulnerabilities;
+ANALYZE iocs;
+ANALYZE news_articles;
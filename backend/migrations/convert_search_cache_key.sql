@@ -0,0 +1,16 @@
+-- Migration: Store search_cache.cache_key as a raw 16-byte digest
+-- Date: 2026-10-16
+-- Hex keys from the old scheme can never match the new digests, so the
+-- cached rows are dropped before the type change.
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT FROM information_schema.columns
+               WHERE table_name = 'search_cache'
+               AND column_name = 'cache_key'
+               AND data_type = 'character varying') THEN
+        DELETE FROM search_cache;
+        ALTER TABLE search_cache
+        ALTER COLUMN cache_key TYPE bytea USING decode(cache_key, 'hex');
+    END IF;
+END $$;
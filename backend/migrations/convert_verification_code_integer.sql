@@ -0,0 +1,22 @@
+-- Migration: Store email verification codes as integers
+-- Date: 2026-10-16
+-- A 6-digit code fits in 4 bytes; leading zeros are restored when the code
+-- is rendered (EmailVerification.format_code).
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT FROM information_schema.columns
+               WHERE table_name = 'email_verifications'
+               AND column_name = 'code'
+               AND data_type <> 'integer') THEN
+        ALTER TABLE email_verifications
+        ALTER COLUMN code TYPE INTEGER USING code::integer;
+    END IF;
+
+    IF NOT EXISTS (SELECT FROM pg_constraint
+                   WHERE conname = 'ck_email_verifications_code') THEN
+        ALTER TABLE email_verifications
+        ADD CONSTRAINT ck_email_verifications_code
+        CHECK (code BETWEEN 0 AND 999999);
+    END IF;
+END $$;
@@ -0,0 +1,36 @@
+-- Migration: Store vote_type as SMALLINT
+-- Date: 2026-10-16
+-- vote_type is only ever 1 or -1. The vote count triggers list vote_type
+-- in UPDATE OF, which blocks a type change, so they are dropped and
+-- recreated around the ALTER (same definitions as add_vote_count_triggers.sql).
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT FROM information_schema.columns
+               WHERE table_name = 'cve_votes'
+               AND column_name = 'vote_type'
+               AND data_type <> 'smallint') THEN
+        DROP TRIGGER IF EXISTS trg_cve_votes_delta ON cve_votes;
+
+        ALTER TABLE cve_votes
+        ALTER COLUMN vote_type TYPE SMALLINT;
+
+        CREATE TRIGGER trg_cve_votes_delta
+        AFTER INSERT OR DELETE OR UPDATE OF vote_type ON cve_votes
+        FOR EACH ROW EXECUTE FUNCTION vote_delta_vuln();
+    END IF;
+
+    IF EXISTS (SELECT FROM information_schema.columns
+               WHERE table_name = 'comment_votes'
+               AND column_name = 'vote_type'
+               AND data_type <> 'smallint') THEN
+        DROP TRIGGER IF EXISTS trg_comment_votes_delta ON comment_votes;
+
+        ALTER TABLE comment_votes
+        ALTER COLUMN vote_type TYPE SMALLINT;
+
+        CREATE TRIGGER trg_comment_votes_delta
+        AFTER INSERT OR DELETE OR UPDATE OF vote_type ON comment_votes
+        FOR EACH ROW EXECUTE FUNCTION vote_delta_comment();
+    END IF;
+END $$;
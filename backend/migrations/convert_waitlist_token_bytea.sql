@@ -0,0 +1,20 @@
+-- Migration: Store waitlist verification tokens as raw bytes
+-- Date: 2026-10-16
+-- Tokens were stored as their 43-character base64url text. The raw 32
+-- bytes make the unique index leaves smaller; links still carry base64url.
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT FROM information_schema.columns
+               WHERE table_name = 'waitlist_entries'
+               AND column_name = 'verification_token'
+               AND data_type <> 'bytea') THEN
+        ALTER TABLE waitlist_entries
+        ALTER COLUMN verification_token TYPE BYTEA
+        USING decode(
+            rpad(translate(verification_token, '-_', '+/'),
+                 ((length(verification_token) + 3) / 4) * 4, '='),
+            'base64'
+        );
+    END IF;
+END $$;
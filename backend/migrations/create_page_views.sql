@@ -19,9 +19,7 @@ CREATE TABLE IF NOT EXISTS page_views (
 CREATE INDEX IF NOT EXISTS idx_page_views_path ON page_views(path);
 CREATE INDEX IF NOT EXISTS idx_page_views_visitor_id ON page_views(visitor_id);
 CREATE INDEX IF NOT EXISTS idx_page_views_country ON page_views(country);
-CREATE INDEX IF NOT EXISTS idx_page_views_created_at ON page_views(created_at);
 CREATE INDEX IF NOT EXISTS idx_page_views_path_created ON page_views(path, created_at);
-CREATE INDEX IF NOT EXISTS idx_page_views_date ON page_views(created_at);
 
 -- Add comment
 COMMENT ON TABLE page_views IS 'Stores anonymous page view data for site analytics';
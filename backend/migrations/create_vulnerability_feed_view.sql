@@ -0,0 +1,45 @@
+-- Migration: Materialized view backing the vulnerability listing
+-- Date: 2026-10-16
+-- Precomputes the listing columns, vote score and technique IDs so the hot
+-- listing query reads one narrow, pre-sorted relation.
+-- Refreshed by the tasks.refresh_vulnerability_feed Celery beat job.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS vulnerability_feed_mv AS
+SELECT
+    v.id,
+    v.cve_id,
+    v.title,
+    v.description,
+    v.cvss_score,
+    v.cvss_vector,
+    v.severity,
+    v.exploited_in_the_wild,
+    v.priority_score,
+    v.published_at,
+    v.modified_at,
+    v.sources,
+    v.simple_title,
+    v.simple_description,
+    v.llm_processed,
+    v.upvotes,
+    v.downvotes,
+    (v.upvotes - v.downvotes) AS score,
+    array_remove(array_agg(t.technique_id), NULL) AS techniques
+FROM vulnerabilities v
+LEFT JOIN vulnerability_technique vt ON vt.vulnerability_id = v.id
+LEFT JOIN techniques t ON t.id = vt.technique_id
+WHERE v.cve_id LIKE 'CVE-%'
+GROUP BY v.id
+WITH DATA;
+
+-- Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_vuln_feed_id
+ON vulnerability_feed_mv (id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vuln_feed_priority_severity
+ON vulnerability_feed_mv (priority_score DESC, severity);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vuln_feed_severity_published
+ON vulnerability_feed_mv (severity, published_at DESC);
+
+ANALYZE vulnerability_feed_mv;
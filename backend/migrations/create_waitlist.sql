@@ -4,7 +4,7 @@
 CREATE TABLE IF NOT EXISTS waitlist_entries (
     id SERIAL PRIMARY KEY,
     email VARCHAR(255) NOT NULL UNIQUE,
-    verification_token VARCHAR(64) NOT NULL UNIQUE,
+    verification_token_hash BYTEA NOT NULL UNIQUE,
     is_verified BOOLEAN NOT NULL DEFAULT FALSE,
     verified_at TIMESTAMP WITH TIME ZONE,
     token_expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
@@ -14,5 +14,5 @@ CREATE TABLE IF NOT EXISTS waitlist_entries (
 
 -- Create indexes for performance
 CREATE INDEX IF NOT EXISTS idx_waitlist_email ON waitlist_entries(email);
-CREATE INDEX IF NOT EXISTS idx_waitlist_token ON waitlist_entries(verification_token);
+CREATE INDEX IF NOT EXISTS idx_waitlist_token ON waitlist_entries(verification_token_hash);
 CREATE INDEX IF NOT EXISTS idx_waitlist_is_verified ON waitlist_entries(is_verified);
@@ -0,0 +1,30 @@
+-- Migration: Drop single-column indexes covered by composite indexes
+-- Date: 2026-10-16
+-- Each of these columns leads a composite or unique index that already
+-- serves equality lookups on it, so the extra index only costs writes:
+--   comments.cve_id          -> idx_comments_cve_created
+--   comments.user_id         -> idx_comments_user_created
+--   comments.parent_id       -> idx_comments_parent
+--   comment_votes.comment_id -> uq_comment_votes
+--   comment_votes.user_id    -> idx_comment_votes_user
+--   cve_votes.cve_id         -> uq_cve_votes
+--   cve_votes.user_id        -> idx_cve_votes_user
+--   bookmarks.user_id        -> idx_bookmarks_user_created
+--   notifications.user_id    -> idx_notifications_user_created
+--   news_articles.source_id  -> idx_news_articles_source_published
+
+DROP INDEX CONCURRENTLY IF EXISTS ix_comments_cve_id;
+DROP INDEX CONCURRENTLY IF EXISTS idx_comments_cve_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_comments_user_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_comments_parent_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_comment_votes_comment_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_comment_votes_user_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_cve_votes_cve_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_cve_votes_user_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_bookmarks_user_id;
+DROP INDEX CONCURRENTLY IF EXISTS idx_bookmarks_user_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_news_articles_source_id;
+
+-- notifications is partitioned, which does not support CONCURRENTLY
+DROP INDEX IF EXISTS ix_notifications_user_id;
+DROP INDEX IF EXISTS idx_notifications_user_id;
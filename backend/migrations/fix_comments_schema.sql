@@ -22,7 +22,6 @@ ADD CONSTRAINT comments_cve_id_fkey
 FOREIGN KEY (cve_id) REFERENCES vulnerabilities(cve_id);
 
 -- Step 5: Create index on cve_id for performance
-CREATE INDEX IF NOT EXISTS idx_comments_cve_id ON comments(cve_id);
 CREATE INDEX IF NOT EXISTS idx_comments_cve_created ON comments(cve_id, created_at);
 
 -- Step 6: Drop old indexes and constraints related to vulnerability_id
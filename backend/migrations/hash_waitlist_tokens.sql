@@ -0,0 +1,19 @@
+-- Migration: Store only a SHA-256 digest of waitlist verification tokens
+-- Date: 2026-10-16
+-- Verification links carry the raw token; the database keeps its digest,
+-- like password hashes, so a leaked dump cannot verify signups. Runs after
+-- create_waitlist.sql and convert_waitlist_token_bytea.sql; the rename
+-- marks rows as hashed so they are only hashed once.
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT FROM information_schema.columns
+               WHERE table_name = 'waitlist_entries'
+               AND column_name = 'verification_token') THEN
+        ALTER TABLE waitlist_entries
+        RENAME COLUMN verification_token TO verification_token_hash;
+
+        UPDATE waitlist_entries
+        SET verification_token_hash = sha256(verification_token_hash);
+    END IF;
+END $$;
@@ -0,0 +1,171 @@
+-- Migration: Range-partition notifications, ingestion_runs and page_views by month
+-- Date: 2026-10-16
+-- These tables only grow and are read by recent time range. Monthly
+-- partitions allow partition pruning, per-partition vacuum and dropping old
+-- months cheaply. Upcoming partitions are created on every startup and by
+-- the tasks.ensure_partitions Celery beat job; a DEFAULT partition catches
+-- anything outside the pre-created range.
+
+-- Create monthly partitions from from_date's month through months_ahead
+CREATE OR REPLACE FUNCTION ensure_monthly_partitions(
+    parent TEXT,
+    from_date DATE DEFAULT CURRENT_DATE,
+    months_ahead INTEGER DEFAULT 3
+)
+RETURNS void AS $$
+DECLARE
+    month_start DATE := date_trunc('month', from_date)::date;
+    last_month DATE := date_trunc(
+        'month', CURRENT_DATE + make_interval(months => months_ahead)
+    )::date;
+    partition_name TEXT;
+BEGIN
+    WHILE month_start <= last_month LOOP
+        partition_name := parent || '_' || to_char(month_start, 'YYYY_MM');
+        IF to_regclass(partition_name) IS NULL THEN
+            BEGIN
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                    partition_name,
+                    parent,
+                    month_start,
+                    (month_start + INTERVAL '1 month')::date
+                );
+            EXCEPTION WHEN others THEN
+                -- e.g. rows for this month already sit in the DEFAULT partition
+                RAISE WARNING 'Could not create partition %: %', partition_name, SQLERRM;
+            END;
+        END IF;
+        month_start := (month_start + INTERVAL '1 month')::date;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Convert a plain table into a monthly range-partitioned one, keeping its
+-- rows, serial sequence, indexes, foreign keys and triggers. No-op if the
+-- table is missing or already partitioned.
+CREATE OR REPLACE FUNCTION partition_table_by_month(parent TEXT, partition_key TEXT)
+RETURNS void AS $$
+DECLARE
+    legacy TEXT := parent || '_unpartitioned';
+    oldest DATE;
+    seq TEXT;
+    index_defs TEXT[];
+    fk_defs TEXT[];
+    trigger_defs TEXT[];
+    columns TEXT;
+    def TEXT;
+BEGIN
+    IF NOT EXISTS (SELECT FROM pg_class
+                   WHERE relname = parent AND relkind = 'r') THEN
+        RETURN;
+    END IF;
+
+    -- Capture definitions while they still reference the original name
+    SELECT array_agg(pg_get_indexdef(indexrelid)) INTO index_defs
+    FROM pg_index
+    WHERE indrelid = parent::regclass AND NOT indisprimary;
+
+    SELECT array_agg(format(
+        'ALTER TABLE %I ADD CONSTRAINT %I %s',
+        parent, conname, pg_get_constraintdef(oid)
+    )) INTO fk_defs
+    FROM pg_constraint
+    WHERE conrelid = parent::regclass AND contype = 'f';
+
+    -- Dropping the old table drops its triggers with it
+    SELECT array_agg(pg_get_triggerdef(oid)) INTO trigger_defs
+    FROM pg_trigger
+    WHERE tgrelid = parent::regclass AND NOT tgisinternal;
+
+    EXECUTE format('ALTER TABLE %I RENAME TO %I', parent, legacy);
+    EXECUTE format(
+        'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING GENERATED) '
+        'PARTITION BY RANGE (%I)',
+        parent, legacy, partition_key
+    );
+
+    EXECUTE format(
+        'SELECT min(%I)::date FROM %I', partition_key, legacy
+    ) INTO oldest;
+    PERFORM ensure_monthly_partitions(parent, COALESCE(oldest, CURRENT_DATE));
+    EXECUTE format(
+        'CREATE TABLE %I PARTITION OF %I DEFAULT', parent || '_default', parent
+    );
+
+    -- Generated columns are recomputed on insert and cannot be copied
+    SELECT string_agg(quote_ident(attname), ', ' ORDER BY attnum) INTO columns
+    FROM pg_attribute
+    WHERE attrelid = legacy::regclass
+      AND attnum > 0 AND NOT attisdropped AND attgenerated = '';
+
+    EXECUTE format(
+        'INSERT INTO %I (%s) SELECT %s FROM %I', parent, columns, columns, legacy
+    );
+
+    -- Keep the id sequence alive when the old table is dropped
+    seq := pg_get_serial_sequence(legacy, 'id');
+    IF seq IS NOT NULL THEN
+        EXECUTE format('ALTER SEQUENCE %s OWNED BY %I.id', seq, parent);
+    END IF;
+
+    EXECUTE format('DROP TABLE %I', legacy);
+
+    -- Unique constraints on a partitioned table must include the key
+    EXECUTE format(
+        'ALTER TABLE %I ADD PRIMARY KEY (id, %I)', parent, partition_key
+    );
+
+    FOREACH def IN ARRAY COALESCE(index_defs, '{}') LOOP
+        BEGIN
+            EXECUTE def;
+        EXCEPTION WHEN others THEN
+            RAISE WARNING 'Skipped index on %: %', parent, SQLERRM;
+        END;
+    END LOOP;
+
+    FOREACH def IN ARRAY COALESCE(fk_defs, '{}') LOOP
+        EXECUTE def;
+    END LOOP;
+
+    FOREACH def IN ARRAY COALESCE(trigger_defs, '{}') LOOP
+        EXECUTE def;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Drop monthly partitions that ended before the last keep_months months;
+-- returns how many were dropped
+CREATE OR REPLACE FUNCTION drop_monthly_partitions(parent TEXT, keep_months INTEGER)
+RETURNS INTEGER AS $$
+DECLARE
+    cutoff DATE := (
+        date_trunc('month', CURRENT_DATE) - make_interval(months => keep_months)
+    )::date;
+    partition_name TEXT;
+    dropped INTEGER := 0;
+BEGIN
+    FOR partition_name IN
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = parent::regclass
+          AND c.relname ~ ('^' || parent || '_\d{4}_\d{2}$')
+    LOOP
+        IF to_date(right(partition_name, 7), 'YYYY_MM') < cutoff THEN
+            EXECUTE format('DROP TABLE %I', partition_name);
+            dropped := dropped + 1;
+        END IF;
+    END LOOP;
+    RETURN dropped;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT partition_table_by_month('notifications', 'created_at');
+SELECT partition_table_by_month('ingestion_runs', 'started_at');
+SELECT partition_table_by_month('page_views', 'created_at');
+
+-- Keep upcoming months pre-created
+SELECT ensure_monthly_partitions('notifications');
+SELECT ensure_monthly_partitions('ingestion_runs');
+SELECT ensure_monthly_partitions('page_views');
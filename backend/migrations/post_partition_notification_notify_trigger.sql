@@ -0,0 +1,27 @@
+-- Migration: Announce new notifications with NOTIFY
+-- Date: 2026-10-16
+-- Each insert sends the recipient's user id on the "notifications"
+-- channel. The API listens on it and pushes unread counts to connected
+-- clients instead of having them poll.
+-- Named to sort after add_notifications.sql and
+-- partition_time_series_tables.sql, which create and rebuild the table.
+
+CREATE OR REPLACE FUNCTION notify_new_notification()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('notifications', NEW.user_id::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+BEGIN
+    IF to_regclass('notifications') IS NOT NULL
+       AND NOT EXISTS (SELECT FROM pg_trigger
+                       WHERE tgrelid = to_regclass('notifications')
+                         AND tgname = 'trg_notifications_notify') THEN
+        CREATE TRIGGER trg_notifications_notify
+        AFTER INSERT ON notifications
+        FOR EACH ROW EXECUTE FUNCTION notify_new_notification();
+    END IF;
+END $$;
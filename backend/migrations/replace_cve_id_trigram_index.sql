@@ -0,0 +1,11 @@
+-- Migration: Replace the cve_id trigram index with a prefix index
+-- Date: 2026-10-16
+-- CVE IDs are searched by prefix ("CVE-2024-", "2024-3094"), never by an
+-- arbitrary substring, so a text_pattern_ops B-tree serves LIKE 'CVE-...%'
+-- regardless of the database collation, at a fraction of the GIN index's
+-- size and write cost. Exact lookups keep using the unique index.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vuln_cve_id_prefix
+ON vulnerabilities (cve_id text_pattern_ops);
+
+DROP INDEX CONCURRENTLY IF EXISTS ix_vuln_cve_id_trgm;
@@ -0,0 +1,16 @@
+-- Migration: Split IOC value indexes into exact and substring lookups
+-- Date: 2026-10-16
+-- IOCs are mostly looked up by exact type and value. A (ioc_type, value)
+-- B-tree serves that and replaces the single-column ioc_type and value
+-- indexes. Substring search moves from a GIN to a GiST trigram index,
+-- which is smaller and cheaper to maintain for values up to 2000 chars.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ioc_type_value
+ON iocs (ioc_type, value);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_ioc_value_gist_trgm
+ON iocs USING gist (value gist_trgm_ops);
+
+DROP INDEX CONCURRENTLY IF EXISTS ix_iocs_ioc_type;
+DROP INDEX CONCURRENTLY IF EXISTS ix_iocs_value;
+DROP INDEX CONCURRENTLY IF EXISTS ix_ioc_value_trgm;
@@ -15,6 +15,59 @@ from backend.database import engine
 logger = logging.getLogger(__name__)
 
 
+def split_statements(sql):
+    """
+    Split a migration script into individual statements.
+
+    Postgres runs a multi-statement query string as one implicit transaction,
+    which rejects CREATE INDEX CONCURRENTLY. Semicolons inside quotes,
+    comments and dollar-quoted bodies ($$ ... $$) are left alone.
+    """
+    statements = []
+    start = 0
+    i = 0
+    length = len(sql)
+
+    while i < length:
+        char = sql[i]
+
+        if char == "-" and sql.startswith("--", i):
+            end = sql.find("\n", i)
+            i = length if end == -1 else end + 1
+            continue
+
+        if char == "'":
+            end = sql.find("'", i + 1)
+            i = length if end == -1 else end + 1
+            continue
+
+        if char == "$":
+            tag_end = sql.find("$", i + 1)
+            tag = sql[i : tag_end + 1] if tag_end != -1 else ""
+            if tag and (tag == "$$" or tag[1:-1].isidentifier()):
+                end = sql.find(tag, tag_end + 1)
+                i = length if end == -1 else end + len(tag)
+                continue
+
+        if char == ";":
+            statements.append(sql[start:i])
+            start = i + 1
+
+        i += 1
+
+    statements.append(sql[start:])
+
+    # Drop fragments that only contain whitespace and comments
+    return [
+        statement.strip()
+        for statement in statements
+        if any(
+            line.strip() and not line.strip().startswith("--")
+            for line in statement.splitlines()
+        )
+    ]
+
+
 def run_migrations():
     """
     Run all SQL migrations in the migrations directory.
@@ -29,23 +82,24 @@ def run_migrations():
 
     logger.info(f"Found {len(migration_files)} migration file(s)")
 
-    with engine.connect() as conn:
-        for migration_file in migration_files:
-            logger.info(f"Running migration: {migration_file.name}")
+    # Read all migration files up front so the SQL loop only talks to the DB
+    migrations = [(path.name, path.read_text()) for path in migration_files]
 
-            try:
-                # Read migration file
-                with open(migration_file, "r") as f:
-                    migration_sql = f.read()
+    # Migrations are idempotent DDL, so run them in autocommit mode instead of
+    # wrapping each file in its own transaction
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for name, migration_sql in migrations:
+            logger.info(f"Running migration: {name}")
 
-                # Execute migration
-                conn.execute(text(migration_sql))
-                conn.commit()
+            try:
+                # Execute statements one by one so CONCURRENTLY works
+                for statement in split_statements(migration_sql):
+                    conn.execute(text(statement))
 
-                logger.info(f"✓ Migration {migration_file.name} completed successfully")
+                logger.info(f"✓ Migration {name} completed successfully")
 
             except Exception as e:
-                logger.error(f"✗ Migration {migration_file.name} failed: {e}")
+                logger.error(f"✗ Migration {name} failed: {e}")
                 # Don't raise - continue with other migrations
                 # This allows partial migrations to succeed
 
@@ -2,27 +2,43 @@
 SQLAlchemy database models for OpenThreat.
 """
 
-import enum
+import hashlib
+import json
 import secrets
-import string
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import JSON, Boolean, Column, Date, DateTime
+from sqlalchemy import Boolean, CheckConstraint, Column, Computed, Date, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import Float, ForeignKey, Index, Integer, String, Table, Text
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    MetaData,
+    SmallInteger,
+    String,
+    Table,
+    Text,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy.sql import func
 
 from .database import Base
+from .schemas.enums import UserRole
 
+# Must match the search_vector expression in add_vulnerability_search_vector.sql
+SEARCH_VECTOR_EXPRESSION = (
+    "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))"
+)
 
-# User roles enum
-class UserRole(str, enum.Enum):
-    """User role definitions."""
 
-    ADMIN = "admin"
-    ANALYST = "analyst"
-    VIEWER = "viewer"
+def _utcnow() -> datetime:
+    """Timezone-aware current time for Python-side expiry checks."""
+    return datetime.now(timezone.utc)
 
 
 class User(Base):
@@ -55,13 +71,13 @@ class User(Base):
     # Timestamps
     created_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
     )
     updated_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
     last_login_at = Column(DateTime(timezone=True), nullable=True)
@@ -82,6 +98,9 @@ vulnerability_technique = Table(
         "vulnerability_id", Integer, ForeignKey("vulnerabilities.id"), primary_key=True
     ),
     Column("technique_id", Integer, ForeignKey("techniques.id"), primary_key=True),
+    # The primary key covers vulnerability -> techniques; this covers the
+    # reverse lookup and the technique_id foreign key
+    Index("ix_vuln_technique_reverse", "technique_id", "vulnerability_id"),
 )
 
 
@@ -99,6 +118,12 @@ class Vulnerability(Base):
     title = Column(String(500), nullable=False)
     description = Column(Text, nullable=True)
 
+    # Full-text search document over title and description; deferred since
+    # it is only ever used in WHERE clauses
+    search_vector = deferred(
+        Column(TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True))
+    )
+
     # CVSS scoring
     cvss_score = Column(Float, nullable=True, index=True)
     cvss_vector = Column(String(200), nullable=True)
@@ -114,20 +139,20 @@ class Vulnerability(Base):
     exploited_in_the_wild = Column(Boolean, default=False, nullable=False, index=True)
     cisa_due_date = Column(Date, nullable=True)
 
-    # CWE weaknesses (stored as JSON array)
-    cwe_ids = Column(JSON, nullable=True)  # ["CWE-79", "CWE-89"]
+    # CWE weaknesses (stored as JSONB array)
+    cwe_ids = Column(JSONB, nullable=True)  # ["CWE-79", "CWE-89"]
 
-    # Affected products (stored as JSON array)
-    affected_products = Column(JSON, nullable=True)  # ["vendor:product:version"]
-    vendors = Column(JSON, nullable=True)  # ["microsoft", "apache"]
-    products = Column(JSON, nullable=True)  # ["windows", "http_server"]
+    # Affected products (stored as JSONB arrays, GIN-indexed for containment)
+    affected_products = Column(JSONB, nullable=True)  # ["vendor:product:version"]
+    vendors = Column(JSONB, nullable=True)  # ["microsoft", "apache"]
+    products = Column(JSONB, nullable=True)  # ["windows", "http_server"]
 
     # References (stored as JSON array of objects)
-    references = Column(JSON, nullable=True)  # [{"url": "...", "type": "patch"}]
+    references = Column(JSONB, nullable=True)  # [{"url": "...", "type": "patch"}]
 
     # Source tracking
-    sources = Column(JSON, nullable=True)  # ["cisa", "nvd_cve", "eu_cve_search"]
-    source_tags = Column(JSON, nullable=True)  # Additional tags from sources
+    sources = Column(JSONB, nullable=True)  # ["cisa", "nvd_cve", "eu_cve_search"]
+    source_tags = Column(JSONB, nullable=True)  # Additional tags from sources
 
     # Priority score (computed)
     priority_score = Column(Float, nullable=True, index=True)
@@ -145,17 +170,18 @@ class Vulnerability(Base):
     # Vote counts (denormalized for performance)
     upvotes = Column(Integer, default=0, nullable=False)
     downvotes = Column(Integer, default=0, nullable=False)
+    score = Column(Integer, Computed("upvotes - downvotes", persisted=True))
 
     # Metadata
     created_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
     )
     updated_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
 
@@ -167,10 +193,9 @@ class Vulnerability(Base):
     # Indexes for full-text search (PostgreSQL specific)
     __table_args__ = (
         Index(
-            "ix_vuln_cve_id_trgm",
+            "ix_vuln_cve_id_prefix",
             "cve_id",
-            postgresql_using="gin",
-            postgresql_ops={"cve_id": "gin_trgm_ops"},
+            postgresql_ops={"cve_id": "text_pattern_ops"},
         ),
         Index(
             "ix_vuln_title_trgm",
@@ -178,15 +203,89 @@ class Vulnerability(Base):
             postgresql_using="gin",
             postgresql_ops={"title": "gin_trgm_ops"},
         ),
+        Index("ix_vuln_search_fts", "search_vector", postgresql_using="gin"),
+        # Dashboard filters: exploited CVEs by priority, severity by date
+        Index(
+            "ix_vuln_kev_priority",
+            text("priority_score DESC"),
+            postgresql_where=text("exploited_in_the_wild = true"),
+        ),
+        Index("ix_vuln_severity_published", "severity", text("published_at DESC")),
+        # Containment lookups (vendors @> '["Microsoft"]'); jsonb_path_ops
+        # only supports @> but is much smaller than the default opclass
+        Index(
+            "ix_vuln_vendors_gin",
+            "vendors",
+            postgresql_using="gin",
+            postgresql_ops={"vendors": "jsonb_path_ops"},
+        ),
         Index(
-            "ix_vuln_description_trgm",
-            "description",
+            "ix_vuln_products_gin",
+            "products",
             postgresql_using="gin",
-            postgresql_ops={"description": "gin_trgm_ops"},
+            postgresql_ops={"products": "jsonb_path_ops"},
         ),
+        Index(
+            "ix_vuln_affected_products_gin",
+            "affected_products",
+            postgresql_using="gin",
+            postgresql_ops={"affected_products": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_vuln_cwe_ids_gin",
+            "cwe_ids",
+            postgresql_using="gin",
+            postgresql_ops={"cwe_ids": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_vuln_sources_gin",
+            "sources",
+            postgresql_using="gin",
+            postgresql_ops={"sources": "jsonb_path_ops"},
+        ),
+        # Top-voted ordering in the trending API
+        Index("ix_vuln_score", text("score DESC"), text("upvotes DESC")),
     )
 
 
+# The feed is a materialized view created by a SQL migration; it lives on its
+# own MetaData so Base.metadata.create_all() never tries to create it as a table
+vulnerability_feed_mv = Table(
+    "vulnerability_feed_mv",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("cve_id", String(20)),
+    Column("title", String(500)),
+    Column("description", Text),
+    Column("cvss_score", Float),
+    Column("cvss_vector", String(200)),
+    Column("severity", String(20)),
+    Column("exploited_in_the_wild", Boolean),
+    Column("priority_score", Float),
+    Column("published_at", DateTime(timezone=True)),
+    Column("modified_at", DateTime(timezone=True)),
+    Column("sources", JSONB),
+    Column("simple_title", String(200)),
+    Column("simple_description", Text),
+    Column("llm_processed", Boolean),
+    Column("upvotes", Integer),
+    Column("downvotes", Integer),
+    Column("score", Integer),
+    Column("techniques", ARRAY(String(20))),
+)
+
+
+class VulnerabilityFeed(Base):
+    """
+    Read-only listing rows from the vulnerability_feed_mv materialized view.
+
+    Refreshed periodically, so values may lag the vulnerabilities table by a
+    few minutes.
+    """
+
+    __table__ = vulnerability_feed_mv
+
+
 class Technique(Base):
     """
     MITRE ATT&CK techniques and tactics.
@@ -202,29 +301,29 @@ class Technique(Base):
     description = Column(Text, nullable=True)
 
     # Tactics (stored as JSON array)
-    tactics = Column(JSON, nullable=True)  # ["initial-access", "execution"]
+    tactics = Column(JSONB, nullable=True)  # ["initial-access", "execution"]
 
     # Platforms and data sources
-    platforms = Column(JSON, nullable=True)  # ["Windows", "Linux"]
-    data_sources = Column(JSON, nullable=True)
+    platforms = Column(JSONB, nullable=True)  # ["Windows", "Linux"]
+    data_sources = Column(JSONB, nullable=True)
 
     # Detection and mitigation
     detection = Column(Text, nullable=True)
     mitigation = Column(Text, nullable=True)
 
     # References
-    references = Column(JSON, nullable=True)
+    references = Column(JSONB, nullable=True)
 
     # Metadata
     created_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
     )
     updated_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
 
@@ -244,14 +343,12 @@ class IOC(Base):
     id = Column(Integer, primary_key=True, index=True)
 
     # IOC details
-    ioc_type = Column(
-        String(50), nullable=False, index=True
-    )  # url, domain, ip, hash, email
-    value = Column(String(2000), nullable=False, index=True)
+    ioc_type = Column(String(50), nullable=False)  # url, domain, ip, hash, email
+    value = Column(String(2000), nullable=False)
 
     # Threat classification
     threat_type = Column(String(100), nullable=True)  # malware, phishing, c2, etc.
-    tags = Column(JSON, nullable=True)  # ["ransomware", "apt28"]
+    tags = Column(JSONB, nullable=True)  # ["ransomware", "apt28"]
 
     # Confidence and status
     confidence = Column(Float, nullable=True)  # 0.0 to 1.0
@@ -269,28 +366,38 @@ class IOC(Base):
     source_url = Column(String(500), nullable=True)
 
     # Additional context
-    context = Column(JSON, nullable=True)  # Flexible field for source-specific data
+    context = Column(JSONB, nullable=True)  # Flexible field for source-specific data
 
     # Metadata
     created_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
     )
     updated_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
 
     # Indexes
     __table_args__ = (
+        # Exact lookups ("is this hash known?")
+        Index("idx_ioc_type_value", "ioc_type", "value"),
+        # Substring search; GiST stays smaller and cheaper to update than GIN
+        # on values this long
         Index(
-            "ix_ioc_value_trgm",
+            "ix_ioc_value_gist_trgm",
             "value",
-            postgresql_using="gin",
-            postgresql_ops={"value": "gin_trgm_ops"},
+            postgresql_using="gist",
+            postgresql_ops={"value": "gist_trgm_ops"},
+        ),
+        Index("ix_ioc_tags_gin", "tags", postgresql_using="gin"),
+        Index(
+            "ix_ioc_active_type",
+            "ioc_type",
+            postgresql_where=text("status = 'active'"),
         ),
     )
 
@@ -315,22 +422,30 @@ class IngestionRun(Base):
     records_failed = Column(Integer, default=0)
 
     # Timing
-    started_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    started_at = Column(DateTime(timezone=True), nullable=False)
     completed_at = Column(DateTime(timezone=True), nullable=True)
-    duration_seconds = Column(Float, nullable=True)
+    duration_seconds = Column(
+        Float,
+        Computed("EXTRACT(EPOCH FROM (completed_at - started_at))", persisted=True),
+    )
 
     # Error tracking
     error_message = Column(Text, nullable=True)
-    error_details = Column(JSON, nullable=True)
+    error_details = Column(JSONB, nullable=True)
 
     # Metadata
-    config = Column(JSON, nullable=True)  # Store run configuration
+    config = Column(JSONB, nullable=True)  # Store run configuration
     created_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
     )
 
+    # Runs are append-only in start order, so a BRIN index is enough
+    __table_args__ = (
+        Index("ix_ingestion_started_brin", "started_at", postgresql_using="brin"),
+    )
+
 
 class SearchCache(Base):
     """
@@ -341,29 +456,41 @@ class SearchCache(Base):
 
     id = Column(Integer, primary_key=True, index=True)
 
-    # Cache key (hash of query parameters)
-    cache_key = Column(String(64), unique=True, nullable=False, index=True)
+    # Cache key (raw 16-byte digest of query parameters, see make_key)
+    cache_key = Column(LargeBinary(16), unique=True, nullable=False, index=True)
 
     # Query details
     query_type = Column(
         String(50), nullable=False
     )  # vulnerability_search, ioc_search, etc.
-    query_params = Column(JSON, nullable=False)
+    query_params = Column(JSONB, nullable=False)
 
-    # Cached results
-    results = Column(JSON, nullable=False)
+    # Cached results (deferred: only loaded when serving a hit)
+    results = deferred(Column(JSONB, nullable=False))
     result_count = Column(Integer, nullable=False)
 
     # Cache metadata
     created_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
-        index=True,
     )
-    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
     hit_count = Column(Integer, default=0)
 
+    # Entries are inserted in time order; BRIN covers the range scans used
+    # for expiry while the B-tree stays on cache_key for point lookups
+    __table_args__ = (
+        Index("ix_search_cache_created_brin", "created_at", postgresql_using="brin"),
+        Index("ix_search_cache_expires_brin", "expires_at", postgresql_using="brin"),
+    )
+
+    @staticmethod
+    def make_key(query_type: str, query_params: dict) -> bytes:
+        """Hash a query into the 16-byte cache key."""
+        payload = json.dumps([query_type, query_params], sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
 
 class EmailVerification(Base):
     """
@@ -377,7 +504,14 @@ class EmailVerification(Base):
         Integer, ForeignKey("users.id"), nullable=True, index=True
     )  # Nullable for registration
     email = Column(String(255), nullable=False, index=True)
-    code = Column(String(6), nullable=False)
+    # Stored as a number; render with format_code to keep leading zeros
+    code = Column(
+        Integer,
+        CheckConstraint(
+            "code BETWEEN 0 AND 999999", name="ck_email_verifications_code"
+        ),
+        nullable=False,
+    )
 
     # Type: 'registration' or 'email_change'
     verification_type = Column(String(20), nullable=False)
@@ -388,7 +522,7 @@ class EmailVerification(Base):
     # Timestamps
     created_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
     )
     expires_at = Column(DateTime(timezone=True), nullable=False)
@@ -398,18 +532,23 @@ class EmailVerification(Base):
     user = relationship("User", backref="email_verifications")
 
     @staticmethod
-    def generate_code() -> str:
+    def generate_code() -> int:
         """Generate a 6-digit verification code."""
-        return "".join(secrets.choice(string.digits) for _ in range(6))
+        return secrets.randbelow(1_000_000)
+
+    @staticmethod
+    def format_code(code: int) -> str:
+        """Render a code as the six digits the user types in."""
+        return f"{code:06d}"
 
     @staticmethod
     def get_expiry_time() -> datetime:
         """Get expiry time (15 minutes from now)."""
-        return datetime.now(timezone.utc) + timedelta(minutes=15)
+        return _utcnow() + timedelta(minutes=15)
 
     def is_expired(self) -> bool:
         """Check if code is expired."""
-        return datetime.now(timezone.utc) > self.expires_at
+        return _utcnow() > self.expires_at
 
     def is_valid(self) -> bool:
         """Check if code is valid (not used and not expired)."""
@@ -430,24 +569,27 @@ class Comment(Base):
     content = Column(Text, nullable=False)
 
     # Relationships
-    cve_id = Column(
-        String(50), ForeignKey("vulnerabilities.cve_id"), nullable=False, index=True
-    )
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    cve_id = Column(String(50), ForeignKey("vulnerabilities.cve_id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     parent_id = Column(
-        Integer, ForeignKey("comments.id"), nullable=True, index=True
+        Integer, ForeignKey("comments.id"), nullable=True
     )  # For nested comments
 
+    # Author details (denormalized so listings need no users join; kept in
+    # sync by the trg_users_sync_comment_author trigger)
+    author_username = Column(String(100), nullable=False)
+    author_role = Column(String(20), nullable=False)
+
     # Metadata
     created_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
     )
     updated_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
     is_edited = Column(Boolean, default=False, nullable=False)
@@ -456,6 +598,7 @@ class Comment(Base):
     # Vote counts (denormalized for performance)
     upvotes = Column(Integer, default=0, nullable=False)
     downvotes = Column(Integer, default=0, nullable=False)
+    score = Column(Integer, Computed("upvotes - downvotes", persisted=True))
 
     # Relationships
     user = relationship("User", backref="comments")
@@ -467,13 +610,20 @@ class Comment(Base):
 
     # Indexes for performance
     __table_args__ = (
-        Index("idx_comments_cve_created", "cve_id", "created_at"),
+        # Covers the per-CVE comment listing without heap fetches
+        Index(
+            "idx_comments_cve_created",
+            "cve_id",
+            "created_at",
+            postgresql_include=["user_id", "upvotes", "downvotes", "is_deleted"],
+        ),
         Index("idx_comments_user_created", "user_id", "created_at"),
         Index("idx_comments_parent", "parent_id"),
+        Index("idx_comments_cve_score", "cve_id", text("score DESC")),
     )
 
     def __repr__(self):
-        return f"<Comment(id={self.id}, cve_id={self.cve_id}, user={self.user.username if self.user else 'Unknown'})>"
+        return f"<Comment(id={self.id}, cve_id={self.cve_id}, user={self.author_username})>"
 
 
 class CommentVote(Base):
@@ -487,22 +637,22 @@ class CommentVote(Base):
     id = Column(Integer, primary_key=True, index=True)
 
     # Relationships
-    comment_id = Column(Integer, ForeignKey("comments.id"), nullable=False, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    comment_id = Column(Integer, ForeignKey("comments.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
 
     # Vote type: 1 for upvote, -1 for downvote
-    vote_type = Column(Integer, nullable=False)  # 1 or -1
+    vote_type = Column(SmallInteger, nullable=False)  # 1 or -1
 
     # Metadata
     created_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
     )
     updated_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
 
@@ -510,9 +660,9 @@ class CommentVote(Base):
     comment = relationship("Comment", back_populates="votes")
     user = relationship("User", backref="comment_votes")
 
-    # Constraints: one vote per user per comment
+    # Constraints: one vote per user per comment (ON CONFLICT target for upserts)
     __table_args__ = (
-        Index("idx_comment_votes_unique", "comment_id", "user_id", unique=True),
+        UniqueConstraint("comment_id", "user_id", name="uq_comment_votes"),
         Index("idx_comment_votes_user", "user_id"),
     )
 
@@ -529,13 +679,13 @@ class Bookmark(Base):
     __tablename__ = "bookmarks"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     cve_id = Column(
         String(50), ForeignKey("vulnerabilities.cve_id"), nullable=False, index=True
     )
     created_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
     )
     notes = Column(Text, nullable=True)
@@ -546,7 +696,12 @@ class Bookmark(Base):
 
     # Constraints
     __table_args__ = (
-        Index("idx_bookmarks_user_created", "user_id", "created_at"),
+        Index(
+            "idx_bookmarks_user_created",
+            "user_id",
+            "created_at",
+            postgresql_include=["cve_id"],
+        ),
         {"extend_existing": True},
     )
 
@@ -562,24 +717,22 @@ class CVEVote(Base):
     id = Column(Integer, primary_key=True, index=True)
 
     # Relationships
-    cve_id = Column(
-        String(50), ForeignKey("vulnerabilities.cve_id"), nullable=False, index=True
-    )
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    cve_id = Column(String(50), ForeignKey("vulnerabilities.cve_id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
 
     # Vote type: 1 for upvote, -1 for downvote
-    vote_type = Column(Integer, nullable=False)  # 1 or -1
+    vote_type = Column(SmallInteger, nullable=False)  # 1 or -1
 
     # Metadata
     created_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
     )
     updated_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
 
@@ -587,11 +740,17 @@ class CVEVote(Base):
     vulnerability = relationship("Vulnerability", backref="votes")
     user = relationship("User", backref="cve_votes")
 
-    # Constraints: one vote per user per CVE
+    # Constraints: one vote per user per CVE (ON CONFLICT target for upserts)
     __table_args__ = (
-        Index("idx_cve_votes_unique", "cve_id", "user_id", unique=True),
+        UniqueConstraint("cve_id", "user_id", name="uq_cve_votes"),
         Index("idx_cve_votes_user", "user_id"),
         Index("idx_cve_votes_cve_created", "cve_id", "created_at"),
+        # Trending counts votes per CVE since a cutoff as an index-only scan
+        Index(
+            "idx_cve_votes_created_cve",
+            "created_at",
+            postgresql_include=["cve_id"],
+        ),
     )
 
     def __repr__(self):
@@ -609,7 +768,7 @@ class Notification(Base):
     id = Column(Integer, primary_key=True, index=True)
 
     # Recipient
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
 
     # Notification type
     type = Column(
@@ -630,13 +789,13 @@ class Notification(Base):
     actor_id = Column(Integer, ForeignKey("users.id"), nullable=True)
 
     # Status
-    is_read = Column(Boolean, default=False, nullable=False, index=True)
+    is_read = Column(Boolean, default=False, nullable=False)
     read_at = Column(DateTime(timezone=True), nullable=True)
 
     # Metadata
     created_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
     )
 
@@ -649,7 +808,14 @@ class Notification(Base):
     # Indexes for performance
     __table_args__ = (
         Index("idx_notifications_user_created", "user_id", "created_at"),
-        Index("idx_notifications_user_unread", "user_id", "is_read"),
+        # Only unread rows are indexed; they are a small fraction in practice
+        Index(
+            "idx_notifications_user_unread",
+            "user_id",
+            "created_at",
+            postgresql_include=["type", "title"],
+            postgresql_where=text("is_read = false"),
+        ),
         Index("idx_notifications_type", "type"),
     )
 
@@ -684,22 +850,28 @@ class NewsSource(Base):
     # Fetch settings
     fetch_interval_minutes = Column(Integer, default=30, nullable=False)
     last_fetched_at = Column(DateTime(timezone=True), nullable=True)
-    last_fetch_status = Column(String(50), nullable=True)  # success, error
+    last_fetch_status = Column(
+        String(50), nullable=True
+    )  # success, not_modified, error
     last_fetch_error = Column(Text, nullable=True)
 
+    # Validators from the last successful fetch, sent back as a conditional GET
+    etag = Column(String(500), nullable=True)
+    last_modified = Column(String(100), nullable=True)
+
     # Statistics
     total_articles = Column(Integer, default=0, nullable=False)
 
     # Timestamps
     created_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
     )
     updated_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
 
@@ -722,9 +894,7 @@ class NewsArticle(Base):
     id = Column(Integer, primary_key=True, index=True)
 
     # Source relationship
-    source_id = Column(
-        Integer, ForeignKey("news_sources.id"), nullable=False, index=True
-    )
+    source_id = Column(Integer, ForeignKey("news_sources.id"), nullable=False)
 
     # Article details
     title = Column(String(500), nullable=False)
@@ -737,28 +907,28 @@ class NewsArticle(Base):
 
     # LLM-processed fields
     llm_summary = Column(Text, nullable=True)  # LLM-generated summary
-    llm_key_points = Column(JSON, nullable=True)  # Key takeaways as list
+    llm_key_points = Column(JSONB, nullable=True)  # Key takeaways as list
     llm_relevance_score = Column(Float, nullable=True)  # 0-1 relevance to security
     llm_processed = Column(Boolean, default=False, nullable=False)
     llm_processed_at = Column(DateTime(timezone=True), nullable=True)
 
     # Categorization
-    categories = Column(JSON, nullable=True)  # ["vulnerability", "malware", "breach"]
-    tags = Column(JSON, nullable=True)  # Extracted tags
+    categories = Column(JSONB, nullable=True)  # ["vulnerability", "malware", "breach"]
+    tags = Column(JSONB, nullable=True)  # Extracted tags
 
     # Related CVEs (if mentioned in article)
-    related_cves = Column(JSON, nullable=True)  # ["CVE-2024-1234", ...]
+    related_cves = Column(JSONB, nullable=True)  # ["CVE-2024-1234", ...]
 
     # Timestamps
-    published_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    published_at = Column(DateTime(timezone=True), nullable=True)
     fetched_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
     )
     created_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
     )
 
@@ -768,13 +938,22 @@ class NewsArticle(Base):
     # Indexes
     __table_args__ = (
         Index("idx_news_articles_source_published", "source_id", "published_at"),
-        Index("idx_news_articles_published", "published_at"),
+        # Articles arrive roughly in publication order, so BRIN is enough
+        # for time-range scans at a fraction of the B-tree size
+        Index(
+            "ix_news_published_brin",
+            "published_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
         Index(
             "ix_news_title_trgm",
             "title",
             postgresql_using="gin",
             postgresql_ops={"title": "gin_trgm_ops"},
         ),
+        Index("ix_news_categories_gin", "categories", postgresql_using="gin"),
+        Index("ix_news_related_cves_gin", "related_cves", postgresql_using="gin"),
     )
 
     def __repr__(self):
@@ -792,8 +971,11 @@ class WaitlistEntry(Base):
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(255), unique=True, nullable=False, index=True)
 
-    # Email verification via token
-    verification_token = Column(String(64), unique=True, nullable=False, index=True)
+    # Email verification via token: links carry the raw 32-byte token
+    # (base64url), only its SHA-256 digest is stored
+    verification_token_hash = Column(
+        LargeBinary(32), unique=True, nullable=False, index=True
+    )
     is_verified = Column(Boolean, default=False, nullable=False, index=True)
     verified_at = Column(DateTime(timezone=True), nullable=True)
     token_expires_at = Column(DateTime(timezone=True), nullable=False)
@@ -801,13 +983,22 @@ class WaitlistEntry(Base):
     # Timestamps
     created_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
     )
 
     # Launch notification
     notified = Column(Boolean, default=False, nullable=False)
 
+    # Verified signups still waiting for the launch email
+    __table_args__ = (
+        Index(
+            "idx_waitlist_pending_notify",
+            "created_at",
+            postgresql_where=text("is_verified = true AND notified = false"),
+        ),
+    )
+
     def __repr__(self):
         return f"<WaitlistEntry(email={self.email}, verified={self.is_verified})>"
 
@@ -843,7 +1034,9 @@ class TechStack(Base):
     )  # package.json, requirements.txt, etc.
 
     # Statistics (cached for performance)
-    package_count = Column(Integer, nullable=False, default=0)
+    package_count = Column(
+        Integer, Computed("jsonb_array_length(packages)", persisted=True)
+    )
     vulnerable_count = Column(Integer, nullable=False, default=0)
     critical_count = Column(Integer, nullable=False, default=0)
     high_count = Column(Integer, nullable=False, default=0)
@@ -854,13 +1047,13 @@ class TechStack(Base):
     # Timestamps
     created_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
     )
     updated_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
 
@@ -909,7 +1102,7 @@ class TechStackMatch(Base):
     # Timestamps
     matched_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
     )
 
@@ -951,15 +1144,20 @@ class PageView(Base):
     # Timestamps
     created_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
-        index=True,
     )
 
     # Indexes for analytics queries
     __table_args__ = (
         Index("idx_page_views_path_created", "path", "created_at"),
-        Index("idx_page_views_date", "created_at"),
+        # Append-only: BRIN serves the "last N days" range scans
+        Index(
+            "idx_page_views_date_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 64},
+        ),
     )
 
     def __repr__(self):
@@ -990,13 +1188,13 @@ class PackageCPEMapping(Base):
     # Timestamps
     created_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
     )
     updated_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
 
@@ -3,9 +3,9 @@ Pydantic schemas for API request/response validation.
 """
 
 from datetime import date, datetime
-from typing import Any, List, Optional
+from typing import Annotated, Any, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class VulnerabilityBase(BaseModel):
@@ -33,8 +33,19 @@ class VulnerabilityList(VulnerabilityBase):
     upvotes: int = 0
     downvotes: int = 0
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_orm_fast(cls, row: Any) -> "VulnerabilityList":
+        """
+        Build from a Vulnerability or VulnerabilityFeed row without validation.
+
+        Column types already match these fields, so re-validating every row
+        of a list page is wasted work. Do not use for untrusted input.
+        """
+        return cls.model_construct(
+            **{name: getattr(row, name) for name in cls.model_fields}
+        )
 
 
 class VulnerabilityDetail(VulnerabilityBase):
@@ -59,8 +70,7 @@ class VulnerabilityDetail(VulnerabilityBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaginatedResponse(BaseModel):
@@ -85,6 +95,10 @@ class StatsResponse(BaseModel):
     last_update: Optional[datetime] = None
 
 
+# Shared by both CVSS bounds so their constraints are declared once
+CvssScore = Annotated[Optional[float], Field(ge=0.0, le=10.0)]
+
+
 class SearchQuery(BaseModel):
     """Search query parameters."""
 
@@ -94,12 +108,8 @@ class SearchQuery(BaseModel):
     vendor: Optional[str] = Field(None, description="Filter by vendor")
     product: Optional[str] = Field(None, description="Filter by product")
     cwe: Optional[str] = Field(None, description="Filter by CWE ID")
-    min_cvss: Optional[float] = Field(
-        None, ge=0.0, le=10.0, description="Minimum CVSS score"
-    )
-    max_cvss: Optional[float] = Field(
-        None, ge=0.0, le=10.0, description="Maximum CVSS score"
-    )
+    min_cvss: CvssScore = Field(None, description="Minimum CVSS score")
+    max_cvss: CvssScore = Field(None, description="Maximum CVSS score")
     published_after: Optional[date] = Field(None, description="Published after date")
     published_before: Optional[date] = Field(None, description="Published before date")
     page: int = Field(1, ge=1, description="Page number")
@@ -129,8 +139,7 @@ class TechniqueDetail(TechniqueBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class IOCBase(BaseModel):
@@ -157,8 +166,7 @@ class IOCDetail(IOCBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class HealthResponse(BaseModel):
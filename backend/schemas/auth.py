@@ -3,11 +3,39 @@ Pydantic schemas for authentication and authorization.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, EmailStr, Field
 
-from ..models import UserRole
+from .enums import UserRole
+
+
+def check_password_strength(v: str) -> str:
+    """Require at least one uppercase letter, lowercase letter and digit.
+
+    Length is enforced by the field; this only checks character classes,
+    in a single pass over the password.
+    """
+    has_upper = has_lower = has_digit = False
+    for c in v:
+        if c.isupper():
+            has_upper = True
+        elif c.islower():
+            has_lower = True
+        elif c.isdigit():
+            has_digit = True
+    if not has_upper:
+        raise ValueError("Password must contain at least one uppercase letter")
+    if not has_lower:
+        raise ValueError("Password must contain at least one lowercase letter")
+    if not has_digit:
+        raise ValueError("Password must contain at least one digit")
+    return v
+
+
+StrongPassword = Annotated[
+    str, Field(min_length=8, max_length=100), AfterValidator(check_password_strength)
+]
 
 
 # User Registration
@@ -16,20 +44,7 @@ class UserCreate(BaseModel):
 
     email: EmailStr
     username: str = Field(..., min_length=3, max_length=100, pattern="^[a-zA-Z0-9_-]+$")
-    password: str = Field(..., min_length=8, max_length=100)
-
-    @validator("password")
-    def validate_password(cls, v):
-        """Validate password strength."""
-        if len(v) < 8:
-            raise ValueError("Password must be at least 8 characters long")
-        if not any(c.isupper() for c in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.islower() for c in v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+    password: StrongPassword
 
 
 # User Login
@@ -70,8 +85,7 @@ class UserResponse(BaseModel):
     created_at: datetime
     last_login_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # User Update
@@ -86,20 +100,7 @@ class PasswordChange(BaseModel):
     """Schema for changing password."""
 
     old_password: str
-    new_password: str = Field(..., min_length=8, max_length=100)
-
-    @validator("new_password")
-    def validate_password(cls, v):
-        """Validate password strength."""
-        if len(v) < 8:
-            raise ValueError("Password must be at least 8 characters long")
-        if not any(c.isupper() for c in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.islower() for c in v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+    new_password: StrongPassword
 
 
 # Admin: Update user role
@@ -59,3 +59,11 @@ class LLMPriorityEnum(str, Enum):
     HIGH = "high"
     MEDIUM = "medium"
     LOW = "low"
+
+
+class UserRole(str, Enum):
+    """User role definitions."""
+
+    ADMIN = "admin"
+    ANALYST = "analyst"
+    VIEWER = "viewer"
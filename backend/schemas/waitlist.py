@@ -5,7 +5,7 @@ Pydantic schemas for waitlist functionality.
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 
 class WaitlistJoin(BaseModel):
@@ -23,5 +23,4 @@ class WaitlistResponse(BaseModel):
     created_at: datetime
     verified_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -12,6 +12,7 @@ backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
 
 from database import SessionLocal
+from sqlalchemy import text
 
 
 def refresh_stats_cache():
@@ -19,7 +20,9 @@ def refresh_stats_cache():
     db = SessionLocal()
     try:
         print("Refreshing vulnerability stats cache...")
-        db.execute("SELECT refresh_vulnerability_stats_cache()")
+        # Cap a runaway refresh; LOCAL resets when the transaction ends
+        db.execute(text("SET LOCAL statement_timeout = '120s'"))
+        db.execute(text("SELECT refresh_vulnerability_stats_cache()"))
         db.commit()
         print("✓ Stats cache refreshed successfully")
         return True
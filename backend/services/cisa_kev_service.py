@@ -6,12 +6,18 @@ as exploited in the wild using the NVD API.
 """
 
 import logging
+import os
 import time
-from datetime import datetime
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Set
 
 import requests
+from requests.adapters import HTTPAdapter
+from sqlalchemy import Numeric, case, cast, func, literal, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
+from urllib3.util import Retry
 
 from backend.models import Vulnerability
 from backend.services.nvd_complete_service import NVDCompleteService
@@ -24,65 +30,112 @@ class CISAKEVService:
     """Service for fetching and processing CISA KEV data via NVD API."""
 
     NVD_API_BASE = "https://services.nvd.nist.gov/rest/json/cves/2.0"
+    RESULTS_PER_PAGE = 2000  # Maximum allowed by NVD API
+    RATE_LIMIT_DELAY = 6  # seconds (5 requests per 30 seconds without API key)
+    MAX_CONCURRENT_PAGES = 5  # Only used with an API key
+
+    def __init__(self, api_key: Optional[str] = None):
+        self.api_key = api_key or os.getenv("NVD_API_KEY")
+        self.nvd_service = NVDCompleteService(api_key=self.api_key)
+
+        # Pooled keep-alive connections for all pages, retrying transient errors
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=self.MAX_CONCURRENT_PAGES,
+                max_retries=Retry(
+                    total=5,
+                    backoff_factor=1,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                ),
+            ),
+        )
+        self.session.headers.update(
+            {
+                "User-Agent": "OpenThreat/1.0 (Vulnerability Management System)",
+                "Accept": "application/json",
+            }
+        )
 
-    def __init__(self):
-        self.nvd_service = NVDCompleteService()
+        if self.api_key:
+            self.session.headers.update({"apiKey": self.api_key})
+            self.rate_limit_delay = 0.6  # 50 requests per 30 seconds
+        else:
+            self.rate_limit_delay = self.RATE_LIMIT_DELAY
+
+    def _fetch_page(self, start_index: int) -> Dict:
+        """Fetch one page of KEV CVEs starting at start_index."""
+        # Use hasKev parameter to get only KEV CVEs
+        url = (
+            f"{self.NVD_API_BASE}?hasKev&resultsPerPage={self.RESULTS_PER_PAGE}"
+            f"&startIndex={start_index}"
+        )
+
+        logger.info(f"Requesting CVEs from index {start_index}...")
+        response = self.session.get(url, timeout=30)
+        response.raise_for_status()
+        return response.json()
 
     def fetch_kev_cves(self) -> List[Dict]:
         """
         Fetch all CVEs marked as KEV from NVD API.
 
+        The first page gives the total; the remaining pages are fetched
+        concurrently when an API key allows it, serially otherwise.
+
         Returns:
             List of CVE records with KEV status
         """
         all_cves = []
-        start_index = 0
-        results_per_page = 2000  # Maximum allowed by NVD API
-
-        headers = {
-            "User-Agent": "OpenThreat/1.0 (Vulnerability Management System)",
-            "Accept": "application/json",
-        }
 
         logger.info("Fetching KEV CVEs from NVD API...")
 
-        while True:
-            try:
-                # Use hasKev parameter to get only KEV CVEs
-                url = f"{self.NVD_API_BASE}?hasKev&resultsPerPage={results_per_page}&startIndex={start_index}"
-
-                logger.info(f"Requesting CVEs from index {start_index}...")
-                response = requests.get(url, headers=headers, timeout=30)
-                response.raise_for_status()
-                data = response.json()
-
-                vulnerabilities = data.get("vulnerabilities", [])
-                total_results = data.get("totalResults", 0)
-
-                if not vulnerabilities:
-                    break
+        try:
+            data = self._fetch_page(0)
+            all_cves.extend(data.get("vulnerabilities", []))
+            total_results = data.get("totalResults", 0)
+            page_size = data.get("resultsPerPage") or self.RESULTS_PER_PAGE
+
+            start_indices = list(range(len(all_cves), total_results, page_size))
+            if all_cves and start_indices:
+                if self.api_key:
+                    pages = self._fetch_pages_concurrently(start_indices)
+                else:
+                    pages = self._fetch_pages_serially(start_indices)
+
+                for page in pages:
+                    vulnerabilities = page.get("vulnerabilities", [])
+                    all_cves.extend(vulnerabilities)
+                    logger.info(
+                        f"Fetched {len(vulnerabilities)} CVEs "
+                        f"(total: {len(all_cves)}/{total_results})"
+                    )
+
+        except Exception as e:
+            logger.error(f"Failed to fetch KEV CVEs from NVD: {e}")
 
-                all_cves.extend(vulnerabilities)
-                logger.info(
-                    f"Fetched {len(vulnerabilities)} CVEs (total: {len(all_cves)}/{total_results})"
-                )
-
-                # Check if we've fetched all results
-                if len(all_cves) >= total_results:
-                    break
-
-                start_index += results_per_page
+        logger.info(f"Successfully fetched {len(all_cves)} KEV CVEs from NVD")
+        return all_cves
 
-                # Rate limiting: NVD allows 5 requests per 30 seconds without API key
-                # Sleep for 6 seconds between requests to be safe
-                time.sleep(6)
+    def _fetch_pages_serially(self, start_indices: List[int]) -> Iterator[Dict]:
+        for start_index in start_indices:
+            # Rate limiting: NVD allows 5 requests per 30 seconds without API key
+            time.sleep(self.rate_limit_delay)
+            yield self._fetch_page(start_index)
 
-            except Exception as e:
-                logger.error(f"Failed to fetch KEV CVEs from NVD: {e}")
-                break
+    def _fetch_pages_concurrently(self, start_indices: List[int]) -> Iterator[Dict]:
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_PAGES) as executor:
+            futures = []
+            for start_index in start_indices:
+                # Stagger request starts so the keyed rate limit still holds
+                time.sleep(self.rate_limit_delay)
+                futures.append(executor.submit(self._fetch_page, start_index))
 
-        logger.info(f"Successfully fetched {len(all_cves)} KEV CVEs from NVD")
-        return all_cves
+            # Yield in page order; a failed page stops the fetch like the serial path
+            for future in futures:
+                yield future.result()
 
     def update_exploited_vulnerabilities(self, db: Session) -> Dict:
         """
@@ -106,54 +159,20 @@ class CISAKEVService:
 
         logger.info(f"Processing {len(kev_cves)} KEV entries from NVD")
 
-        updated_count = 0
-        not_found_count = 0
-
-        for vuln_wrapper in kev_cves:
-            cve_data = vuln_wrapper.get("cve", {})
-            cve_id = cve_data.get("id")
-
-            if not cve_id:
-                continue
-
-            # Find CVE in database
-            existing = (
-                db.query(Vulnerability).filter(Vulnerability.cve_id == cve_id).first()
-            )
-
-            if existing:
-                # Mark as exploited
-                existing.exploited_in_the_wild = True
-
-                # Add CISA source if not present
-                sources = existing.sources or []
-                if "cisa_kev" not in sources:
-                    sources.append("cisa_kev")
-                    existing.sources = sources
-
-                # Recalculate priority (exploitation increases priority)
-                existing.priority_score = self.nvd_service._calculate_priority(
-                    existing.cvss_score,
-                    existing.severity,
-                    (
-                        existing.published_at.isoformat()
-                        if existing.published_at
-                        else None
-                    ),
-                    exploited=True,
-                )
-
-                updated_count += 1
-
-                if updated_count % 100 == 0:
-                    logger.info(f"Updated {updated_count} CVEs...")
-                    db.commit()  # Commit in batches
-            else:
-                not_found_count += 1
+        kev_ids = {
+            vuln_wrapper["cve"]["id"]
+            for vuln_wrapper in kev_cves
+            if vuln_wrapper.get("cve", {}).get("id")
+        }
 
-        # Final commit
+        if db.bind.dialect.name == "postgresql":
+            updated_count = self._mark_exploited_in_sql(db, kev_ids)
+        else:
+            updated_count = self._mark_exploited_in_python(db, kev_ids)
         db.commit()
 
+        not_found_count = len(kev_ids) - updated_count
+
         # Refresh stats cache after KEV updates
         # Always refresh to keep time-sensitive stats (like recent updates) accurate
         refresh_stats_cache(db)
@@ -171,6 +190,106 @@ class CISAKEVService:
             "timestamp": datetime.utcnow().isoformat(),
         }
 
+    def _mark_exploited_in_sql(self, db: Session, kev_ids: Set[str]) -> int:
+        """
+        Mark KEV CVEs as exploited with a single server-side UPDATE.
+
+        priority_score mirrors NVDCompleteService._calculate_priority with
+        exploited=True, so no rows are loaded into Python.
+
+        Returns:
+            Number of rows updated
+        """
+        # CVSS weight, falling back to severity when there is no score
+        cvss_weight = case(
+            (Vulnerability.cvss_score != 0, Vulnerability.cvss_score / 10.0),
+            (Vulnerability.severity == "CRITICAL", 1.0),
+            (Vulnerability.severity == "HIGH", 0.7),
+            (Vulnerability.severity == "MEDIUM", 0.4),
+            (Vulnerability.severity == "LOW", 0.2),
+            else_=0.0,
+        )
+        # Recency weight: at most 7 or 30 whole days old
+        recency_weight = case(
+            (Vulnerability.published_at > func.now() - timedelta(days=8), 1.0),
+            (Vulnerability.published_at > func.now() - timedelta(days=31), 0.5),
+            else_=0.0,
+        )
+        priority = func.round(
+            cast(cvss_weight * 0.4 + recency_weight * 0.2 + 0.4, Numeric), 3
+        )
+
+        # JSON text cast to JSONB, so the statement also renders with literal binds
+        cisa_source = cast(literal('["cisa_kev"]'), JSONB)
+        no_sources = cast(literal("[]"), JSONB)
+        sources = case(
+            (Vulnerability.sources.contains(cisa_source), Vulnerability.sources),
+            else_=func.coalesce(Vulnerability.sources, no_sources).op("||")(
+                cisa_source
+            ),
+        )
+
+        result = db.execute(
+            update(Vulnerability)
+            .where(Vulnerability.cve_id.in_(kev_ids))
+            .values(
+                exploited_in_the_wild=True,
+                priority_score=priority,
+                sources=sources,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    def _mark_exploited_in_python(self, db: Session, kev_ids: Set[str]) -> int:
+        """
+        Mark KEV CVEs as exploited, computing priority in Python.
+
+        Fallback for databases without JSONB operators (SQLite in tests).
+
+        Returns:
+            Number of rows updated
+        """
+        # Load all matching CVEs in one query, only the columns needed
+        existing_rows = (
+            db.query(
+                Vulnerability.id,
+                Vulnerability.cvss_score,
+                Vulnerability.severity,
+                Vulnerability.published_at,
+                Vulnerability.sources,
+            )
+            .filter(Vulnerability.cve_id.in_(kev_ids))
+            .all()
+        )
+
+        updates = []
+        for row in existing_rows:
+            # Add CISA source if not present
+            sources = row.sources or []
+            if "cisa_kev" not in sources:
+                sources = [*sources, "cisa_kev"]
+
+            updates.append(
+                {
+                    "id": row.id,
+                    # Mark as exploited
+                    "exploited_in_the_wild": True,
+                    "sources": sources,
+                    # Recalculate priority (exploitation increases priority)
+                    "priority_score": self.nvd_service._calculate_priority(
+                        row.cvss_score,
+                        row.severity,
+                        row.published_at.isoformat() if row.published_at else None,
+                        exploited=True,
+                    ),
+                }
+            )
+
+        # One executemany UPDATE for all matched CVEs
+        db.bulk_update_mappings(Vulnerability, updates)
+        return len(updates)
+
 
 def get_cisa_kev_service() -> CISAKEVService:
     """Get CISA KEV service instance."""
@@ -8,20 +8,56 @@ This service handles:
 4. CVE extraction from article content
 """
 
-import html
+import json
 import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
-from xml.etree import ElementTree
+from email.utils import parsedate_to_datetime
+from functools import partial
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import requests
+from cachetools import LRUCache
+from lxml import etree
+from lxml import html as lxml_html
+from requests.adapters import HTTPAdapter
+from sqlalchemy import null
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from urllib3.util import Retry
 
 from backend.models import NewsArticle, NewsSource
 
 logger = logging.getLogger(__name__)
 
+# RSS items and Atom entries in any namespace (RSS 1.0 and Atom use one)
+FEED_ITEM_TAGS = ("{*}item", "{*}entry")
+
+FEED_CHUNK_SIZE = 16384
+
+CVE_ID_PATTERN = re.compile(r"CVE-\d{4}-\d{4,7}", re.IGNORECASE)
+
+
+NEWS_SUMMARY_SYSTEM_PROMPT = """You are a cybersecurity analyst summarizing security news.
+
+Tasks:
+1. Write a 2-3 sentence summary focusing on the security implications
+2. List 2-3 key takeaways as bullet points
+3. Rate relevance to cybersecurity (0.0-1.0)
+4. Identify categories: vulnerability, malware, breach, ransomware, apt, policy, tool, other
+
+Respond in this exact JSON format:
+{
+    "summary": "Your summary here",
+    "key_points": ["Point 1", "Point 2"],
+    "relevance": 0.8,
+    "categories": ["vulnerability", "malware"]
+}"""
+
 # Default security news sources
 DEFAULT_NEWS_SOURCES = [
     {
@@ -57,13 +93,61 @@ DEFAULT_NEWS_SOURCES = [
 ]
 
 
+def local_name(elem: etree._Element) -> str:
+    """Tag name without its namespace; empty for comments and PIs."""
+    tag = elem.tag
+    return tag.rpartition("}")[2] if isinstance(tag, str) else ""
+
+
+def find_child(elem: etree._Element, name: str) -> Optional[etree._Element]:
+    """First direct child with the given local name, in any namespace."""
+    for candidate in elem:
+        if local_name(candidate) == name:
+            return candidate
+    return None
+
+
+def find_child_text(elem: etree._Element, name: str) -> Optional[str]:
+    """Text of the first direct child with the given local name."""
+    found = find_child(elem, name)
+    return found.text if found is not None else None
+
+
 class NewsService:
     """Service for fetching and processing security news."""
 
+    MAX_CONCURRENT_FETCHES = 8
+    SEEN_URLS_CACHE_SIZE = 50_000
+
     def __init__(self):
+        # (source id, URL) pairs known to be stored, so repeat polls of a feed
+        # only query the database for URLs this process has not seen yet
+        self._seen_urls: LRUCache = LRUCache(maxsize=self.SEEN_URLS_CACHE_SIZE)
+        self._seen_urls_lock = threading.Lock()
+
         self.session = requests.Session()
+
+        # Keep connections to every feed host alive between fetch cycles
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=self.MAX_CONCURRENT_FETCHES,
+            max_retries=Retry(
+                total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Brotli is left out; requests can only decode it with brotli installed
         self.session.headers.update(
-            {"User-Agent": "OpenThreat/1.0 (Security News Aggregator)"}
+            {
+                "User-Agent": "OpenThreat/1.0 (Security News Aggregator)",
+                "Accept": (
+                    "application/rss+xml, application/atom+xml, "
+                    "application/xml;q=0.9, */*;q=0.8"
+                ),
+                "Accept-Encoding": "gzip, deflate",
+            }
         )
 
     def initialize_default_sources(self, db: Session) -> int:
@@ -102,101 +186,156 @@ class NewsService:
 
         return added
 
-    def fetch_feed(self, url: str, timeout: int = 30) -> Optional[str]:
+    def fetch_feed(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        timeout: int = 30,
+    ) -> Optional[requests.Response]:
         """
         Fetch RSS/Atom feed content.
 
         Args:
             url: Feed URL
+            etag: ETag from the last fetch, sent as If-None-Match
+            last_modified: Last-Modified from the last fetch, sent as
+                If-Modified-Since
             timeout: Request timeout in seconds
 
         Returns:
-            Feed XML content or None on error
+            Response (status 304 when the feed is unchanged) or None on error
         """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        # Streamed so the body can be parsed as it arrives
+        response = None
         try:
-            response = self.session.get(url, timeout=timeout)
+            response = self.session.get(
+                url, headers=headers, timeout=timeout, stream=True
+            )
             response.raise_for_status()
-            return response.text
+            return response
         except requests.RequestException as e:
             logger.error(f"Failed to fetch feed {url}: {e}")
+            if response is not None:
+                response.close()
             return None
 
-    def parse_rss_feed(self, xml_content: str) -> List[Dict[str, Any]]:
+    def fetch_articles(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[Optional[requests.Response], List[Dict[str, Any]]]:
         """
-        Parse RSS 2.0 feed.
+        Fetch a feed and parse its articles while the body downloads.
 
         Args:
-            xml_content: RSS XML content
+            url: Feed URL
+            etag: ETag from the last fetch
+            last_modified: Last-Modified from the last fetch
+            limit: Stop downloading and parsing after this many articles
 
         Returns:
-            List of article dicts
+            Tuple of (response from fetch_feed, parsed articles); the
+            response is None if the fetch failed
         """
-        articles = []
+        response = self.fetch_feed(url, etag, last_modified)
+        if response is None or response.status_code == 304:
+            return response, []
+
         try:
-            root = ElementTree.fromstring(xml_content)
+            articles = list(
+                islice(
+                    self.parse_rss_feed(response.iter_content(FEED_CHUNK_SIZE)),
+                    limit,
+                )
+            )
+        except Exception as e:
+            # Runs on a worker thread: anything raised here would abort the
+            # whole fetch_all_sources run instead of just this source
+            logger.error(f"Failed to download or parse feed {url}: {e}")
+            return None, []
+        finally:
+            response.close()
 
-            # Handle RSS 2.0
-            channel = root.find("channel")
-            if channel is not None:
-                for item in channel.findall("item"):
-                    article = self._parse_rss_item(item)
-                    if article:
-                        articles.append(article)
+        return response, articles
 
-            # Handle Atom
-            else:
-                # Check for Atom namespace (with prefix)
-                ns_prefixed = {"atom": "http://www.w3.org/2005/Atom"}
-                for entry in root.findall("atom:entry", ns_prefixed):
-                    article = self._parse_atom_entry(entry, ns_prefixed, "atom:")
-                    if article:
-                        articles.append(article)
-
-                # Try with default namespace (xmlns without prefix - like Heise)
-                if not articles:
-                    # ElementTree requires {namespace}tag format for default namespace
-                    atom_ns = "{http://www.w3.org/2005/Atom}"
-                    for entry in root.findall(f"{atom_ns}entry"):
-                        article = self._parse_atom_entry_with_ns(entry, atom_ns)
-                        if article:
-                            articles.append(article)
-
-                # Try without any namespace
-                if not articles:
-                    for entry in root.findall("entry"):
-                        article = self._parse_atom_entry(entry, {}, "")
-                        if article:
-                            articles.append(article)
-
-        except ElementTree.ParseError as e:
+    def parse_rss_feed(self, chunks: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+        """
+        Parse an RSS or Atom feed incrementally.
+
+        Args:
+            chunks: Raw feed XML, e.g. from Response.iter_content
+
+        Yields:
+            Article dicts, as soon as each item is complete
+        """
+        # Recover from malformed feeds; never resolve entities or fetch
+        # external DTDs
+        parser = etree.XMLPullParser(
+            events=("end",),
+            tag=FEED_ITEM_TAGS,
+            recover=True,
+            resolve_entities=False,
+            no_network=True,
+        )
+        try:
+            for chunk in chunks:
+                parser.feed(chunk)
+                yield from self._read_feed_items(parser)
+            parser.close()
+            yield from self._read_feed_items(parser)
+        except etree.XMLSyntaxError as e:
             logger.error(f"Failed to parse feed XML: {e}")
 
-        return articles
+    def _read_feed_items(self, parser: etree.XMLPullParser) -> Iterator[Dict[str, Any]]:
+        """Parse the items completed so far, dropping each one afterwards."""
+        for _, elem in parser.read_events():
+            if local_name(elem) == "item":
+                article = self._parse_rss_item(elem)
+            else:
+                article = self._parse_atom_entry(elem)
+            if article:
+                yield article
+
+            # Only the current item is ever held, not the full tree
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
 
-    def _parse_rss_item(self, item: ElementTree.Element) -> Optional[Dict[str, Any]]:
+    def _parse_rss_item(self, item: etree._Element) -> Optional[Dict[str, Any]]:
         """Parse a single RSS item."""
-        title = item.findtext("title")
-        link = item.findtext("link")
+        title = find_child_text(item, "title")
+        link = find_child_text(item, "link")
 
         if not title or not link:
             return None
 
-        # Parse publication date
+        # Parse publication date (dc:date in RSS 1.0)
         pub_date = None
-        pub_date_str = item.findtext("pubDate")
+        pub_date_str = find_child_text(item, "pubDate") or find_child_text(item, "date")
         if pub_date_str:
             pub_date = self._parse_date(pub_date_str)
 
         # Get description/summary
-        description = item.findtext("description") or ""
+        description = find_child_text(item, "description") or ""
         # Clean HTML from description
         description = self._clean_html(description)
 
-        # Get author
-        author = item.findtext("author") or item.findtext("dc:creator")
+        # Get author (dc:creator when there is no author element)
+        author = find_child_text(item, "author") or find_child_text(item, "creator")
 
         # Get categories
-        categories = [cat.text for cat in item.findall("category") if cat.text]
+        categories = [
+            cat.text for cat in item if local_name(cat) == "category" and cat.text
+        ]
 
         return {
             "title": self._clean_html(title),
@@ -207,83 +346,15 @@ class NewsService:
             "categories": categories if categories else None,
         }
 
-    def _parse_atom_entry(
-        self, entry: ElementTree.Element, ns: Dict[str, str], prefix: str = ""
-    ) -> Optional[Dict[str, Any]]:
-        """Parse a single Atom entry with namespace prefix."""
-        title_elem = entry.find(f"{prefix}title", ns) if ns else entry.find("title")
-        title = title_elem.text if title_elem is not None else None
-
-        # Get link (prefer alternate)
-        link = None
-        for link_elem in (
-            entry.findall(f"{prefix}link", ns) if ns else entry.findall("link")
-        ):
-            rel = link_elem.get("rel", "alternate")
-            if rel == "alternate":
-                link = link_elem.get("href")
-                break
-            elif not link:
-                link = link_elem.get("href")
-
-        if not title or not link:
-            return None
-
-        # Parse publication date
-        pub_date = None
-        published = (
-            entry.find(f"{prefix}published", ns) if ns else entry.find("published")
-        )
-        updated = entry.find(f"{prefix}updated", ns) if ns else entry.find("updated")
-        pub_date_str = (
-            published.text
-            if published is not None
-            else updated.text if updated is not None else None
-        )
-        if pub_date_str:
-            pub_date = self._parse_date(pub_date_str)
-
-        # Get summary/content
-        summary_elem = (
-            entry.find(f"{prefix}summary", ns) if ns else entry.find("summary")
-        )
-        content_elem = (
-            entry.find(f"{prefix}content", ns) if ns else entry.find("content")
-        )
-        summary = (
-            summary_elem.text
-            if summary_elem is not None
-            else content_elem.text if content_elem is not None else ""
-        )
-        summary = self._clean_html(summary or "")
-
-        # Get author
-        author_elem = (
-            entry.find(f"{prefix}author/{prefix}name", ns)
-            if ns
-            else entry.find("author/name")
-        )
-        author = author_elem.text if author_elem is not None else None
-
-        return {
-            "title": self._clean_html(title),
-            "url": link.strip(),
-            "summary": summary[:2000],
-            "author": author,
-            "published_at": pub_date,
-            "categories": None,
-        }
-
-    def _parse_atom_entry_with_ns(
-        self, entry: ElementTree.Element, ns: str
-    ) -> Optional[Dict[str, Any]]:
-        """Parse Atom entry with default namespace (like Heise feeds)."""
-        title_elem = entry.find(f"{ns}title")
-        title = title_elem.text if title_elem is not None else None
+    def _parse_atom_entry(self, entry: etree._Element) -> Optional[Dict[str, Any]]:
+        """Parse a single Atom entry, with or without the Atom namespace."""
+        title = find_child_text(entry, "title")
 
         # Get link (prefer alternate)
         link = None
-        for link_elem in entry.findall(f"{ns}link"):
+        for link_elem in entry:
+            if local_name(link_elem) != "link":
+                continue
             rel = link_elem.get("rel", "alternate")
             if rel == "alternate":
                 link = link_elem.get("href")
@@ -296,29 +367,21 @@ class NewsService:
 
         # Parse publication date - prefer published over updated
         pub_date = None
-        published = entry.find(f"{ns}published")
-        updated = entry.find(f"{ns}updated")
-        pub_date_str = (
-            published.text
-            if published is not None
-            else updated.text if updated is not None else None
+        pub_date_str = find_child_text(entry, "published") or find_child_text(
+            entry, "updated"
         )
         if pub_date_str:
             pub_date = self._parse_date(pub_date_str)
 
         # Get summary/content
-        summary_elem = entry.find(f"{ns}summary")
-        content_elem = entry.find(f"{ns}content")
-        summary = (
-            summary_elem.text
-            if summary_elem is not None
-            else content_elem.text if content_elem is not None else ""
-        )
+        summary = find_child_text(entry, "summary") or find_child_text(entry, "content")
         summary = self._clean_html(summary or "")
 
         # Get author
-        author_elem = entry.find(f"{ns}author/{ns}name")
-        author = author_elem.text if author_elem is not None else None
+        author_elem = find_child(entry, "author")
+        author = (
+            find_child_text(author_elem, "name") if author_elem is not None else None
+        )
 
         return {
             "title": self._clean_html(title),
@@ -330,46 +393,31 @@ class NewsService:
         }
 
     def _parse_date(self, date_str: str) -> Optional[datetime]:
-        """Parse various date formats."""
-        formats = [
-            "%a, %d %b %Y %H:%M:%S %z",  # RFC 822
-            "%a, %d %b %Y %H:%M:%S %Z",  # RFC 822 with timezone name
-            "%Y-%m-%dT%H:%M:%S.%fZ",  # ISO 8601 with milliseconds UTC (Heise)
-            "%Y-%m-%dT%H:%M:%S.%f%z",  # ISO 8601 with milliseconds and timezone
-            "%Y-%m-%dT%H:%M:%S%z",  # ISO 8601
-            "%Y-%m-%dT%H:%M:%SZ",  # ISO 8601 UTC
-            "%Y-%m-%d %H:%M:%S",  # Simple datetime
-            "%Y-%m-%d",  # Simple date
-        ]
-
-        # Clean up timezone
+        """Parse RFC 822 (RSS) and ISO 8601 (Atom) dates."""
         date_str = date_str.strip()
-        date_str = re.sub(r"\s+GMT$", " +0000", date_str)
-        date_str = re.sub(r"\s+UTC$", " +0000", date_str)
-
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(date_str, fmt)
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                return dt
-            except ValueError:
-                continue
 
-        logger.debug(f"Could not parse date: {date_str}")
-        return None
+        try:
+            # ISO 8601 starts with the year; RFC 822 with a weekday or day
+            if date_str[:4].isdigit():
+                dt = datetime.fromisoformat(date_str)
+            else:
+                dt = parsedate_to_datetime(date_str)
+        except (ValueError, TypeError):
+            logger.debug(f"Could not parse date: {date_str}")
+            return None
+
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt
 
     def _clean_html(self, text: str) -> str:
         """Remove HTML tags and decode entities."""
         if not text:
             return ""
-        # Remove HTML tags
-        text = re.sub(r"<[^>]+>", "", text)
-        # Decode HTML entities
-        text = html.unescape(text)
+        # One libxml2 pass strips tags and decodes entities
+        text = lxml_html.fragment_fromstring(text, create_parent="div").text_content()
         # Normalize whitespace
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
+        return " ".join(text.split())
 
     def fetch_and_store_articles(
         self, db: Session, source: NewsSource, limit: int = 50
@@ -382,75 +430,130 @@ class NewsService:
             source: News source to fetch from
             limit: Maximum articles to process
 
+        Returns:
+            Dict with fetch statistics
+        """
+        response, articles = self.fetch_articles(
+            source.url, source.etag, source.last_modified, limit
+        )
+        return self.store_articles(db, source, response, articles, limit)
+
+    def store_articles(
+        self,
+        db: Session,
+        source: NewsSource,
+        response: Optional[requests.Response],
+        articles: List[Dict[str, Any]],
+        limit: int = 50,
+    ) -> Dict[str, int]:
+        """
+        Store new articles from an already fetched and parsed feed.
+
+        Args:
+            db: Database session
+            source: News source the feed belongs to
+            response: Response from fetch_articles, or None if the fetch failed
+            articles: Articles parsed from the response
+            limit: Maximum articles to process
+
         Returns:
             Dict with fetch statistics
         """
         stats = {"fetched": 0, "new": 0, "errors": 0}
+        # One timestamp for the whole run, shared by the source and its articles
+        now = datetime.now(timezone.utc)
 
-        # Fetch feed
-        xml_content = self.fetch_feed(source.url)
-        if not xml_content:
+        if response is None:
             source.last_fetch_status = "error"
             source.last_fetch_error = "Failed to fetch feed"
-            source.last_fetched_at = datetime.now(timezone.utc)
+            source.last_fetched_at = now
             db.commit()
             return stats
 
-        # Parse feed
-        articles = self.parse_rss_feed(xml_content)
-        stats["fetched"] = len(articles)
-
-        # Store new articles one by one to handle duplicates gracefully
-        for article_data in articles[:limit]:
-            try:
-                # Check if article already exists
-                existing = (
-                    db.query(NewsArticle)
-                    .filter(NewsArticle.url == article_data["url"])
-                    .first()
-                )
+        # Nothing changed since the last fetch; article counts stay as they are
+        if response.status_code == 304:
+            source.last_fetch_status = "not_modified"
+            source.last_fetch_error = None
+            source.last_fetched_at = now
+            db.commit()
+            return stats
 
-                if existing:
-                    continue
+        stats["fetched"] = len(articles)
 
-                # Create new article
-                article = NewsArticle(
-                    source_id=source.id,
-                    title=article_data["title"],
-                    url=article_data["url"],
-                    author=article_data.get("author"),
-                    original_summary=article_data.get("summary"),
-                    published_at=article_data.get("published_at"),
-                    categories=article_data.get("categories"),
-                    fetched_at=datetime.now(timezone.utc),
+        # Skip articles already stored: first those this process has seen
+        # before, then the rest with one lookup for the batch
+        source_id = source.id
+        with self._seen_urls_lock:
+            batch = [
+                a
+                for a in articles[:limit]
+                if (source_id, a["url"]) not in self._seen_urls
+            ]
+
+        known_urls = set()
+        if batch:
+            known_urls = {
+                url
+                for (url,) in db.query(NewsArticle.url).filter(
+                    NewsArticle.url.in_([a["url"] for a in batch])
                 )
+            }
+        seen_urls = set(known_urls)
+        new_articles = []
+        for article_data in batch:
+            # Also drops repeats within the same feed
+            if article_data["url"] in seen_urls:
+                continue
+            seen_urls.add(article_data["url"])
+            new_articles.append(article_data)
 
-                # Extract CVEs from title and summary
-                cves = self._extract_cves(
-                    f"{article_data['title']} {article_data.get('summary', '')}"
+        stored_urls = list(known_urls)
+        try:
+            if db.bind.dialect.name == "postgresql":
+                stats["new"] = self._insert_articles_in_sql(
+                    db, source_id, new_articles, now
                 )
-                if cves:
-                    article.related_cves = cves
-
-                db.add(article)
-                db.flush()  # Flush to catch duplicates early
-                stats["new"] += 1
-
-            except Exception as e:
-                db.rollback()  # Rollback on error to continue with next article
-                logger.error(f"Error storing article: {e}")
-                stats["errors"] += 1
+            else:
+                db.add_all(self._build_article(source_id, a, now) for a in new_articles)
+                db.flush()
+                stats["new"] = len(new_articles)
+            # URLs skipped on conflict were stored by a concurrent fetch
+            stored_urls.extend(a["url"] for a in new_articles)
+        except Exception:
+            # E.g. another fetch stored some of these first, or one article
+            # does not fit its columns; retry one at a time so a single bad
+            # article does not drop the whole batch
+            db.rollback()
+            for article_data in new_articles:
+                try:
+                    with db.begin_nested():
+                        db.add(self._build_article(source_id, article_data, now))
+                    stats["new"] += 1
+                except IntegrityError:
+                    pass
+                except Exception as e:
+                    logger.error(f"Error storing article: {e}")
+                    stats["errors"] += 1
+                    continue
+                stored_urls.append(article_data["url"])
 
-        # Update source stats
-        source.last_fetched_at = datetime.now(timezone.utc)
+        # Update source stats; validators are only kept once the articles
+        # they cover are stored, so a failed run re-downloads the feed
+        source.last_fetched_at = now
         source.last_fetch_status = "success"
         source.last_fetch_error = None
+        source.etag = response.headers.get("ETag")
+        source.last_modified = response.headers.get("Last-Modified")
         source.total_articles = (
             db.query(NewsArticle).filter(NewsArticle.source_id == source.id).count()
         )
 
         db.commit()
 
+        with self._seen_urls_lock:
+            for url in stored_urls:
+                self._seen_urls[(source_id, url)] = True
+
         logger.info(
             f"Fetched {stats['fetched']} articles from {source.name}, "
             f"{stats['new']} new, {stats['errors']} errors"
@@ -458,21 +561,74 @@ class NewsService:
 
         return stats
 
+    def _insert_articles_in_sql(
+        self,
+        db: Session,
+        source_id: int,
+        articles: List[Dict[str, Any]],
+        fetched_at: datetime,
+    ) -> int:
+        """
+        Insert articles with one statement, skipping URLs that already exist.
+
+        Returns:
+            Number of articles inserted
+        """
+        if not articles:
+            return 0
+
+        stmt = (
+            insert(NewsArticle)
+            .values([self._article_values(source_id, a, fetched_at) for a in articles])
+            .on_conflict_do_nothing(index_elements=[NewsArticle.url])
+            .returning(NewsArticle.id)
+        )
+        return len(db.execute(stmt).all())
+
+    def _build_article(
+        self, source_id: int, article_data: Dict[str, Any], fetched_at: datetime
+    ) -> NewsArticle:
+        """Create a NewsArticle from a parsed feed entry."""
+        return NewsArticle(**self._article_values(source_id, article_data, fetched_at))
+
+    def _article_values(
+        self, source_id: int, article_data: Dict[str, Any], fetched_at: datetime
+    ) -> Dict[str, Any]:
+        """Column values for a NewsArticle from a parsed feed entry."""
+        # Extract CVEs from title and summary
+        cves = self._extract_cves(
+            f"{article_data['title']} {article_data.get('summary', '')}"
+        )
+
+        return {
+            "source_id": source_id,
+            "title": article_data["title"],
+            "url": article_data["url"],
+            "author": article_data.get("author"),
+            "original_summary": article_data.get("summary"),
+            "published_at": article_data.get("published_at"),
+            "categories": article_data.get("categories"),
+            "fetched_at": fetched_at,
+            # SQL NULL rather than a JSON null, so related_cves IS NULL
+            # still finds articles without CVEs
+            "related_cves": cves or null(),
+        }
+
     def _extract_cves(self, text: str) -> Optional[List[str]]:
         """Extract CVE IDs from text."""
         if not text:
             return None
 
-        pattern = r"CVE-\d{4}-\d{4,7}"
-        cves = list(set(re.findall(pattern, text, re.IGNORECASE)))
-        return cves if cves else None
+        cves = {cve.upper() for cve in CVE_ID_PATTERN.findall(text)}
+        return sorted(cves) if cves else None
 
-    def fetch_all_sources(self, db: Session) -> Dict[str, Any]:
+    def fetch_all_sources(self, db: Session, limit: int = 50) -> Dict[str, Any]:
         """
         Fetch articles from all active sources.
 
         Args:
             db: Database session
+            limit: Maximum articles to process per source
 
         Returns:
             Dict with overall statistics
@@ -486,16 +642,27 @@ class NewsService:
             "total_errors": 0,
         }
 
-        for source in sources:
-            try:
-                stats = self.fetch_and_store_articles(db, source)
-                total_stats["sources_processed"] += 1
-                total_stats["total_fetched"] += stats["fetched"]
-                total_stats["total_new"] += stats["new"]
-                total_stats["total_errors"] += stats["errors"]
-            except Exception as e:
-                logger.error(f"Error processing source {source.name}: {e}")
-                total_stats["total_errors"] += 1
+        # Download and parse feeds concurrently; the database session is not
+        # thread-safe, so articles are still stored on this thread, one
+        # source at a time
+        urls = [source.url for source in sources]
+        etags = [source.etag for source in sources]
+        last_modified = [source.last_modified for source in sources]
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_FETCHES) as executor:
+            results = executor.map(
+                partial(self.fetch_articles, limit=limit), urls, etags, last_modified
+            )
+
+            for source, (response, articles) in zip(sources, results):
+                try:
+                    stats = self.store_articles(db, source, response, articles, limit)
+                    total_stats["sources_processed"] += 1
+                    total_stats["total_fetched"] += stats["fetched"]
+                    total_stats["total_new"] += stats["new"]
+                    total_stats["total_errors"] += stats["errors"]
+                except Exception as e:
+                    logger.error(f"Error processing source {source.name}: {e}")
+                    total_stats["total_errors"] += 1
 
         return total_stats
 
@@ -520,55 +687,38 @@ class NewsService:
             # Build prompt for article summarization
             content = article.original_summary or article.title
 
-            prompt = f"""You are a cybersecurity analyst summarizing security news.
-
-Article Title: {article.title}
+            prompt = f"""Article Title: {article.title}
 
 Article Content:
 {content[:1500]}
 
-Tasks:
-1. Write a 2-3 sentence summary focusing on the security implications
-2. List 2-3 key takeaways as bullet points
-3. Rate relevance to cybersecurity (0.0-1.0)
-4. Identify categories: vulnerability, malware, breach, ransomware, apt, policy, tool, other
-
-Respond in this exact JSON format:
-{{
-    "summary": "Your summary here",
-    "key_points": ["Point 1", "Point 2"],
-    "relevance": 0.8,
-    "categories": ["vulnerability", "malware"]
-}}
-
 JSON Response:"""
 
+            # The invariant instructions go in the system prompt so Ollama can
+            # reuse their cached prefix; keep_alive keeps the model loaded
+            # between the articles of a processing run
             response = llm.client.generate(
                 model=llm.model,
+                system=NEWS_SUMMARY_SYSTEM_PROMPT,
                 prompt=prompt,
                 options={"temperature": 0.3, "num_predict": 300},
+                format="json",
+                keep_alive="10m",
             )
 
-            # Parse JSON response
-            import json
-
-            response_text = response["response"].strip()
+            # JSON mode constrains the output to a single JSON value
+            result = json.loads(response["response"])
 
-            # Try to extract JSON from response
-            json_match = re.search(r"\{.*\}", response_text, re.DOTALL)
-            if json_match:
-                result = json.loads(json_match.group())
+            article.llm_summary = result.get("summary")
+            article.llm_key_points = result.get("key_points")
+            article.llm_relevance_score = result.get("relevance")
+            article.categories = result.get("categories")
+            article.llm_processed = True
+            article.llm_processed_at = datetime.now(timezone.utc)
 
-                article.llm_summary = result.get("summary")
-                article.llm_key_points = result.get("key_points")
-                article.llm_relevance_score = result.get("relevance")
-                article.categories = result.get("categories")
-                article.llm_processed = True
-                article.llm_processed_at = datetime.now(timezone.utc)
-
-                db.commit()
-                logger.info(f"Processed article with LLM: {article.title[:50]}...")
-                return True
+            db.commit()
+            logger.info(f"Processed article with LLM: {article.title[:50]}...")
+            return True
 
         except Exception as e:
             logger.error(f"Error processing article with LLM: {e}")
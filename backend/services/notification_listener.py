@@ -0,0 +1,159 @@
+"""
+Notification Listener.
+
+Relays PostgreSQL NOTIFY events for new notifications to the API's
+server-sent event streams, so clients are told when their unread count
+changes instead of polling for it.
+"""
+
+import asyncio
+import logging
+import os
+from collections import defaultdict
+from typing import Dict, Set
+
+import psycopg2
+import psycopg2.extensions
+
+from backend.database import DATABASE_URL
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "notifications"
+
+# LISTEN needs a session-level connection, which PgBouncer in transaction
+# mode cannot provide; point this at PostgreSQL directly in that setup
+NOTIFY_DATABASE_URL = os.getenv("NOTIFY_DATABASE_URL", DATABASE_URL)
+
+# Backoff between reconnect attempts after the connection is lost, in seconds
+RECONNECT_MIN_DELAY = 1
+RECONNECT_MAX_DELAY = 60
+
+
+class NotificationListener:
+    """
+    One LISTEN connection per process, fanned out to per-user queues.
+
+    The connection socket is watched by the event loop, so only connecting
+    runs in a thread; a lost connection is reopened with backoff. Queues
+    hold at most one pending signal; bursts of inserts for the same user
+    collapse into a single refresh.
+    """
+
+    def __init__(self, database_url: str = NOTIFY_DATABASE_URL):
+        self.database_url = database_url
+        self._conn = None
+        self._loop = None
+        self._reconnect_task = None
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = defaultdict(set)
+
+    @property
+    def active(self) -> bool:
+        """Whether notifications are currently being received."""
+        return self._conn is not None
+
+    async def start(self):
+        """Open the LISTEN connection, retrying in the background if that fails."""
+        if not self.database_url.startswith("postgresql"):
+            return
+
+        self._loop = asyncio.get_running_loop()
+        try:
+            await self._connect()
+        except Exception as e:
+            logger.warning(f"Notification listener unavailable: {e}")
+            self._schedule_reconnect()
+
+    async def stop(self):
+        """Close the LISTEN connection and stop reconnecting."""
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+
+        if self._conn is None:
+            return
+
+        self._loop.remove_reader(self._conn.fileno())
+        self._conn.close()
+        self._conn = None
+
+    def subscribe(self, user_id: int) -> asyncio.Queue:
+        """Register a queue that is signalled on new notifications for a user."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._subscribers[user_id].add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: int, queue: asyncio.Queue):
+        """Remove a queue registered with subscribe."""
+        queues = self._subscribers.get(user_id)
+        if queues is None:
+            return
+
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[user_id]
+
+    def _open_connection(self):
+        """Connect and LISTEN; blocking, so run it off the event loop."""
+        conn = psycopg2.connect(self.database_url)
+        try:
+            conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    async def _connect(self):
+        self._conn = await asyncio.to_thread(self._open_connection)
+        self._loop.add_reader(self._conn.fileno(), self._on_readable)
+        logger.info(f"Listening for notifications on '{NOTIFY_CHANNEL}'")
+
+    def _schedule_reconnect(self):
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = self._loop.create_task(self._reconnect())
+
+    async def _reconnect(self):
+        delay = RECONNECT_MIN_DELAY
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                await self._connect()
+                return
+            except Exception as e:
+                delay = min(delay * 2, RECONNECT_MAX_DELAY)
+                logger.warning(
+                    f"Notification listener reconnect failed, retrying in {delay}s: {e}"
+                )
+
+    def _on_readable(self):
+        try:
+            self._conn.poll()
+        except psycopg2.Error as e:
+            # Streams notice via active and clients fall back to polling
+            # until the connection is back
+            logger.warning(f"Notification listener connection lost, reconnecting: {e}")
+            self._loop.remove_reader(self._conn.fileno())
+            try:
+                self._conn.close()
+            except psycopg2.Error:
+                pass
+            self._conn = None
+            self._schedule_reconnect()
+            return
+
+        while self._conn.notifies:
+            notify = self._conn.notifies.pop(0)
+            try:
+                user_id = int(notify.payload)
+            except ValueError:
+                continue
+
+            for queue in self._subscribers.get(user_id, ()):
+                if queue.empty():
+                    queue.put_nowait(None)
+
+
+# Global listener instance
+notification_listener = NotificationListener()
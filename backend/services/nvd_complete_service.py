@@ -18,7 +18,7 @@ import requests
 from dotenv import load_dotenv
 from sqlalchemy.orm import Session
 
-from backend.database import get_db
+from backend.database import bulk_copy, get_db
 from backend.models import Vulnerability
 from backend.services.stats_cache_service import refresh_stats_cache
 
@@ -28,6 +28,16 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
+def format_cpe_name(name: str) -> str:
+    """
+    Format a CPE vendor or product component the way it is stored.
+
+    Filters on Vulnerability.vendors / products must use the same form to
+    match with JSONB containment (e.g. "microsoft" -> "Microsoft").
+    """
+    return name.replace("_", " ").title()
+
+
 class NVDCompleteService:
     """Service for fetching complete CVE data from NVD API 2.0"""
 
@@ -183,10 +193,13 @@ class NVDCompleteService:
                 # Process CVEs
                 db = next(get_db())
                 try:
+                    # New CVEs are collected per page and written with COPY
+                    new_rows: Dict[str, Dict[str, Any]] = {}
                     for vuln_data in vulnerabilities:
-                        self._process_cve(db, vuln_data)
+                        self._process_cve(db, vuln_data, new_rows)
                         total_processed += 1
 
+                    bulk_copy(db, Vulnerability, list(new_rows.values()))
                     db.commit()
                     logger.info(
                         f"Processed {len(vulnerabilities)} CVEs (Total: {total_processed}/{total_results})"
@@ -238,13 +251,20 @@ class NVDCompleteService:
 
         return total_processed
 
-    def _process_cve(self, db: Session, vuln_data: Dict[str, Any]) -> None:
+    def _process_cve(
+        self,
+        db: Session,
+        vuln_data: Dict[str, Any],
+        new_rows: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> None:
         """
         Process a single CVE and store in database.
 
         Args:
             db: Database session
             vuln_data: CVE data from NVD API
+            new_rows: If given, new CVEs are collected here by CVE ID for a
+                bulk insert instead of being added to the session
         """
         cve = vuln_data.get("cve", {})
         cve_id = cve.get("id")
@@ -392,7 +412,7 @@ class NVDCompleteService:
 
         else:
             # Create new
-            vulnerability = Vulnerability(
+            row = dict(
                 cve_id=cve_id,
                 title=f"Vulnerability in {cve_id}",
                 description=description,
@@ -414,7 +434,10 @@ class NVDCompleteService:
                 created_at=datetime.utcnow(),
                 updated_at=datetime.utcnow(),
             )
-            db.add(vulnerability)
+            if new_rows is not None:
+                new_rows[cve_id] = row
+            else:
+                db.add(Vulnerability(**row))
             logger.debug(f"Created new CVE: {cve_id}")
 
     def _parse_cpe(self, cpe_list: List[str]) -> Dict[str, set]:
@@ -434,8 +457,8 @@ class NVDCompleteService:
         for cpe in cpe_list:
             parts = cpe.split(":")
             if len(parts) >= 5:
-                vendor = parts[3].replace("_", " ").title()
-                product = parts[4].replace("_", " ").title()
+                vendor = format_cpe_name(parts[3])
+                product = format_cpe_name(parts[4])
 
                 if vendor not in vendors_products:
                     vendors_products[vendor] = set()
@@ -0,0 +1,107 @@
+"""
+Search Cache Service.
+
+Two-level cache for expensive search results: a per-process TTL cache in
+front of the shared search_cache table, so popular queries skip the
+database entirely and other workers still reuse each other's results.
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Tuple
+
+from cachetools import TTLCache
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from backend.models import SearchCache
+
+logger = logging.getLogger(__name__)
+
+SEARCH_CACHE_TTL = 300  # 5 minutes
+
+CachedResult = Tuple[List[Any], int]
+
+_memory_cache: TTLCache = TTLCache(maxsize=2048, ttl=SEARCH_CACHE_TTL)
+_memory_lock = threading.Lock()
+
+
+def get_or_compute(
+    db: Session,
+    query_type: str,
+    query_params: Dict[str, Any],
+    compute: Callable[[], CachedResult],
+) -> CachedResult:
+    """
+    Return cached search results, computing and storing them on a miss.
+
+    Looks in process memory first, then the search_cache table, then calls
+    compute. The table layer is PostgreSQL only; other dialects always
+    compute.
+
+    Args:
+        db: Database session
+        query_type: Kind of search, e.g. "vulnerability_search"
+        query_params: JSON-serializable parameters identifying the query
+        compute: Returns (results, result_count); results must be JSON-serializable
+
+    Returns:
+        Tuple of (results, result_count)
+    """
+    if db.bind.dialect.name != "postgresql":
+        return compute()
+
+    key = SearchCache.make_key(query_type, query_params)
+
+    with _memory_lock:
+        cached = _memory_cache.get(key)
+    if cached is not None:
+        return cached
+
+    now = datetime.now(timezone.utc)
+    row = db.execute(
+        update(SearchCache)
+        .where(SearchCache.cache_key == key, SearchCache.expires_at > now)
+        .values(hit_count=SearchCache.hit_count + 1)
+        .returning(SearchCache.results, SearchCache.result_count)
+    ).first()
+
+    if row is not None:
+        db.commit()
+        value = (row.results, row.result_count)
+    else:
+        value = compute()
+        results, result_count = value
+
+        stmt = insert(SearchCache).values(
+            cache_key=key,
+            query_type=query_type,
+            query_params=query_params,
+            results=results,
+            result_count=result_count,
+            created_at=now,
+            expires_at=now + timedelta(seconds=SEARCH_CACHE_TTL),
+            hit_count=0,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SearchCache.cache_key],
+            set_={
+                "results": stmt.excluded.results,
+                "result_count": stmt.excluded.result_count,
+                "created_at": stmt.excluded.created_at,
+                "expires_at": stmt.excluded.expires_at,
+                "hit_count": 0,
+            },
+        )
+        try:
+            db.execute(stmt)
+            db.commit()
+        except Exception as e:
+            logger.warning(f"Failed to store search cache entry: {e}")
+            db.rollback()
+
+    with _memory_lock:
+        _memory_cache[key] = value
+    return value
@@ -1,16 +1,25 @@
 """
 Stats Cache Service.
 
-Provides utilities to refresh the vulnerability statistics cache.
+Provides utilities to refresh the vulnerability statistics cache and the
+materialized vulnerability feed, and to keep monthly table partitions
+created ahead of time.
 """
 
 import logging
+import os
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
+# Tables range-partitioned by month (see partition_time_series_tables.sql)
+PARTITIONED_TABLES = ("notifications", "ingestion_runs", "page_views")
+
+# Months of page views to keep; 0 keeps them all
+PAGE_VIEW_RETENTION_MONTHS = int(os.getenv("PAGE_VIEW_RETENTION_MONTHS", "0"))
+
 
 def refresh_stats_cache(db: Session) -> bool:
     """
@@ -37,3 +46,63 @@ def refresh_stats_cache(db: Session) -> bool:
         logger.error(f"Failed to refresh stats cache: {e}")
         db.rollback()
         return False
+
+
+def refresh_vulnerability_feed(db: Session) -> bool:
+    """
+    Refresh the vulnerability listing materialized view.
+
+    Uses CONCURRENTLY so listing reads are not blocked while it rebuilds.
+
+    Args:
+        db: Database session
+
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        logger.info("Refreshing vulnerability feed view...")
+        db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY vulnerability_feed_mv"))
+        db.commit()
+        logger.info("✓ Vulnerability feed refreshed successfully")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to refresh vulnerability feed: {e}")
+        db.rollback()
+        return False
+
+
+def ensure_time_partitions(db: Session) -> bool:
+    """
+    Create the upcoming monthly partitions of the time-series tables.
+
+    Also drops page view partitions past PAGE_VIEW_RETENTION_MONTHS, which
+    discards whole months without a DELETE.
+
+    Args:
+        db: Database session
+
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        for table in PARTITIONED_TABLES:
+            db.execute(
+                text("SELECT ensure_monthly_partitions(:parent)"), {"parent": table}
+            )
+
+        if PAGE_VIEW_RETENTION_MONTHS > 0:
+            dropped = db.execute(
+                text("SELECT drop_monthly_partitions('page_views', :keep)"),
+                {"keep": PAGE_VIEW_RETENTION_MONTHS},
+            ).scalar()
+            if dropped:
+                logger.info(f"Dropped {dropped} expired page view partitions")
+
+        db.commit()
+        logger.info("✓ Monthly partitions ensured")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to ensure monthly partitions: {e}")
+        db.rollback()
+        return False
@@ -19,9 +19,10 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import sqlalchemy as sa
 from sqlalchemy import func, or_
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload, selectinload
 
 from backend.models import PackageCPEMapping, TechStack, TechStackMatch, Vulnerability
+from backend.services.nvd_complete_service import format_cpe_name
 
 logger = logging.getLogger(__name__)
 
@@ -701,31 +702,24 @@ class TechStackService:
 
         # Query vulnerabilities
         # We search in products, vendors, and affected_products (CPE) fields
-        # Note: products/vendors are stored as JSON arrays, not PostgreSQL arrays
         query = db.query(Vulnerability)
 
-        # Build OR conditions for product matching using JSON containment
-        # We use text-based search on the JSON cast to text for flexibility
-        conditions = []
+        # Vendors and products are stored as format_cpe_name() strings, so
+        # normalize the patterns the same way and use JSONB containment
+        conditions = [
+            Vulnerability.products.contains([name])
+            for name in {format_cpe_name(pattern) for pattern in search_patterns}
+        ]
+
+        # affected_products holds full CPE strings, where the product is only
+        # one component; containment cannot match part of an element, so
+        # this one keeps the substring search on the array's text
+        affected_text = func.lower(func.cast(Vulnerability.affected_products, sa.Text))
         for pattern in set(search_patterns):
-            # Check if pattern is in products JSON array (cast to text for LIKE search)
-            conditions.append(
-                func.lower(func.cast(Vulnerability.products, sa.Text)).contains(pattern)
-            )
-            # Also check affected_products (CPE strings)
-            conditions.append(
-                func.lower(
-                    func.cast(Vulnerability.affected_products, sa.Text)
-                ).contains(pattern)
-            )
+            conditions.append(affected_text.contains(pattern))
 
         if vendor:
-            vendor_normalized = vendor.lower()
-            conditions.append(
-                func.lower(func.cast(Vulnerability.vendors, sa.Text)).contains(
-                    vendor_normalized
-                )
-            )
+            conditions.append(Vulnerability.vendors.contains([format_cpe_name(vendor)]))
 
         if conditions:
             query = query.filter(or_(*conditions))
@@ -843,7 +837,6 @@ class TechStackService:
             user_id=user_id,
             packages=packages,
             source_type=source_type,
-            package_count=len(packages),
         )
         db.add(tech_stack)
         db.flush()
@@ -933,9 +926,10 @@ class TechStackService:
         if not tech_stack:
             return None
 
-        # Get matches with vulnerability details
+        # Get matches with vulnerability details, loaded in one IN query
         matches = (
             db.query(TechStackMatch)
+            .options(selectinload(TechStackMatch.vulnerability), raiseload("*"))
             .filter(TechStackMatch.tech_stack_id == tech_stack_id)
             .order_by(TechStackMatch.match_confidence.desc())
             .all()
@@ -13,7 +13,11 @@ from backend.celery_app import celery_app as celery
 from backend.database import get_db
 from backend.services.cisa_kev_service import get_cisa_kev_service
 from backend.services.nvd_complete_service import get_nvd_service
-from backend.services.stats_cache_service import refresh_stats_cache
+from backend.services.stats_cache_service import (
+    ensure_time_partitions,
+    refresh_stats_cache,
+    refresh_vulnerability_feed,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -106,6 +110,49 @@ def refresh_stats_cache_task() -> dict:
         db.close()
 
 
+@celery.task(name="tasks.refresh_vulnerability_feed")
+def refresh_vulnerability_feed_task() -> dict:
+    """
+    Refresh the materialized vulnerability feed used by the listing API.
+
+    Returns:
+        Dict with status
+    """
+    db = next(get_db())
+    try:
+        success = refresh_vulnerability_feed(db)
+
+        return {
+            "status": "success" if success else "error",
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
+    finally:
+        db.close()
+
+
+@celery.task(name="tasks.ensure_partitions")
+def ensure_partitions_task() -> dict:
+    """
+    Pre-create the next monthly partitions of the time-series tables and drop
+    expired page view months.
+
+    Returns:
+        Dict with status
+    """
+    db = next(get_db())
+    try:
+        success = ensure_time_partitions(db)
+
+        return {
+            "status": "success" if success else "error",
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
+    finally:
+        db.close()
+
+
 @celery.task(name="tasks.fetch_nvd_recent", bind=True, max_retries=3)
 def fetch_nvd_recent_task(self, days: int = 1) -> dict:
     """
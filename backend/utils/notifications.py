@@ -6,6 +6,7 @@ import logging
 import re
 from typing import List, Optional
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from ..models import Comment, Notification, User
@@ -51,47 +52,44 @@ def create_mention_notifications(
     if not mentioned_usernames:
         return 0
 
-    # Find users by username
-    mentioned_users = (
-        db.query(User).filter(User.username.in_(mentioned_usernames)).all()
-    )
-
-    notifications_created = 0
-
-    for user in mentioned_users:
-        # Don't notify if user mentions themselves
-        if user.id == actor.id:
-            continue
-
-        # Check if notification already exists (avoid duplicates)
-        existing = (
-            db.query(Notification)
-            .filter(
-                Notification.user_id == user.id,
-                Notification.comment_id == comment.id,
-                Notification.type == "mention",
-            )
-            .first()
+    # Find users by username, skipping self-mentions
+    mentioned_user_ids = [
+        user_id
+        for (user_id,) in db.query(User.id).filter(
+            User.username.in_(mentioned_usernames), User.id != actor.id
         )
+    ]
+    if not mentioned_user_ids:
+        return 0
 
-        if existing:
-            continue
-
-        # Create notification
-        notification = Notification(
-            user_id=user.id,
-            type="mention",
-            title=f"{actor.username} mentioned you",
-            message=f"@{actor.username} mentioned you in a comment on {comment.cve_id}",
-            comment_id=comment.id,
-            cve_id=comment.cve_id,
-            actor_id=actor.id,
+    # Skip users already notified about this comment (avoid duplicates)
+    already_notified = {
+        user_id
+        for (user_id,) in db.query(Notification.user_id).filter(
+            Notification.user_id.in_(mentioned_user_ids),
+            Notification.comment_id == comment.id,
+            Notification.type == "mention",
         )
-
-        db.add(notification)
-        notifications_created += 1
+    }
+
+    # Create all notifications in one executemany insert
+    rows = [
+        {
+            "user_id": user_id,
+            "type": "mention",
+            "title": f"{actor.username} mentioned you",
+            "message": f"@{actor.username} mentioned you in a comment on {comment.cve_id}",
+            "comment_id": comment.id,
+            "cve_id": comment.cve_id,
+            "actor_id": actor.id,
+        }
+        for user_id in mentioned_user_ids
+        if user_id not in already_notified
+    ]
+    notifications_created = len(rows)
 
     if notifications_created > 0:
+        db.execute(insert(Notification), rows)
         db.commit()
         logger.info(
             f"Created {notifications_created} mention notification(s) for comment {comment.id}"
@@ -153,13 +153,64 @@ export function NotificationCenter() {
   };
 
   useEffect(() => {
-    if (isAuthenticated) {
+    if (!isAuthenticated || !token) return;
+
+    const controller = new AbortController();
+    let interval: ReturnType<typeof setInterval> | undefined;
+
+    const startPolling = () => {
       fetchUnreadCount();
       // Poll for new notifications every 30 seconds
-      const interval = setInterval(fetchUnreadCount, 30000);
-      return () => clearInterval(interval);
-    }
-  }, [isAuthenticated]);
+      interval = setInterval(fetchUnreadCount, 30000);
+    };
+
+    // Prefer the server-sent unread count stream; fall back to polling
+    const streamUnreadCount = async () => {
+      try {
+        const response = await fetch("/api/v1/notifications/stream", {
+          headers: {
+            Authorization: `Bearer ${token}`,
+          },
+          signal: controller.signal,
+        });
+        if (!response.ok || !response.body) {
+          throw new Error("Notification stream unavailable");
+        }
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = "";
+
+        while (true) {
+          const { done, value } = await reader.read();
+          if (done) break;
+
+          buffer += decoder.decode(value, { stream: true });
+          const events = buffer.split("\n\n");
+          buffer = events.pop() ?? "";
+
+          for (const event of events) {
+            if (event.startsWith("data: ")) {
+              setUnreadCount(JSON.parse(event.slice(6)).unread_count);
+            }
+          }
+        }
+      } catch (error) {
+        // Silently fall back to polling
+      }
+
+      if (!controller.signal.aborted) {
+        startPolling();
+      }
+    };
+
+    streamUnreadCount();
+
+    return () => {
+      controller.abort();
+      if (interval) clearInterval(interval);
+    };
+  }, [isAuthenticated, token]);
 
   useEffect(() => {
     if (isOpen) {
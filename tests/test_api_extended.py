@@ -166,6 +166,24 @@ class TestDataSourcesEndpoints:
             data = response.json()
             assert "source" in data
             assert data["source"] == "bsi_cert"
+    
+    def test_nvd_status_null_severity(self):
+        """Test that CVEs without a severity are counted under UNKNOWN."""
+        from unittest.mock import MagicMock, patch
+        from fastapi.testclient import TestClient
+        from backend.main import app
+        
+        db = MagicMock()
+        query = db.query.return_value.filter.return_value
+        query.count.return_value = 3
+        query.order_by.return_value.first.return_value = None
+        query.group_by.return_value.all.return_value = [("HIGH", 2), (None, 1)]
+        
+        with patch("backend.database.get_db", return_value=iter([db])):
+            response = TestClient(app).get("/api/v1/data-sources/nvd/status")
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["severity_breakdown"] == {"HIGH": 2, "UNKNOWN": 1}
 
 
 @pytest.mark.api
@@ -211,3 +229,35 @@ class TestErrorCases:
         response = client.get("/api/v1/vulnerabilities?page=-1")
         
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.unit
+class TestSearchNameFilter:
+    """Test vendor and product filters of the search endpoint."""
+    
+    def test_exact_name_uses_containment(self):
+        """Test that exact names are normalized and matched with @>."""
+        from sqlalchemy.dialects import postgresql
+        from backend.api.search import name_filter
+        from backend.models import Vulnerability
+        
+        compiled = name_filter(Vulnerability.products, "windows_10").compile(
+            dialect=postgresql.dialect()
+        )
+        
+        assert str(compiled).startswith("vulnerabilities.products @> ")
+        assert list(compiled.params.values()) == [["Windows 10"]]
+    
+    def test_partial_name_uses_substring(self):
+        """Test that partial names keep the case-insensitive substring match."""
+        from sqlalchemy.dialects import postgresql
+        from backend.api.search import name_filter
+        from backend.models import Vulnerability
+        
+        compiled = name_filter(Vulnerability.vendors, "Micro_", partial=True).compile(
+            dialect=postgresql.dialect()
+        )
+        
+        assert "lower(CAST(vulnerabilities.vendors AS VARCHAR)) LIKE" in str(compiled)
+        # LIKE wildcards in the input are escaped
+        assert list(compiled.params.values()) == ["micro/_"]
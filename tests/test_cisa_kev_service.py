@@ -4,7 +4,6 @@ Tests for CISA KEV service.
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from backend.services.cisa_kev_service import CISAKEVService, get_cisa_kev_service
-from backend.models import Vulnerability
 
 
 class TestCISAKEVService:
@@ -53,13 +52,14 @@ class TestCISAKEVService:
         assert kev_service is not None
         assert kev_service.NVD_API_BASE == "https://services.nvd.nist.gov/rest/json/cves/2.0"
         assert kev_service.nvd_service is not None
+        assert kev_service.session.headers["Accept"] == "application/json"
     
     def test_get_cisa_kev_service(self):
         """Test service factory function."""
         service = get_cisa_kev_service()
         assert isinstance(service, CISAKEVService)
     
-    @patch('backend.services.cisa_kev_service.requests.get')
+    @patch('backend.services.cisa_kev_service.requests.Session.get')
     def test_fetch_kev_cves_success(self, mock_get, kev_service, mock_nvd_response):
         """Test successful KEV CVE fetching from NVD API."""
         mock_response = Mock()
@@ -79,7 +79,7 @@ class TestCISAKEVService:
         assert "hasKev" in call_args[0][0]
         assert "resultsPerPage=2000" in call_args[0][0]
     
-    @patch('backend.services.cisa_kev_service.requests.get')
+    @patch('backend.services.cisa_kev_service.requests.Session.get')
     def test_fetch_kev_cves_api_error(self, mock_get, kev_service):
         """Test handling of API errors."""
         mock_get.side_effect = Exception("API Error")
@@ -88,7 +88,7 @@ class TestCISAKEVService:
         
         assert result == []
     
-    @patch('backend.services.cisa_kev_service.requests.get')
+    @patch('backend.services.cisa_kev_service.requests.Session.get')
     def test_fetch_kev_cves_pagination(self, mock_get, kev_service):
         """Test pagination handling."""
         # First page
@@ -119,6 +119,34 @@ class TestCISAKEVService:
         assert result[0]["cve"]["id"] == "CVE-2024-1111"
         assert result[1]["cve"]["id"] == "CVE-2024-2222"
     
+    @patch('backend.services.cisa_kev_service.time.sleep')
+    @patch('backend.services.cisa_kev_service.requests.Session.get')
+    def test_fetch_kev_cves_concurrent_pages_with_api_key(self, mock_get, mock_sleep):
+        """Test that pages fetched concurrently are returned in order."""
+        kev_service = CISAKEVService(api_key="test-key")
+        pages = []
+        for start_index in range(3):
+            response = Mock()
+            response.json.return_value = {
+                "resultsPerPage": 1,
+                "startIndex": start_index,
+                "totalResults": 3,
+                "vulnerabilities": [{"cve": {"id": f"CVE-2024-000{start_index}"}}]
+            }
+            pages.append(response)
+
+        mock_get.side_effect = lambda url, timeout: pages[int(url.rsplit("=", 1)[1])]
+
+        result = kev_service.fetch_kev_cves()
+
+        assert [cve["cve"]["id"] for cve in result] == [
+            "CVE-2024-0000",
+            "CVE-2024-0001",
+            "CVE-2024-0002",
+        ]
+        assert mock_get.call_count == 3
+        mock_sleep.assert_called_with(0.6)
+    
     def test_update_exploited_vulnerabilities_no_data(self, kev_service):
         """Test update when no KEV data is available."""
         mock_db = Mock()
@@ -134,29 +162,27 @@ class TestCISAKEVService:
         """Test successful vulnerability update."""
         mock_db = Mock()
         
-        # Create mock vulnerabilities
-        mock_vuln1 = Mock(spec=Vulnerability)
-        mock_vuln1.cve_id = "CVE-2024-1234"
-        mock_vuln1.exploited_in_the_wild = False
-        mock_vuln1.sources = []
-        mock_vuln1.cvss_score = 7.5
-        mock_vuln1.severity = "HIGH"
-        mock_vuln1.published_at = Mock()
-        mock_vuln1.published_at.isoformat.return_value = "2024-01-01T00:00:00"
-        
-        mock_vuln2 = Mock(spec=Vulnerability)
-        mock_vuln2.cve_id = "CVE-2024-5678"
-        mock_vuln2.exploited_in_the_wild = False
-        mock_vuln2.sources = []
-        mock_vuln2.cvss_score = 9.8
-        mock_vuln2.severity = "CRITICAL"
-        mock_vuln2.published_at = Mock()
-        mock_vuln2.published_at.isoformat.return_value = "2024-01-01T00:00:00"
-        
-        # Mock database query
-        mock_query = Mock()
-        mock_query.filter.return_value.first.side_effect = [mock_vuln1, mock_vuln2]
-        mock_db.query.return_value = mock_query
+        # Create mock vulnerability rows
+        mock_row1 = Mock()
+        mock_row1.id = 1
+        mock_row1.sources = ["nvd"]
+        mock_row1.cvss_score = 7.5
+        mock_row1.severity = "HIGH"
+        mock_row1.published_at = Mock()
+        mock_row1.published_at.isoformat.return_value = "2024-01-01T00:00:00"
+        
+        mock_row2 = Mock()
+        mock_row2.id = 2
+        mock_row2.sources = ["nvd", "cisa_kev"]
+        mock_row2.cvss_score = 9.8
+        mock_row2.severity = "CRITICAL"
+        mock_row2.published_at = None
+        
+        # Mock the bulk lookup query
+        mock_db.query.return_value.filter.return_value.all.return_value = [
+            mock_row1,
+            mock_row2,
+        ]
         
         with patch.object(kev_service, 'fetch_kev_cves', return_value=mock_nvd_response["vulnerabilities"]):
             result = kev_service.update_exploited_vulnerabilities(mock_db)
@@ -166,13 +192,17 @@ class TestCISAKEVService:
         assert result["not_found"] == 0
         assert result["total_kev_entries"] == 2
         
+        # Verify both rows were written in one bulk update
+        mock_db.bulk_update_mappings.assert_called_once()
+        updates = mock_db.bulk_update_mappings.call_args[0][1]
+        assert [u["id"] for u in updates] == [1, 2]
+        
         # Verify vulnerabilities were marked as exploited
-        assert mock_vuln1.exploited_in_the_wild == True
-        assert mock_vuln2.exploited_in_the_wild == True
+        assert all(u["exploited_in_the_wild"] is True for u in updates)
         
-        # Verify CISA source was added
-        assert "cisa_kev" in mock_vuln1.sources
-        assert "cisa_kev" in mock_vuln2.sources
+        # Verify CISA source was added once
+        assert updates[0]["sources"] == ["nvd", "cisa_kev"]
+        assert updates[1]["sources"] == ["nvd", "cisa_kev"]
         
         # Verify commit was called
         mock_db.commit.assert_called()
@@ -181,10 +211,8 @@ class TestCISAKEVService:
         """Test update when CVEs are not found in database."""
         mock_db = Mock()
         
-        # Mock database query to return None (CVE not found)
-        mock_query = Mock()
-        mock_query.filter.return_value.first.return_value = None
-        mock_db.query.return_value = mock_query
+        # Mock database query to return no rows (CVEs not found)
+        mock_db.query.return_value.filter.return_value.all.return_value = []
         
         with patch.object(kev_service, 'fetch_kev_cves', return_value=mock_nvd_response["vulnerabilities"]):
             result = kev_service.update_exploited_vulnerabilities(mock_db)
@@ -197,20 +225,17 @@ class TestCISAKEVService:
         """Test update with some CVEs found and some not found."""
         mock_db = Mock()
         
-        # Create one mock vulnerability
-        mock_vuln = Mock(spec=Vulnerability)
-        mock_vuln.cve_id = "CVE-2024-1234"
-        mock_vuln.exploited_in_the_wild = False
-        mock_vuln.sources = []
-        mock_vuln.cvss_score = 7.5
-        mock_vuln.severity = "HIGH"
-        mock_vuln.published_at = Mock()
-        mock_vuln.published_at.isoformat.return_value = "2024-01-01T00:00:00"
+        # Create one mock vulnerability row
+        mock_row = Mock()
+        mock_row.id = 1
+        mock_row.sources = []
+        mock_row.cvss_score = 7.5
+        mock_row.severity = "HIGH"
+        mock_row.published_at = Mock()
+        mock_row.published_at.isoformat.return_value = "2024-01-01T00:00:00"
         
         # Mock database query - first found, second not found
-        mock_query = Mock()
-        mock_query.filter.return_value.first.side_effect = [mock_vuln, None]
-        mock_db.query.return_value = mock_query
+        mock_db.query.return_value.filter.return_value.all.return_value = [mock_row]
         
         with patch.object(kev_service, 'fetch_kev_cves', return_value=mock_nvd_response["vulnerabilities"]):
             result = kev_service.update_exploited_vulnerabilities(mock_db)
@@ -218,3 +243,53 @@ class TestCISAKEVService:
         assert result["status"] == "success"
         assert result["updated"] == 1
         assert result["not_found"] == 1
+    
+    def test_update_exploited_vulnerabilities_postgresql(self, kev_service, mock_nvd_response):
+        """Test that PostgreSQL marks KEV CVEs with one server-side UPDATE."""
+        from sqlalchemy.dialects import postgresql
+        
+        mock_db = Mock()
+        mock_db.bind.dialect.name = "postgresql"
+        mock_db.execute.return_value.rowcount = 1
+        
+        with patch.object(kev_service, 'fetch_kev_cves', return_value=mock_nvd_response["vulnerabilities"]):
+            result = kev_service.update_exploited_vulnerabilities(mock_db)
+        
+        assert result["updated"] == 1
+        assert result["not_found"] == 1
+        
+        # No rows were loaded or written back from Python
+        mock_db.query.assert_not_called()
+        mock_db.bulk_update_mappings.assert_not_called()
+        
+        update_stmt = mock_db.execute.call_args_list[0][0][0]
+        sql = str(
+            update_stmt.compile(
+                dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+            )
+        )
+        assert sql.startswith("UPDATE vulnerabilities SET exploited_in_the_wild=true")
+        assert "WHERE vulnerabilities.cve_id IN ('CVE-" in sql
+
+        # sources: append "cisa_kev" only when it is not already present
+        assert (
+            "sources=CASE WHEN (vulnerabilities.sources @> CAST('[\"cisa_kev\"]' AS JSONB)) "
+            "THEN vulnerabilities.sources "
+            "ELSE coalesce(vulnerabilities.sources, CAST('[]' AS JSONB)) "
+            "|| CAST('[\"cisa_kev\"]' AS JSONB) END"
+        ) in sql
+
+        # priority_score: the weights of NVDCompleteService._calculate_priority
+        assert (
+            "WHEN (vulnerabilities.severity = 'CRITICAL') THEN 1.0 "
+            "WHEN (vulnerabilities.severity = 'HIGH') THEN 0.7 "
+            "WHEN (vulnerabilities.severity = 'MEDIUM') THEN 0.4 "
+            "WHEN (vulnerabilities.severity = 'LOW') THEN 0.2 ELSE 0.0 END * 0.4"
+        ) in sql
+        # Published within 7 days (cutoff 8 days) or 30 days (cutoff 31 days)
+        assert (
+            "CASE WHEN (vulnerabilities.published_at > now() - make_interval(secs=>691200.0)) THEN 1.0 "
+            "WHEN (vulnerabilities.published_at > now() - make_interval(secs=>2678400.0)) THEN 0.5 "
+            "ELSE 0.0 END * 0.2 + 0.4 AS NUMERIC), 3)"
+        ) in sql
+        assert "priority_score=round(CAST(CASE WHEN (vulnerabilities.cvss_score != 0) " in sql
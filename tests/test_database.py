@@ -0,0 +1,93 @@
+"""
+Tests for database helpers.
+"""
+import pytest
+from unittest.mock import MagicMock
+
+from backend.database import bulk_copy
+from backend.models import Vulnerability
+
+
+def mock_postgresql_db():
+    """Mock PostgreSQL session recording each COPY statement and its data."""
+    db = MagicMock()
+    db.bind.dialect.name = "postgresql"
+    copies = []
+
+    def copy_expert(sql, buffer):
+        copies.append((sql, buffer.read()))
+
+    cursor = db.connection.return_value.connection.cursor.return_value
+    cursor.copy_expert.side_effect = copy_expert
+    return db, copies
+
+
+@pytest.mark.unit
+class TestBulkCopy:
+    """Test COPY-based bulk inserts."""
+
+    def test_empty_rows(self):
+        """Test that no rows means no COPY."""
+        db, copies = mock_postgresql_db()
+
+        assert bulk_copy(db, Vulnerability, []) == 0
+        assert copies == []
+
+    def test_single_copy_with_python_defaults(self):
+        """Test that rows with the same keys go out in one COPY with defaults filled in."""
+        db, copies = mock_postgresql_db()
+        rows = [
+            {"cve_id": "CVE-2024-0001", "title": "One", "sources": ["nvd"]},
+            {"cve_id": "CVE-2024-0002", "title": "Two\tTabbed", "sources": None},
+        ]
+
+        assert bulk_copy(db, Vulnerability, rows) == 2
+
+        (sql, data) = copies[0]
+        assert len(copies) == 1
+        assert '"cve_id"' in sql and '"title"' in sql and '"sources"' in sql
+        # Python-side default, not sent by the caller
+        assert '"exploited_in_the_wild"' in sql
+        # Server-side default, left to PostgreSQL
+        assert '"created_at"' not in sql
+        lines = data.splitlines()
+        assert len(lines) == 2
+        assert 'CVE-2024-0001' in lines[0] and '["nvd"]' in lines[0]
+        assert "Two\\tTabbed" in lines[1] and "\\N" in lines[1]
+
+    def test_mixed_key_sets_copy_separately(self):
+        """Test that a column missing from some rows is not sent as NULL for them."""
+        db, copies = mock_postgresql_db()
+        rows = [
+            {"cve_id": "CVE-2024-0001", "title": "One"},
+            {"cve_id": "CVE-2024-0002", "title": "Two", "created_at": "2024-01-01T00:00:00"},
+            {"cve_id": "CVE-2024-0003", "title": "Three"},
+        ]
+
+        assert bulk_copy(db, Vulnerability, rows) == 3
+
+        assert len(copies) == 2
+        without, with_created = copies
+        assert '"created_at"' not in without[0]
+        assert len(without[1].splitlines()) == 2
+        assert '"created_at"' in with_created[0]
+        assert with_created[1].count("\n") == 1
+        assert "2024-01-01T00:00:00" in with_created[1]
+
+    def test_other_dialects_use_executemany(self):
+        """Test the executemany fallback, one statement per key set."""
+        db = MagicMock()
+        db.bind.dialect.name = "sqlite"
+        rows = [
+            {"cve_id": "CVE-2024-0001", "title": "One"},
+            {"cve_id": "CVE-2024-0002", "title": "Two", "severity": "HIGH"},
+        ]
+
+        assert bulk_copy(db, Vulnerability, rows) == 2
+
+        assert db.execute.call_count == 2
+        first, second = (call[0][1] for call in db.execute.call_args_list)
+        assert "severity" not in first[0]
+        assert first[0]["exploited_in_the_wild"] is False
+        assert second[0]["severity"] == "HIGH"
+        db.connection.assert_not_called()
@@ -31,6 +31,61 @@ class TestRateLimiting:
         assert "X-RateLimit-Limit-Minute" in response.headers
         assert "X-RateLimit-Limit-Hour" in response.headers
 
+    def test_client_ip_from_forwarded_for(self):
+        """Test that the first X-Forwarded-For hop is used."""
+        from backend.middleware.rate_limit import RateLimiter
+
+        request = Mock(
+            scope={
+                "headers": [
+                    (b"x-real-ip", b"10.0.0.2"),
+                    (b"x-forwarded-for", b" 203.0.113.7 , 10.0.0.1"),
+                ]
+            }
+        )
+
+        assert RateLimiter().get_client_ip(request) == "203.0.113.7"
+
+    def test_client_ip_fallbacks(self):
+        """Test X-Real-IP and direct connection fallbacks."""
+        from backend.middleware.rate_limit import RateLimiter
+
+        limiter = RateLimiter()
+
+        request = Mock(scope={"headers": [(b"x-real-ip", b"10.0.0.2")]})
+        assert limiter.get_client_ip(request) == "10.0.0.2"
+
+        request = Mock(scope={"headers": []})
+        request.client.host = "127.0.0.1"
+        assert limiter.get_client_ip(request) == "127.0.0.1"
+
+    def test_check_rate_limit_per_minute(self):
+        """Test that the per-minute limit is enforced per IP."""
+        from backend.middleware.rate_limit import RateLimiter
+
+        limiter = RateLimiter(requests_per_minute=2, requests_per_hour=10)
+
+        assert limiter.check_rate_limit("10.0.0.1")[0] is True
+        assert limiter.check_rate_limit("10.0.0.1")[0] is True
+        assert limiter.check_rate_limit("10.0.0.1")[0] is False
+        assert limiter.check_rate_limit("10.0.0.2")[0] is True
+
+    def test_clean_old_entries(self):
+        """Test that expired IPs are dropped and the rest keep their counts."""
+        from backend.middleware.rate_limit import NS_PER_HOUR, RateLimiter
+
+        limiter = RateLimiter(requests_per_minute=2, requests_per_hour=10)
+        limiter.check_rate_limit("10.0.0.1")
+        limiter.check_rate_limit("10.0.0.2")
+        limiter.check_rate_limit("10.0.0.2")
+
+        limiter._last_request[limiter._rows["10.0.0.1"]] -= 2 * NS_PER_HOUR
+        limiter._clean_old_entries()
+
+        assert "10.0.0.1" not in limiter._rows
+        assert len(limiter._last_request) == 1
+        assert limiter.check_rate_limit("10.0.0.2")[0] is False
+
 
 @pytest.mark.unit
 class TestLogging:
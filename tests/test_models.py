@@ -5,7 +5,7 @@ Tests for database models.
 import pytest
 from datetime import datetime, timezone
 
-from backend.models import Vulnerability, IngestionRun
+from backend.models import EmailVerification, Vulnerability, IngestionRun
 
 
 @pytest.mark.unit
@@ -123,3 +123,17 @@ class TestIngestionRunModel:
         
         assert run.status == "failed"
         assert run.error_message == "Test error"
+
+
+@pytest.mark.unit
+class TestEmailVerificationModel:
+    """Test EmailVerification helpers."""
+
+    def test_generate_code_is_six_digits(self):
+        """Test that codes are always six digits, including leading zeros."""
+        for _ in range(100):
+            code = EmailVerification.generate_code()
+            assert 0 <= code <= 999999
+            assert len(EmailVerification.format_code(code)) == 6
+
+        assert EmailVerification.format_code(42) == "000042"
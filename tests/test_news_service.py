@@ -0,0 +1,406 @@
+"""
+Tests for news service.
+"""
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, Mock, patch
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from backend.models import NewsArticle
+from backend.services.news_service import NewsService
+
+
+RSS_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>Test Feed</title>
+    <item>
+      <title>First &amp; foremost</title>
+      <link> https://example.com/first </link>
+      <pubDate>Mon, 01 Jan 2024 12:00:00 GMT</pubDate>
+      <description>&lt;p&gt;Patch &lt;b&gt;CVE-2024-1234&lt;/b&gt; now&lt;/p&gt;</description>
+      <author>alice@example.com</author>
+      <category>vulnerability</category>
+      <category>patch</category>
+    </item>
+    <item>
+      <title>Second</title>
+      <link>https://example.com/second</link>
+    </item>
+    <item>
+      <title>Missing link</title>
+    </item>
+  </channel>
+</rss>"""
+
+RSS_1_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns="http://purl.org/rss/1.0/"
+         xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel rdf:about="https://example.com/">
+    <title>Test Feed</title>
+  </channel>
+  <item rdf:about="https://example.com/rdf">
+    <title>RDF item</title>
+    <link>https://example.com/rdf</link>
+    <description>Summary</description>
+    <dc:date>2024-01-02T08:30:00+01:00</dc:date>
+    <dc:creator>Bob</dc:creator>
+  </item>
+</rdf:RDF>"""
+
+ATOM_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Test Feed</title>
+  <entry>
+    <title>Atom entry</title>
+    <link rel="self" href="https://example.com/self"/>
+    <link rel="alternate" href="https://example.com/atom"/>
+    <updated>2024-01-03T00:00:00Z</updated>
+    <published>2024-01-02T00:00:00Z</published>
+    <summary>Atom summary</summary>
+    <author><name>Carol</name></author>
+  </entry>
+</feed>"""
+
+
+def rss_with_items(count):
+    """RSS feed bytes with the given number of items."""
+    items = b"".join(
+        b"<item><title>Item %d</title><link>https://example.com/%d</link></item>"
+        % (i, i)
+        for i in range(count)
+    )
+    return b"<rss><channel>" + items + b"</channel></rss>"
+
+
+def chunked(data, size):
+    """Split feed bytes into fixed-size chunks."""
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def mock_db(stored_urls=(), dialect="sqlite"):
+    """Mock session; stored_urls are reported as already stored."""
+    db = MagicMock()
+    db.bind.dialect.name = dialect
+
+    def query(entity):
+        result = MagicMock()
+        if entity is NewsArticle.url:
+            result.filter.return_value = [(url,) for url in stored_urls]
+        else:
+            result.filter.return_value.count.return_value = 0
+        return result
+
+    db.query.side_effect = query
+    return db
+
+
+def url_lookups(db):
+    """Number of batch URL lookups made on the session."""
+    return sum(1 for call in db.query.call_args_list if call[0][0] is NewsArticle.url)
+
+
+def parsed_articles(*names):
+    """Parsed article dicts with example.com URLs."""
+    return [
+        {"title": name, "url": f"https://example.com/{name}", "summary": ""}
+        for name in names
+    ]
+
+
+@pytest.fixture
+def news_service():
+    """Create news service instance."""
+    return NewsService()
+
+
+@pytest.fixture
+def source():
+    """Mock news source."""
+    source = Mock(id=1, etag=None, last_modified=None)
+    source.name = "Test Source"
+    return source
+
+
+@pytest.mark.unit
+class TestNewsFetchAllSources:
+    """Test fetching all active sources."""
+
+    def test_failed_feed_does_not_abort_run(self, news_service):
+        """Test that an unexpected error in one feed only affects that source."""
+        broken, working = Mock(url="https://example.com/broken"), Mock(
+            url="https://example.com/working"
+        )
+        db = MagicMock()
+        db.query.return_value.filter.return_value.all.return_value = [broken, working]
+
+        def fetch_feed(url, etag, last_modified):
+            response = Mock(status_code=200)
+            if url == broken.url:
+                response.iter_content.side_effect = UnicodeDecodeError(
+                    "utf-8", b"\xff", 0, 1, "invalid start byte"
+                )
+            else:
+                response.iter_content.return_value = [rss_with_items(2)]
+            return response
+
+        stored = {}
+
+        def store_articles(db, source, response, articles, limit):
+            stored[source.url] = (response, articles)
+            return {"fetched": len(articles), "new": len(articles), "errors": 0}
+
+        with patch.object(news_service, "fetch_feed", side_effect=fetch_feed), patch.object(
+            news_service, "store_articles", side_effect=store_articles
+        ):
+            stats = news_service.fetch_all_sources(db)
+
+        # The broken feed is stored as a failed fetch; the other one still runs
+        assert stored[broken.url] == (None, [])
+        assert len(stored[working.url][1]) == 2
+        assert stats["sources_processed"] == 2
+        assert stats["total_new"] == 2
+
+
+@pytest.mark.unit
+class TestNewsFeedParsing:
+    """Test RSS and Atom parsing."""
+
+    def test_parse_atom(self, news_service):
+        """Test Atom entries prefer the alternate link and published date."""
+        (article,) = news_service.parse_rss_feed([ATOM_FEED])
+
+        assert article["title"] == "Atom entry"
+        assert article["url"] == "https://example.com/atom"
+        assert article["summary"] == "Atom summary"
+        assert article["author"] == "Carol"
+        assert article["published_at"] == datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+    def test_parse_rss(self, news_service):
+        """Test RSS items, skipping those without a link."""
+        articles = list(news_service.parse_rss_feed([RSS_FEED]))
+
+        assert [a["url"] for a in articles] == [
+            "https://example.com/first",
+            "https://example.com/second",
+        ]
+        first = articles[0]
+        assert first["title"] == "First & foremost"
+        assert first["summary"] == "Patch CVE-2024-1234 now"
+        assert first["author"] == "alice@example.com"
+        assert first["categories"] == ["vulnerability", "patch"]
+        assert first["published_at"] == datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+        assert articles[1]["published_at"] is None
+        assert articles[1]["categories"] is None
+
+    def test_parse_rss_1_0(self, news_service):
+        """Test namespaced RSS 1.0 items with Dublin Core date and creator."""
+        (article,) = news_service.parse_rss_feed([RSS_1_FEED])
+
+        assert article["title"] == "RDF item"
+        assert article["url"] == "https://example.com/rdf"
+        assert article["author"] == "Bob"
+        assert article["published_at"] == datetime(2024, 1, 2, 7, 30, tzinfo=timezone.utc)
+
+    @pytest.mark.parametrize("size", [1, 7, 64])
+    def test_parse_chunked(self, news_service, size):
+        """Test that items split across small chunks parse the same as whole."""
+        for feed in (RSS_FEED, RSS_1_FEED, ATOM_FEED):
+            whole = list(news_service.parse_rss_feed([feed]))
+            assert list(news_service.parse_rss_feed(chunked(feed, size))) == whole
+
+
+@pytest.mark.unit
+class TestNewsFetchArticles:
+    """Test downloading feeds."""
+
+    @patch("backend.services.news_service.requests.Session.get")
+    def test_fetch_articles_not_modified(self, mock_get, news_service):
+        """Test that a 304 sends the validators and skips parsing."""
+        response = Mock(status_code=304)
+        mock_get.return_value = response
+
+        result, articles = news_service.fetch_articles(
+            "https://example.com/feed", etag='"abc"', last_modified="Mon, 01 Jan 2024"
+        )
+
+        assert result is response
+        assert articles == []
+        response.iter_content.assert_not_called()
+        headers = mock_get.call_args[1]["headers"]
+        assert headers == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon, 01 Jan 2024",
+        }
+
+    def test_fetch_articles_stops_at_limit(self, news_service):
+        """Test that downloading stops once the limit is reached."""
+        feed = rss_with_items(10)
+        chunks = [feed[i:i + 64] for i in range(0, len(feed), 64)]
+        consumed = []
+
+        def iter_content(chunk_size):
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+        response = Mock(status_code=200)
+        response.iter_content.side_effect = iter_content
+
+        with patch.object(news_service, "fetch_feed", return_value=response):
+            result, articles = news_service.fetch_articles(
+                "https://example.com/feed", limit=2
+            )
+
+        assert result is response
+        assert [a["title"] for a in articles] == ["Item 0", "Item 1"]
+        assert len(consumed) < len(chunks)
+        response.close.assert_called_once()
+
+
+@pytest.mark.unit
+class TestNewsStoreArticles:
+    """Test storing parsed feed articles."""
+
+    def test_store_skips_known_and_repeated_urls(self, news_service, source):
+        """Test that stored URLs and repeats within a feed are not re-added."""
+        db = mock_db(stored_urls=["https://example.com/a"])
+        response = Mock(status_code=200, headers={"ETag": '"v2"'})
+
+        stats = news_service.store_articles(
+            db, source, response, parsed_articles("a", "b", "b", "c")
+        )
+
+        assert stats == {"fetched": 4, "new": 2, "errors": 0}
+        added = list(db.add_all.call_args[0][0])
+        assert [a.url for a in added] == ["https://example.com/b", "https://example.com/c"]
+        assert source.etag == '"v2"'
+        assert source.last_fetch_status == "success"
+
+    def test_store_falls_back_per_article(self, news_service, source):
+        """Test that a failed batch insert retries each article on its own."""
+        db = mock_db()
+        db.flush.side_effect = IntegrityError("INSERT", {}, Exception("duplicate"))
+
+        added = []
+
+        def add(article):
+            if article.url.endswith("/dup"):
+                raise IntegrityError("INSERT", {}, Exception("duplicate"))
+            if article.url.endswith("/bad"):
+                raise ValueError("value too long")
+            added.append(article.url)
+
+        db.add.side_effect = add
+        response = Mock(status_code=200, headers={})
+
+        stats = news_service.store_articles(
+            db, source, response, parsed_articles("ok", "dup", "bad")
+        )
+
+        db.rollback.assert_called_once()
+        assert db.begin_nested.call_count == 3
+        assert added == ["https://example.com/ok"]
+        assert stats == {"fetched": 3, "new": 1, "errors": 1}
+
+    def test_store_not_modified(self, news_service, source):
+        """Test that a 304 only updates the source status."""
+        db = mock_db()
+
+        stats = news_service.store_articles(db, source, Mock(status_code=304), [])
+
+        assert stats == {"fetched": 0, "new": 0, "errors": 0}
+        assert source.last_fetch_status == "not_modified"
+        assert source.last_fetch_error is None
+        db.query.assert_not_called()
+        db.add_all.assert_not_called()
+        db.commit.assert_called_once()
+
+    def test_store_remembers_seen_urls(self, news_service, source):
+        """Test that URLs stored once skip the database lookup on the next run."""
+        response = Mock(status_code=200, headers={})
+        articles = parsed_articles("a", "b")
+
+        first_db = mock_db()
+        news_service.store_articles(first_db, source, response, articles)
+        assert url_lookups(first_db) == 1
+
+        # Same feed again: nothing left to look up or insert
+        second_db = mock_db()
+        stats = news_service.store_articles(second_db, source, response, articles)
+        assert url_lookups(second_db) == 0
+        assert stats["new"] == 0
+        assert list(second_db.add_all.call_args[0][0]) == []
+
+        # Only the URL this process has not stored yet is looked up
+        third_db = mock_db()
+        stats = news_service.store_articles(
+            third_db, source, response, parsed_articles("a", "c")
+        )
+        assert url_lookups(third_db) == 1
+        assert [a.url for a in third_db.add_all.call_args[0][0]] == ["https://example.com/c"]
+        assert stats["new"] == 1
+
+    def test_store_remembers_only_stored_urls(self, news_service, source):
+        """Test that URLs whose insert failed are looked up again next run."""
+        db = mock_db()
+        db.flush.side_effect = IntegrityError("INSERT", {}, Exception("duplicate"))
+
+        def add(article):
+            if article.url.endswith("/dup"):
+                raise IntegrityError("INSERT", {}, Exception("duplicate"))
+            if article.url.endswith("/bad"):
+                raise ValueError("value too long")
+
+        db.add.side_effect = add
+        response = Mock(status_code=200, headers={})
+
+        news_service.store_articles(
+            db, source, response, parsed_articles("ok", "dup", "bad")
+        )
+
+        # A duplicate was stored by a concurrent fetch, so it counts as stored
+        assert (1, "https://example.com/ok") in news_service._seen_urls
+        assert (1, "https://example.com/dup") in news_service._seen_urls
+        assert (1, "https://example.com/bad") not in news_service._seen_urls
+
+    def test_store_postgresql_single_insert(self, news_service, source):
+        """Test that PostgreSQL inserts the batch with one ON CONFLICT statement."""
+        db = mock_db(dialect="postgresql")
+        # One of the two URLs was stored concurrently and skipped on conflict
+        db.execute.return_value.all.return_value = [(10,)]
+        response = Mock(status_code=200, headers={})
+
+        stats = news_service.store_articles(
+            db, source, response, parsed_articles("a", "b")
+        )
+
+        assert stats == {"fetched": 2, "new": 1, "errors": 0}
+        db.add_all.assert_not_called()
+        db.execute.assert_called_once()
+        sql = str(db.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("INSERT INTO news_articles")
+        assert "ON CONFLICT (url) DO NOTHING" in sql
+        assert "RETURNING news_articles.id" in sql
+        # Skipped URLs are already stored, so both are remembered
+        assert (1, "https://example.com/a") in news_service._seen_urls
+        assert (1, "https://example.com/b") in news_service._seen_urls
+
+    def test_store_postgresql_falls_back_per_article(self, news_service, source):
+        """Test that a failed batch INSERT is retried one article at a time."""
+        db = mock_db(dialect="postgresql")
+        db.execute.side_effect = ValueError("value too long")
+        response = Mock(status_code=200, headers={})
+
+        stats = news_service.store_articles(
+            db, source, response, parsed_articles("a", "b")
+        )
+
+        db.rollback.assert_called_once()
+        assert [call[0][0].url for call in db.add.call_args_list] == [
+            "https://example.com/a",
+            "https://example.com/b",
+        ]
+        assert stats == {"fetched": 2, "new": 2, "errors": 0}
@@ -0,0 +1,168 @@
+"""
+Tests for notification listener.
+"""
+import asyncio
+import socket
+import threading
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+import pytest
+
+from backend.services import notification_listener as listener_module
+from backend.services.notification_listener import NotificationListener
+
+
+class FakeConnection:
+    """psycopg2 connection stand-in backed by a socket pair the loop can watch."""
+
+    def __init__(self):
+        self.sock, self.peer = socket.socketpair()
+        self.notifies = []
+        self.poll = MagicMock()
+        self.closed = False
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def set_isolation_level(self, level):
+        pass
+
+    def cursor(self):
+        return MagicMock()
+
+    def close(self):
+        self.closed = True
+        self.sock.close()
+        self.peer.close()
+
+
+@pytest.fixture
+def connections():
+    """Patch psycopg2.connect to hand out fake connections, recording the calling thread."""
+    created = []
+    threads = []
+
+    def connect(url):
+        threads.append(threading.get_ident())
+        conn = FakeConnection()
+        created.append(conn)
+        return conn
+
+    with patch.object(listener_module.psycopg2, "connect", side_effect=connect):
+        yield created, threads
+
+    for conn in created:
+        if not conn.closed:
+            conn.close()
+
+
+async def wait_for(condition, timeout=2.0):
+    """Yield to the event loop until condition() holds."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.unit
+class TestNotificationListener:
+    """Test the LISTEN connection lifecycle."""
+
+    def test_start_connects_off_the_event_loop(self, connections):
+        """Test that the blocking connect runs in a worker thread."""
+        created, threads = connections
+        listener = NotificationListener("postgresql://localhost/test")
+
+        async def run():
+            await listener.start()
+            assert listener.active
+            await listener.stop()
+
+        asyncio.run(run())
+
+        assert len(created) == 1
+        assert threads != [threading.get_ident()]
+        assert created[0].closed
+
+    def test_signals_subscribers(self, connections):
+        """Test that a NOTIFY payload signals that user's queues once."""
+        created, _ = connections
+        listener = NotificationListener("postgresql://localhost/test")
+
+        async def run():
+            await listener.start()
+            queue = listener.subscribe(7)
+            other = listener.subscribe(8)
+
+            conn = created[0]
+            conn.notifies.extend([MagicMock(payload="7"), MagicMock(payload="7")])
+            conn.peer.send(b"x")
+            await wait_for(lambda: not queue.empty())
+
+            assert queue.qsize() == 1
+            assert other.empty()
+            await listener.stop()
+
+        asyncio.run(run())
+
+    def test_reconnects_after_connection_loss(self, connections):
+        """Test that a failed poll drops the connection and reopens it with backoff."""
+        created, _ = connections
+        listener = NotificationListener("postgresql://localhost/test")
+
+        async def run():
+            await listener.start()
+            lost = created[0]
+            lost.poll.side_effect = psycopg2.OperationalError("server closed the connection")
+            lost.peer.send(b"x")
+
+            await wait_for(lambda: lost.closed)
+            assert not listener.active
+
+            await wait_for(lambda: listener.active)
+            assert listener._conn is created[1]
+            await listener.stop()
+
+        with patch.object(listener_module, "RECONNECT_MIN_DELAY", 0.01):
+            asyncio.run(run())
+
+        assert len(created) == 2
+
+    def test_start_retries_until_database_is_reachable(self, connections):
+        """Test that a failed first connect keeps retrying in the background."""
+        created, _ = connections
+        listener = NotificationListener("postgresql://localhost/test")
+        connect = listener_module.psycopg2.connect
+        connect.side_effect = [
+            psycopg2.OperationalError("connection refused"),
+            psycopg2.OperationalError("connection refused"),
+            FakeConnection(),
+        ]
+
+        async def run():
+            await listener.start()
+            assert not listener.active
+
+            await wait_for(lambda: listener.active)
+            await listener.stop()
+            assert listener._reconnect_task is None
+
+        with patch.object(listener_module, "RECONNECT_MIN_DELAY", 0.01):
+            asyncio.run(run())
+
+        assert connect.call_count == 3
+
+    def test_non_postgresql_database_is_ignored(self, connections):
+        """Test that other databases never open a LISTEN connection."""
+        created, _ = connections
+        listener = NotificationListener("sqlite:///test.db")
+
+        async def run():
+            await listener.start()
+            assert not listener.active
+            await listener.stop()
+
+        asyncio.run(run())
+
+        assert created == []
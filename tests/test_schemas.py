@@ -36,6 +36,36 @@ class TestVulnerabilitySchemas:
         assert vuln.severity == "HIGH"
         assert vuln.cvss_score == 7.5
     
+    def test_vulnerability_list_from_orm_fast(self):
+        """Test building VulnerabilityList from an ORM row without validation."""
+        from backend.models import Vulnerability
+        
+        # Transient row: no session or database needed
+        row = Vulnerability(
+            cve_id="CVE-2024-TEST",
+            title="Test Vulnerability",
+            description="This is a test vulnerability",
+            severity="HIGH",
+            cvss_score=7.5,
+            exploited_in_the_wild=True,
+            priority_score=0.75,
+            published_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            modified_at=datetime(2024, 1, 2, tzinfo=timezone.utc),
+            sources=["nvd", "cisa_kev"],
+            simple_title="Simple title",
+            simple_description=None,
+            llm_processed=True,
+            upvotes=3,
+            downvotes=1,
+        )
+        
+        vuln = VulnerabilityList.from_orm_fast(row)
+        
+        expected = VulnerabilityList.model_validate(row)
+        assert vuln.model_dump() == expected.model_dump()
+        assert vuln.cve_id == "CVE-2024-TEST"
+        assert vuln.sources == ["nvd", "cisa_kev"]
+    
     def test_vulnerability_detail_schema(self):
         """Test VulnerabilityDetail schema."""
         data = {
@@ -163,3 +193,27 @@ class TestSchemaValidation:
         
         with pytest.raises(ValidationError):
             VulnerabilityList(**data)
+
+
+@pytest.mark.unit
+class TestPasswordStrength:
+    """Test the shared password strength validator."""
+    
+    def test_accepts_non_ascii_letters(self):
+        """Test that non-ASCII upper/lowercase letters count."""
+        from backend.schemas.auth import check_password_strength
+        
+        assert check_password_strength("Äpfelbaum1") == "Äpfelbaum1"
+        assert check_password_strength("STRASSE1ß") == "STRASSE1ß"
+    
+    @pytest.mark.parametrize("password, message", [
+        ("lowercase1", "uppercase"),
+        ("UPPERCASE1", "lowercase"),
+        ("NoDigitsHere", "digit"),
+    ])
+    def test_reports_missing_class(self, password, message):
+        """Test that each missing character class has its own error."""
+        from backend.schemas.auth import check_password_strength
+        
+        with pytest.raises(ValueError, match=message):
+            check_password_strength(password)
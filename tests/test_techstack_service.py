@@ -0,0 +1,150 @@
+"""
+Tests for tech stack service.
+"""
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.api.techstack import list_session_tech_stacks
+from backend.models import TechStack, TechStackMatch, Vulnerability
+from backend.services.techstack_service import TechStackService
+
+
+@pytest.fixture
+def techstack_db():
+    """
+    SQLite session with untyped copies of the tech stack tables.
+
+    The models use PostgreSQL-only column types, so the tables are created
+    from their column names alone; SQLite stores whatever is inserted.
+    """
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    with engine.begin() as conn:
+        for table in (Vulnerability.__table__, TechStack.__table__, TechStackMatch.__table__):
+            columns = ", ".join(f'"{column.name}"' for column in table.columns)
+            conn.exec_driver_sql(f'CREATE TABLE "{table.name}" ({columns})')
+
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def add_tech_stacks(db, stack_count, matches_per_stack):
+    """Insert tech stacks, each matching its own vulnerabilities."""
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc).isoformat()
+    conn = db.connection()
+    vuln_id = 0
+    for stack_id in range(1, stack_count + 1):
+        conn.exec_driver_sql(
+            "INSERT INTO tech_stacks (id, name, session_id, source_type, package_count, "
+            "vulnerable_count, critical_count, high_count, created_at) "
+            "VALUES (?, ?, 'session', 'manual', ?, ?, 0, 0, ?)",
+            (stack_id, f"stack-{stack_id}", matches_per_stack, matches_per_stack, now),
+        )
+        for _ in range(matches_per_stack):
+            vuln_id += 1
+            conn.exec_driver_sql(
+                "INSERT INTO vulnerabilities (id, cve_id, title, severity, cvss_score, "
+                "exploited_in_the_wild) VALUES (?, ?, 'Test', 'HIGH', 7.5, 0)",
+                (vuln_id, f"CVE-2024-{vuln_id:04d}"),
+            )
+            conn.exec_driver_sql(
+                "INSERT INTO tech_stack_matches (id, tech_stack_id, vulnerability_id, "
+                "package_name, ecosystem, match_type, match_confidence) "
+                "VALUES (?, ?, ?, ?, 'npm', 'exact', 1.0)",
+                (vuln_id, stack_id, vuln_id, f"package-{vuln_id}"),
+            )
+    db.commit()
+
+
+def count_statements(db, func):
+    """Run func and return its result with the number of SQL statements sent."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        result = func()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return result, len(statements)
+
+
+@pytest.mark.unit
+class TestTechStackQueries:
+    """Test that tech stack loading does not issue N+1 queries."""
+
+    @pytest.mark.parametrize("stack_count", [1, 5])
+    def test_list_session_tech_stacks_single_query(self, techstack_db, stack_count):
+        """Test that listing stacks uses the stored counts in one statement."""
+        add_tech_stacks(techstack_db, stack_count, matches_per_stack=3)
+
+        summaries, statements = count_statements(
+            techstack_db,
+            lambda: asyncio.run(list_session_tech_stacks("session", techstack_db)),
+        )
+
+        assert statements <= 2
+        assert len(summaries) == stack_count
+        assert all(summary.vulnerable_count == 3 for summary in summaries)
+
+    @pytest.mark.parametrize("match_count", [1, 5])
+    def test_results_query_count_is_constant(self, techstack_db, match_count):
+        """Test that matches and their vulnerabilities load in a fixed number of queries."""
+        add_tech_stacks(techstack_db, 1, matches_per_stack=match_count)
+        techstack_db.expunge_all()
+
+        results, statements = count_statements(
+            techstack_db,
+            lambda: TechStackService().get_tech_stack_results(techstack_db, 1),
+        )
+
+        # Tech stack, matches, and one IN query for all their vulnerabilities
+        assert statements <= 3
+        cve_ids = {
+            v["cve_id"] for pkg in results["packages"] for v in pkg["vulnerabilities"]
+        }
+        assert cve_ids == {f"CVE-2024-{i:04d}" for i in range(1, match_count + 1)}
+
+
+@pytest.mark.unit
+class TestTechStackMatching:
+    """Test the CVE lookup for a package."""
+
+    def test_find_matching_cves_uses_containment(self):
+        """Test that vendors and products use @> and only CPEs use LIKE."""
+        db = MagicMock()
+        query = db.query.return_value
+        query.filter.return_value.order_by.return_value.limit.return_value.all.return_value = []
+
+        TechStackService()._find_matching_cves(
+            db, "expressjs", "express", "express", "4.0.0"
+        )
+
+        (condition,) = query.filter.call_args[0]
+        compiled = condition.compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        assert "vulnerabilities.products @> " in sql
+        assert "vulnerabilities.vendors @> " in sql
+        # Patterns are normalized the way NVD vendor/product names are stored
+        contained = [v for v in compiled.params.values() if isinstance(v, list)]
+        assert sorted(contained) == [["Express"], ["Expressjs"]]
+        assert "CAST(vulnerabilities.products AS TEXT)" not in sql
+        assert "CAST(vulnerabilities.vendors AS TEXT)" not in sql
+        assert "lower(CAST(vulnerabilities.affected_products AS TEXT)) LIKE" in sql